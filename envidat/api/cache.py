@@ -0,0 +1,483 @@
+"""Optional persistent cache for EnviDat API responses."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NoReturn, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from envidat.session import get_session
+from envidat.settings import get_settings
+from envidat.utils import get_url, get_url_response
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "envidat-cache"
+DEFAULT_TTL = 3600
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+_http_cache = None
+
+
+class DiskCache:
+    """Size-bounded store of bytes on disk, evicting least recently used entries.
+
+    Each entry is stored as a body file and a JSON metadata file, named by the
+    SHA-256 hash of the key. The body file modification time records last use.
+
+    Several processes can share a directory, e.g. conversion worker processes.
+    Each process counts only its own writes towards max_size, so the directory
+    can grow beyond max_size until a process evicts entries. Eviction recounts
+    the size of all entries on disk, including those written by other processes.
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> NoReturn:
+        """Init the DiskCache object.
+
+        Args:
+            directory (Union[Path, str]): Directory to store entries in.
+                Created if it does not exist.
+            max_size (int): Maximum total size of stored bodies, in bytes.
+                Defaults to 512 MB.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self.directory.glob("*.body"))
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Get body and metadata file paths for a key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.body", self.directory / f"{digest}.json"
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> NoReturn:
+        """Write a file atomically, so readers never see partial content."""
+        # Unique per process and thread, as processes can share the directory
+        temp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temp_path.write_bytes(data)
+        temp_path.replace(path)
+
+    def get(self, key: str) -> tuple[bytes, dict] | None:
+        """Get an entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            tuple (<bytes: body>, <dict: metadata>): Stored entry.
+            None: If no entry is stored for the key.
+        """
+        body_path, meta_path = self._paths(key)
+        try:
+            metadata = json.loads(meta_path.read_bytes())
+            body = body_path.read_bytes()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        return body, metadata
+
+    def set(self, key: str, body: bytes, metadata: dict) -> NoReturn:
+        """Store an entry, evicting least recently used entries if over max_size.
+
+        Args:
+            key (str): Entry key.
+            body (bytes): Content to store.
+            metadata (dict): JSON serialisable metadata stored with the body.
+        """
+        if len(body) > self.max_size:
+            log.debug(f"Not caching entry larger than cache max_size: {key}")
+            return
+
+        body_path, meta_path = self._paths(key)
+        with self._lock:
+            old_size = body_path.stat().st_size if body_path.exists() else 0
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(dict(metadata, key=key)).encode())
+            self._size += len(body) - old_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def set_metadata(self, key: str, metadata: dict) -> NoReturn:
+        """Replace the metadata of an existing entry, keeping its body."""
+        _, meta_path = self._paths(key)
+        with self._lock:
+            if meta_path.exists():
+                self._write(meta_path, json.dumps(dict(metadata, key=key)).encode())
+
+    def delete(self, key: str) -> NoReturn:
+        """Remove an entry, if it exists."""
+        with self._lock:
+            self._remove(*self._paths(key))
+
+    def clear(self) -> NoReturn:
+        """Remove all entries."""
+        with self._lock:
+            for body_path in self.directory.glob("*.body"):
+                self._remove(body_path, body_path.with_suffix(".json"))
+            self._size = 0
+
+    def _remove(self, body_path: Path, meta_path: Path) -> NoReturn:
+        """Remove entry files and update the total size. Lock must be held."""
+        try:
+            self._size -= body_path.stat().st_size
+            body_path.unlink()
+        except OSError:
+            pass
+        meta_path.unlink(missing_ok=True)
+
+    def _evict(self) -> NoReturn:
+        """Remove least recently used entries until under max_size."""
+        entries = []
+        size = 0
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, body_path))
+            size += stat.st_size
+
+        # Recount from disk, including entries written by other processes
+        self._size = size
+
+        for _, body_path in sorted(entries):
+            if self._size <= self.max_size:
+                break
+            log.debug(f"Evicting cache entry: {body_path.name}")
+            self._remove(body_path, body_path.with_suffix(".json"))
+
+
+class _Flight:
+    """A value being loaded, that concurrent callers wait on."""
+
+    def __init__(self) -> NoReturn:
+        """Init the _Flight object."""
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class MemoryCache:
+    """Thread-safe in-memory cache with TTL, LRU size bound and single-flight loads.
+
+    Concurrent get() calls for the same missing key share one call of the
+    loader, instead of each calling it.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300) -> NoReturn:
+        """Init the MemoryCache object.
+
+        Args:
+            max_entries (int): Maximum number of entries, least recently used
+                entries are evicted above this. Defaults to 1024.
+            ttl (float): Seconds an entry is valid for. Defaults to 300.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared_loads = 0
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Get the value for a key, calling loader once if it is missing or expired.
+
+        Args:
+            key (str): Entry key.
+            loader (Callable): Function without arguments returning the value.
+                Exceptions raised by loader are raised to all waiting callers
+                and nothing is cached.
+
+        Returns:
+            Any: Cached or loaded value.
+        """
+        with self._lock:
+            value = self._get_fresh(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            flight = self._in_flight.get(key)
+            is_loader = flight is None
+            if is_loader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+                self.misses += 1
+            else:
+                self.shared_loads += 1
+
+        if not is_loader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                # Not stored if invalidated while loading
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                    if flight.error is None:
+                        self._set(key, flight.value)
+            flight.done.set()
+
+        return flight.value
+
+    def peek(self, key: str) -> Any:
+        """Get the value for a key if cached and not expired, else None."""
+        with self._lock:
+            return self._get_fresh(key)
+
+    def set(self, key: str, value: Any) -> NoReturn:
+        """Store a value for a key."""
+        with self._lock:
+            self._set(key, value)
+
+    def invalidate(self, key: str) -> NoReturn:
+        """Remove a key, including a value currently being loaded for it."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._in_flight.pop(key, None)
+
+    def clear(self) -> NoReturn:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+            self.hits = self.misses = self.shared_loads = 0
+
+    @property
+    def stats(self) -> dict:
+        """Cache counters for monitoring.
+
+        Returns:
+            dict: With keys "hits", "misses" (loader calls), "shared_loads"
+                (callers that waited on another caller's load) and "size".
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared_loads": self.shared_loads,
+                "size": len(self._entries),
+            }
+
+    def _get_fresh(self, key: str) -> Any:
+        """Get an unexpired value and mark it recently used. Lock must be held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any) -> NoReturn:
+        """Store a value and evict over max_entries. Lock must be held."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class HTTPCache:
+    """Class to cache API GET responses on disk, with conditional revalidation.
+
+    Responses younger than the TTL are returned without a request. Older
+    responses are revalidated with If-None-Match / If-Modified-Since headers,
+    so an unchanged response costs a 304 instead of the full body.
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str] = DEFAULT_CACHE_DIR / "http",
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> NoReturn:
+        """Init the HTTPCache object.
+
+        Args:
+            directory (Union[Path, str]): Directory to store responses in.
+                Defaults to "envidat-cache/http" in the system temporary directory.
+            ttl (float): Seconds a response is used without revalidation.
+                Defaults to 3600.
+            max_size (int): Maximum total size of stored responses, in bytes.
+                Defaults to 512 MB.
+        """
+        self.store = DiskCache(directory, max_size=max_size)
+        self.ttl = ttl
+
+    @staticmethod
+    def _cached_response(url: str, body: bytes, metadata: dict) -> requests.Response:
+        """Build a response object from a cache entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(metadata.get("headers", {}))
+        response.encoding = metadata.get("encoding")
+        response._content = body
+        response.from_cache = True
+        return response
+
+    def get_url_response(self, url: str) -> requests.Response | None:
+        """Get a URL from the cache, revalidating or fetching as required.
+
+        Only responses with status code 200 are stored.
+
+        Args:
+            url (str): The URL to GET.
+
+        Returns:
+            requests.Response: Cached or new response, with any status code.
+            None: If the request failed.
+        """
+        entry = self.store.get(url)
+        headers = {}
+
+        if entry:
+            body, metadata = entry
+            if time.time() - metadata.get("stored_at", 0) < self.ttl:
+                log.debug(f"HTTP cache hit: {url}")
+                return self._cached_response(url, body, metadata)
+
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            log.debug(f"Attempting to get {url}")
+            r = get_session().get(url, headers=headers)
+        except requests.exceptions.RequestException as e:
+            log.error(f"Request error on get: {url}")
+            log.error(e)
+            return None
+
+        if r.status_code == 304 and entry:
+            log.debug(f"HTTP cache revalidated: {url}")
+            metadata["stored_at"] = time.time()
+            self.store.set_metadata(url, metadata)
+            return self._cached_response(url, body, metadata)
+
+        if r.status_code == 200:
+            self.store.set(
+                url,
+                r.content,
+                {
+                    "stored_at": time.time(),
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                    "encoding": r.encoding,
+                    "headers": {"Content-Type": r.headers.get("Content-Type", "")},
+                },
+            )
+        return r
+
+    def get_url(self, url: str) -> requests.Response | None:
+        """Get a URL from the cache, returning None for error status codes.
+
+        Return values are the same as for envidat.utils.get_url.
+
+        Args:
+            url (str): The URL to GET.
+
+        Returns:
+            requests.Response: Response with status code 200.
+            None: If the request failed or returned an error status.
+        """
+        r = self.get_url_response(url)
+        if r is not None and not r.ok:
+            log.error(f"HTTP response error on get: {url}, status {r.status_code}")
+            return None
+        return r
+
+    def clear(self) -> NoReturn:
+        """Remove all cached responses."""
+        self.store.clear()
+
+
+def enable_http_cache(
+    directory: Union[Path, str] = None,
+    ttl: float = DEFAULT_TTL,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> HTTPCache:
+    """Cache API responses for package_show, package_list and package lists.
+
+    Args:
+        directory (Union[Path, str]): Directory to store responses in.
+            Attempts to get from environment variable HTTP_CACHE_DIR if omitted,
+            else "envidat-cache/http" in the system temporary directory.
+        ttl (float): Seconds a response is used without revalidation.
+            Defaults to 3600.
+        max_size (int): Maximum total size of stored responses, in bytes.
+            Defaults to 512 MB.
+
+    Returns:
+        HTTPCache: The enabled cache.
+    """
+    global _http_cache
+
+    if directory is None:
+        directory = get_settings().http_cache_dir or DEFAULT_CACHE_DIR / "http"
+
+    log.info(f"Enabling HTTP cache in {directory}, with TTL {ttl} seconds.")
+    _http_cache = HTTPCache(directory, ttl=ttl, max_size=max_size)
+    return _http_cache
+
+
+def disable_http_cache() -> NoReturn:
+    """Stop caching API responses. Stored responses are kept on disk."""
+    global _http_cache
+    _http_cache = None
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Get the enabled HTTP cache, or None if caching is disabled."""
+    return _http_cache
+
+
+def cached_get_url(url: str) -> requests.Response | None:
+    """Get a URL through the HTTP cache if enabled, else without caching.
+
+    Return values are the same as for envidat.utils.get_url.
+    """
+    if _http_cache is None:
+        return get_url(url)
+    return _http_cache.get_url(url)
+
+
+def cached_get_url_response(url: str) -> requests.Response | None:
+    """Get a URL response through the HTTP cache if enabled, else without caching.
+
+    Return values are the same as for envidat.utils.get_url_response.
+    """
+    if _http_cache is None:
+        return get_url_response(url)
+    return _http_cache.get_url_response(url)
@@ -0,0 +1,326 @@
+"""Local point-in-time snapshot of the EnviDat catalogue."""
+
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NoReturn, Union
+
+from envidat.api.v1 import (
+    get_metadata_list,
+    get_metadata_list_with_resources,
+    invalidate_package,
+    iter_metadata_with_resources,
+    iter_package_search,
+)
+
+log = logging.getLogger(__name__)
+
+INDEX_FIELDS = ("name", "id", "doi")
+
+
+def _normalise_doi(doi: str) -> str:
+    """DOIs are case insensitive, index them in lower case."""
+    return doi.strip().lower()
+
+
+class CatalogueSnapshot:
+    """Catalogue packages stored as JSON Lines, with an index by name, id and DOI.
+
+    The index file stores the byte offset of each line, so a package is read
+    with a single seek, without loading the whole catalogue.
+
+    Usage:
+        snapshot = CatalogueSnapshot.from_api("catalogue.jsonl")
+        package = snapshot.get("10.16904/envidat.228")
+
+    Note:
+        To keep a snapshot up to date, write and update it with CatalogueSync.
+    """
+
+    def __init__(self, path: Union[Path, str]) -> NoReturn:
+        """Init the CatalogueSnapshot object, for an existing snapshot.
+
+        Args:
+            path (Union[Path, str]): Path of the JSON Lines file. The index is
+                read from the same path with suffix ".index.json" appended.
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(f"{self.path.name}.index.json")
+        self._index = None
+
+    @classmethod
+    def write(
+        cls, path: Union[Path, str], packages: Iterable[dict]
+    ) -> "CatalogueSnapshot":
+        """Write packages to a new snapshot, replacing any existing one.
+
+        Args:
+            path (Union[Path, str]): Path of the JSON Lines file to write.
+            packages (Iterable[dict]): Packages, with nested resources.
+
+        Returns:
+            CatalogueSnapshot: The written snapshot.
+        """
+        snapshot = cls(path)
+        snapshot.path.parent.mkdir(parents=True, exist_ok=True)
+
+        offsets = [0]
+        keys = {field: {} for field in INDEX_FIELDS}
+        high_water_mark = ""
+        temp_path = snapshot.path.with_name(f"{snapshot.path.name}.tmp")
+
+        with open(temp_path, "wb") as f:
+            for position, package in enumerate(packages):
+                line = json.dumps(package, ensure_ascii=False).encode("utf-8") + b"\n"
+                f.write(line)
+                offsets.append(offsets[-1] + len(line))
+
+                for field in INDEX_FIELDS:
+                    value = package.get(field)
+                    if not value:
+                        continue
+                    if field == "doi":
+                        value = _normalise_doi(value)
+                    keys[field][value] = position
+
+                modified = package.get("metadata_modified") or ""
+                if modified > high_water_mark:
+                    high_water_mark = modified
+
+        index = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "size": offsets[-1],
+            "high_water_mark": high_water_mark or None,
+            "offsets": offsets,
+            **keys,
+        }
+        index_temp_path = snapshot.index_path.with_name(
+            f"{snapshot.index_path.name}.tmp"
+        )
+        index_temp_path.write_text(json.dumps(index, separators=(",", ":")))
+
+        temp_path.replace(snapshot.path)
+        index_temp_path.replace(snapshot.index_path)
+
+        log.info(f"Wrote catalogue snapshot of {len(offsets) - 1} packages: {path}")
+        snapshot._index = index
+        return snapshot
+
+    @classmethod
+    def from_api(cls, path: Union[Path, str]) -> "CatalogueSnapshot":
+        """Write a snapshot of all current packages from the API.
+
+        Args:
+            path (Union[Path, str]): Path of the JSON Lines file to write.
+
+        Returns:
+            CatalogueSnapshot: The written snapshot.
+        """
+        return cls.write(path, get_metadata_list_with_resources(sort_result=True))
+
+    @property
+    def index(self) -> dict:
+        """Index of the snapshot, read from disk on first use."""
+        if self._index is None:
+            index = json.loads(self.index_path.read_text())
+            if index["size"] != self.path.stat().st_size:
+                raise ValueError(f"Snapshot index does not match data: {self.path}")
+            self._index = index
+        return self._index
+
+    @property
+    def created(self) -> str:
+        """ISO timestamp of when the snapshot was written."""
+        return self.index["created"]
+
+    @property
+    def high_water_mark(self) -> str | None:
+        """Latest "metadata_modified" of the packages, None if there are none."""
+        if "high_water_mark" not in self.index:
+            # Snapshot index written without it
+            modified = (package.get("metadata_modified") or "" for package in self)
+            self.index["high_water_mark"] = max(modified, default="") or None
+        return self.index["high_water_mark"]
+
+    def _position(self, key: str, field: str | None = None) -> int | None:
+        """Get line number of a package by field value, or by any field if None."""
+        fields = INDEX_FIELDS if field is None else (field,)
+        for index_field in fields:
+            value = _normalise_doi(key) if index_field == "doi" else key
+            position = self.index[index_field].get(value)
+            if position is not None:
+                return position
+        return None
+
+    def _read(self, position: int) -> dict:
+        """Read the package at a line number."""
+        offsets = self.index["offsets"]
+        with open(self.path, "rb") as f:
+            f.seek(offsets[position])
+            return json.loads(f.read(offsets[position + 1] - offsets[position]))
+
+    def get(self, key: str, field: str | None = None) -> dict | None:
+        """Get a package by name, id or DOI.
+
+        Args:
+            key (str): Package name, id or DOI.
+            field (str): Only match on this field, one of "name", "id", "doi".
+                Defaults to None, matching on any of them.
+
+        Returns:
+            dict: Package, with nested resources.
+            None: If not found in the snapshot.
+        """
+        position = self._position(key, field)
+        if position is None:
+            return None
+        return self._read(position)
+
+    def __getitem__(self, key: str) -> dict:
+        """Get a package by name, id or DOI, raising KeyError if not found."""
+        package = self.get(key)
+        if package is None:
+            raise KeyError(key)
+        return package
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a package name, id or DOI is in the snapshot."""
+        return self._position(key) is not None
+
+    def __len__(self) -> int:
+        """Number of packages in the snapshot."""
+        return len(self.index["offsets"]) - 1
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over all packages, in the order they were written."""
+        with open(self.path, "rb") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def names(self) -> list[str]:
+        """Get names of all packages in the snapshot."""
+        return list(self.index["name"])
+
+
+class CatalogueSync:
+    """Class to keep a local snapshot of all EnviDat packages up to date.
+
+    The first sync downloads the full catalogue. Later syncs only request the
+    packages with a "metadata_modified" value since the last sync (the high-water
+    mark), plus the package name list to detect deleted packages.
+
+    Packages are stored as a CatalogueSnapshot, so a synced catalogue can be
+    read with CatalogueSnapshot, SnapshotSource or Record.from_snapshot.
+
+    Usage:
+        sync = CatalogueSync("catalogue.jsonl")
+        sync.sync()
+        record = Record.from_snapshot(sync.snapshot, "mountland-jura")
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Union[Path, str],
+        host: str = "https://www.envidat.ch",
+    ) -> NoReturn:
+        """Init the CatalogueSync object, loading the snapshot if it exists.
+
+        Args:
+            snapshot_path (Union[Path, str]): JSON Lines file the snapshot is
+                stored in, see CatalogueSnapshot.
+            host (str): API host url. Attempts to get from environment if omitted.
+                Defaults to https://www.envidat.ch
+        """
+        self.snapshot = CatalogueSnapshot(snapshot_path)
+        self.host = host
+        self.high_water_mark = None
+        self.packages = {}
+
+        if self.snapshot.path.is_file() and self.snapshot.index_path.is_file():
+            self.load()
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Path of the snapshot JSON Lines file."""
+        return self.snapshot.path
+
+    def load(self) -> NoReturn:
+        """Load packages and high-water mark from the snapshot."""
+        log.debug(f"Loading catalogue snapshot from {self.snapshot_path}")
+        self.high_water_mark = self.snapshot.high_water_mark
+        self.packages = {package["name"]: package for package in self.snapshot}
+
+    def save(self) -> NoReturn:
+        """Write packages to the snapshot, replacing the previous snapshot."""
+        log.debug(f"Saving catalogue snapshot to {self.snapshot_path}")
+        self.snapshot = CatalogueSnapshot.write(
+            self.snapshot_path, self.packages.values()
+        )
+
+    def sync(self, save: bool = True) -> dict:
+        """Update the snapshot with changes from API since the last sync.
+
+        Args:
+            save (bool): Write the snapshot file after syncing. Defaults to True.
+
+        Returns:
+            dict: Names of packages that changed, with keys:
+                "updated" (list[str]): Packages added or modified.
+                "deleted" (list[str]): Packages removed from the catalogue,
+                    including previous names of renamed packages.
+        """
+        if self.high_water_mark:
+            # Solr date range, inclusive, so packages modified within the same
+            # second as the high-water mark are fetched again
+            since = self.high_water_mark[:19] + "Z"
+            log.info(f"Syncing packages modified since {since}")
+            changed = iter_package_search(
+                fq=f"metadata_modified:[{since} TO *]", host=self.host
+            )
+        else:
+            log.info("No high-water mark, syncing full catalogue")
+            changed = iter_metadata_with_resources(host=self.host)
+
+        names_by_id = {
+            package.get("id"): name for name, package in self.packages.items()
+        }
+        updated = []
+        deleted = []
+
+        for package in changed:
+            name = package["name"]
+            # Remove previous entry of renamed package
+            old_name = names_by_id.get(package.get("id"))
+            if old_name and old_name != name:
+                self.packages.pop(old_name, None)
+                deleted.append(old_name)
+
+            # Packages modified while syncing are returned again, at the end
+            if self.packages.get(name) != package and name not in updated:
+                updated.append(name)
+            self.packages[name] = package
+
+            modified = package.get("metadata_modified", "")
+            if not self.high_water_mark or modified > self.high_water_mark:
+                self.high_water_mark = modified
+
+        # Deleted or private packages no longer appear in the package list,
+        # not using the HTTP cache, as a cached list may be out of date
+        current_names = set(get_metadata_list(host=self.host, use_cache=False))
+        for name in list(self.packages):
+            if name not in current_names:
+                self.packages.pop(name)
+                deleted.append(name)
+
+        # Drop changed packages from the in-process package cache
+        for name in updated + deleted:
+            invalidate_package(name)
+
+        log.info(f"Synced catalogue: {len(updated)} updated, {len(deleted)} deleted.")
+
+        if save:
+            self.save()
+
+        return {"updated": updated, "deleted": deleted}
@@ -0,0 +1,153 @@
+"""Sources of packages for creating Records by name, from the API or locally."""
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import NoReturn, Union
+
+from envidat.api.snapshot import CatalogueSnapshot
+from envidat.api.v1 import get_package, iter_metadata_with_resources
+
+log = logging.getLogger(__name__)
+
+_record_source = None
+
+
+class RecordSource(ABC):
+    """Base class of package sources, looking up packages by name or id.
+
+    Subclasses must implement _load, getting one package, and _iter_all,
+    iterating over all packages. After warm_up, packages are found in memory, falling
+    back to _load for packages not loaded.
+    """
+
+    def __init__(self) -> NoReturn:
+        """Init the RecordSource object."""
+        self._packages = None
+
+    @abstractmethod
+    def _load(self, key: str) -> dict | None:
+        """Get one package by name or id, None if not found."""
+
+    @abstractmethod
+    def _iter_all(self) -> Iterator[dict]:
+        """Iterate over all packages."""
+
+    def _index(self, packages: Iterable[dict]) -> int:
+        """Store packages in memory by name and id, returning the number stored."""
+        index = {}
+        count = 0
+        for package in packages:
+            for key in (package.get("name"), package.get("id")):
+                if key:
+                    index[key] = package
+            count += 1
+        self._packages = index
+        return count
+
+    def warm_up(self) -> int:
+        """Load all packages into memory, so later lookups are local.
+
+        Returns:
+            int: Number of packages loaded.
+        """
+        count = self._index(self._iter_all())
+        log.info(f"Loaded {count} packages from {type(self).__name__}.")
+        return count
+
+    def get(self, key: str) -> dict | None:
+        """Get a package by name or id.
+
+        Args:
+            key (str): Package name or id.
+
+        Returns:
+            dict: Package, with nested resources.
+            None: If not found.
+        """
+        if self._packages is not None:
+            package = self._packages.get(key)
+            if package is not None:
+                return package
+        return self._load(key)
+
+
+class APISource(RecordSource):
+    """Packages from the EnviDat API, one request per package until warmed up."""
+
+    def _load(self, key: str) -> dict | None:
+        """Get one package from the API."""
+        return get_package(key)
+
+    def _iter_all(self) -> Iterator[dict]:
+        """Iterate over all current packages from the API, one page at a time."""
+        return iter_metadata_with_resources()
+
+
+class SnapshotSource(RecordSource):
+    """Packages from a local catalogue snapshot, see CatalogueSnapshot."""
+
+    def __init__(self, snapshot: Union[CatalogueSnapshot, Path, str]) -> NoReturn:
+        """Init the SnapshotSource object.
+
+        Args:
+            snapshot (Union[CatalogueSnapshot, Path, str]): Snapshot, or path
+                of the snapshot JSON Lines file.
+        """
+        super().__init__()
+        if not isinstance(snapshot, CatalogueSnapshot):
+            snapshot = CatalogueSnapshot(snapshot)
+        self.snapshot = snapshot
+
+    def _load(self, key: str) -> dict | None:
+        """Read one package from the snapshot, by name, id or DOI."""
+        return self.snapshot.get(key)
+
+    def _iter_all(self) -> Iterator[dict]:
+        """Iterate over all packages in the snapshot."""
+        return iter(self.snapshot)
+
+
+class DictSource(RecordSource):
+    """Packages held in memory, for example in tests."""
+
+    def __init__(self, packages: Union[Mapping[str, dict], Iterable[dict]]) -> NoReturn:
+        """Init the DictSource object.
+
+        Args:
+            packages (Union[Mapping[str, dict], Iterable[dict]]): Packages,
+                as a list, or a dictionary with package names as keys.
+        """
+        super().__init__()
+        if isinstance(packages, Mapping):
+            packages = packages.values()
+        self.packages = list(packages)
+        self._index(self.packages)
+
+    def _load(self, key: str) -> dict | None:
+        """All packages are in memory, so a missing package is not found."""
+        return None
+
+    def _iter_all(self) -> Iterator[dict]:
+        """Iterate over the packages in memory."""
+        return iter(self.packages)
+
+
+def set_record_source(source: RecordSource | None) -> NoReturn:
+    """Set the default source of packages for Records created by name.
+
+    Args:
+        source (RecordSource): Source, for example a warmed up SnapshotSource.
+            None restores the default, the EnviDat API.
+    """
+    global _record_source
+    _record_source = source
+
+
+def get_record_source() -> RecordSource:
+    """Get the default source of packages for Records created by name."""
+    global _record_source
+    if _record_source is None:
+        _record_source = APISource()
+    return _record_source
@@ -4,18 +4,28 @@
 # TODO test functions to make sure they can read environment variables
 
 import logging
-import os
+import urllib.parse
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import NoReturn
 
-from envidat.utils import get_url, get_url_response, load_dotenv_if_in_debug_mode
+from envidat.api.cache import MemoryCache, cached_get_url, cached_get_url_response
+from envidat.settings import get_settings
+from envidat.utils import get_url, get_url_response, iter_json_array
 
 log = logging.getLogger(__name__)
 
-# Load config from environment variables
-load_dotenv_if_in_debug_mode()
+# Package fields indexed as dates by Solr, see iter_package_search()
+SOLR_DATE_FIELDS = frozenset(("metadata_created", "metadata_modified"))
+
+# In-process cache of packages used by get_package_cached()
+package_cache = MemoryCache(max_entries=2048, ttl=300)
 
 
 def get_metadata_list(
-    host: str = "https://www.envidat.ch", sort_result: bool = None
+    host: str = "https://www.envidat.ch",
+    sort_result: bool = None,
+    use_cache: bool = True,
 ) -> list:
     """Get package/metadata list from API.
 
@@ -26,17 +36,22 @@ def get_metadata_list(
             Defaults to https://www.envidat.ch.
         sort_result (bool): Sort result alphabetically by metadata name.
             Default to None.
+        use_cache (bool): Get the list through the HTTP cache, if enabled.
+            Set to False to always get the current list from API.
+            Defaults to True.
 
     Returns:
         list: List of JSON formatted packages.
     """
-    if "API_HOST" in os.environ:
+    settings = get_settings()
+    if settings.api_host:
         log.debug("Getting API host from environment variable.")
-        host = os.getenv("API_HOST")
+        host = settings.api_host
 
     log.info(f"Getting package list from {host}.")
+    get = cached_get_url if use_cache else get_url
     try:
-        package_names = get_url(f"{host}/api/3/action/package_list").json()
+        package_names = get(f"{host}/api/3/action/package_list").json()
     except AttributeError as e:
         log.error(e)
         log.error("Getting package names from API failed.")
@@ -68,11 +83,9 @@ def get_protocol_and_domain(
     Returns:
         tuple (<str: protocol>, <str: domain>): Protocol and domain from API host.
     """
-    if "API_HOST" in os.environ:
-        host = os.getenv("API_HOST")
-        protocol = host.partition("://")[0]
-        domain = host.partition("://")[2]
-        return protocol, domain
+    settings = get_settings()
+    if settings.api_host:
+        return settings.api_protocol, settings.api_domain
 
     return protocol, domain
 
@@ -94,15 +107,16 @@ def get_package(
     Returns:
         dict: Dictionary of package (metadata entry).
     """
-    if "API_HOST" in os.environ and "API_PACKAGE_SHOW" in os.environ:
+    settings = get_settings()
+    if settings.api_host and settings.api_package_show:
         log.debug("Getting API host and path from environment variables.")
-        host = os.getenv("API_HOST")
-        path = os.getenv("API_PACKAGE_SHOW")
+        host = settings.api_host
+        path = settings.api_package_show
 
     log.info(f"Getting package from {host}.")
     try:
         # Extract result dictionary from API call
-        json_data = get_url(f"{host}{path}{package_name}").json()
+        json_data = cached_get_url(f"{host}{path}{package_name}").json()
         package = json_data["result"]
     except AttributeError as e:
         log.error(e)
@@ -112,6 +126,55 @@ def get_package(
     return package
 
 
+def get_package_cached(package_name: str) -> dict:
+    """Get individual package (metadata entry) from the in-process package cache.
+
+    Packages are fetched with get_package() on a miss and cached under both their
+    'name' and 'id'. Concurrent calls for the same missing package share one API
+    request. Cache size and TTL are set on package_cache.
+
+    Note:
+        The returned dictionary is shared between callers and should not be
+        modified, copy it first if required.
+
+    Args:
+        package_name (str): API package 'name' or 'id' value.
+
+    Returns:
+        dict: Dictionary of package (metadata entry).
+    """
+    package = package_cache.get(package_name, lambda: get_package(package_name))
+
+    # Also cache under the other identifier, so either finds the package
+    for key in (package.get("name"), package.get("id")):
+        if key and key != package_name:
+            package_cache.set(key, package)
+
+    return package
+
+
+def invalidate_package(package_name: str) -> NoReturn:
+    """Remove a package from the in-process package cache, by 'name' or 'id'.
+
+    Args:
+        package_name (str): API package 'name' or 'id' value.
+    """
+    package = package_cache.peek(package_name)
+    package_cache.invalidate(package_name)
+    if package:
+        package_cache.invalidate(package.get("name"))
+        package_cache.invalidate(package.get("id"))
+
+
+def get_package_cache_stats() -> dict:
+    """Get hit and miss counters of the in-process package cache.
+
+    Returns:
+        dict: With keys "hits", "misses", "shared_loads" and "size".
+    """
+    return package_cache.stats
+
+
 # TODO refactor this or get_package() as they have similar functionality,
 #  check usage of functions in project
 def get_envidat_record(
@@ -136,22 +199,19 @@ def get_envidat_record(
         dict: Dictionary of package (metadata entry).
     """
     # Extract environment variables from config needed to call CKAN
-    # If environment variables cannot be extracted then use default values
+    # If environment variables are not set then use default values
     # for host and path
-    try:
-        host = os.environ("API_HOST")
-        path = os.environ("API_PACKAGE_SHOW")
-    except KeyError as e:
-        log.error(f"KeyError: {e} does not exist in environment vars")
-    except AttributeError as e:
-        log.error(e)
+    settings = get_settings()
+    if settings.api_host and settings.api_package_show:
+        host = settings.api_host
+        path = settings.api_package_show
 
     try:
         # Extract result dictionary from API call, pass cookie if is truthy
         if cookie:
             response = get_url_response(f"{host}{path}{package_name}", cookie=cookie)
         else:
-            response = get_url_response(f"{host}{path}{package_name}")
+            response = cached_get_url_response(f"{host}{path}{package_name}")
 
         # TODO improve error handling
         # Handle HTTPError from API call
@@ -174,6 +234,61 @@ def get_envidat_record(
         }
 
 
+def get_packages(
+    package_names: list[str],
+    max_workers: int = 8,
+    host: str = "https://www.envidat.ch",
+    path: str = "/api/action/package_show?id=",
+    cookie: str | None = None,
+) -> dict[str, dict]:
+    """Get many EnviDat records (metadata entries) concurrently from API.
+
+    Each record is requested as in get_envidat_record(), with at most max_workers
+    requests in flight at once over the shared pooled session.
+
+    Args:
+        package_names (list[str]): API package 'name' or 'id' values.
+        max_workers (int): Maximum number of concurrent requests. Defaults to 8.
+        host (str): API host url. Attempts to get from environment if omitted.
+            Defaults to "https://www.envidat.ch"
+        path (str): API host path. Attempts to get from environment if omitted.
+            Defaults to "api/action/package_show?id="
+        cookie (str | None): Cookie passed to API call in header,
+                             default value is None as this argument is not
+                             always used
+
+    Returns:
+        dict: Package names as keys, in input order, with values of dictionaries
+            with "status_code" and "result" keys as returned by get_envidat_record().
+            "result" contains the package, or the error if the request failed.
+    """
+    package_names = list(dict.fromkeys(package_names))
+    log.info(
+        f"Getting {len(package_names)} packages from API "
+        f"with {max_workers} concurrent requests."
+    )
+
+    def get_one(package_name: str) -> dict:
+        """Get one record, returning errors instead of raising."""
+        try:
+            record = get_envidat_record(
+                package_name, host=host, path=path, cookie=cookie
+            )
+        except Exception as e:
+            log.error(f"Failed to get package '{package_name}': {e}")
+            return {"status_code": 500, "result": str(e)}
+        if record is None:
+            return {
+                "status_code": 500,
+                "result": "Failed to extract package as JSON from API, check logs",
+            }
+        return record
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(get_one, package_names)
+        return dict(zip(package_names, results, strict=True))
+
+
 def get_metadata_json_with_resources(
     host: str = "https://www.envidat.ch",
     path: str = "/api/3/action/current_package_list_with_resources?limit=100000",
@@ -193,17 +308,15 @@ def get_metadata_json_with_resources(
     Returns:
         dict:  Dictionary of packages, with nested resources.
     """
-    if (
-        "API_HOST" in os.environ
-        and "API_PATH_CURRENT_PACKAGE_LIST_WITH_RESOURCES" in os.environ
-    ):
+    settings = get_settings()
+    if settings.api_host and settings.api_current_package_list_with_resources:
         log.debug("Getting API host and path from environment variables.")
-        host = os.getenv("API_HOST")
-        path = os.getenv("API_PATH_CURRENT_PACKAGE_LIST_WITH_RESOURCES")
+        host = settings.api_host
+        path = settings.api_current_package_list_with_resources
 
     log.info(f"Getting package list with resources from {host}.")
     try:
-        package_names_with_resources = get_url(f"{host}{path}").json()
+        package_names_with_resources = cached_get_url(f"{host}{path}").json()
     except AttributeError as e:
         log.error(e)
         log.error("Getting package names with resources from API failed.")
@@ -212,6 +325,44 @@ def get_metadata_json_with_resources(
     return package_names_with_resources
 
 
+def stream_metadata_with_resources(
+    host: str = "https://www.envidat.ch",
+    path: str = "/api/3/action/current_package_list_with_resources?limit=100000",
+    chunk_size: int = 65536,
+) -> Iterator[dict]:
+    """Stream all current packages/metadata with associated resources from API.
+
+    The response is decoded incrementally, yielding one package at a time, so
+    neither the full response body nor all decoded packages are held in memory.
+
+    Args:
+        host (str): API host url. Attempts to get from environment if omitted.
+            Defaults to https://www.envidat.ch
+        path (str): API host path. Attempts to get from environment if omitted.
+            Defaults to /api/3/action/current_package_list_with_resources?limit=100000
+        chunk_size (int): Number of bytes read from the response at a time.
+
+    Yields:
+        dict: Package, with nested resources.
+    """
+    settings = get_settings()
+    if settings.api_host and settings.api_current_package_list_with_resources:
+        log.debug("Getting API host and path from environment variables.")
+        host = settings.api_host
+        path = settings.api_current_package_list_with_resources
+
+    log.info(f"Streaming package list with resources from {host}.")
+    response = get_url(f"{host}{path}", stream=True)
+    if response is None:
+        log.error("Getting package names with resources from API failed.")
+        raise AttributeError("Failed to extract package names as JSON.")
+
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size), key="result")
+    finally:
+        response.close()
+
+
 def get_metadata_list_with_resources(sort_result: bool = None) -> list:
     """Get all current package/metadata as list of results with associated resources.
 
@@ -243,6 +394,73 @@ def get_metadata_list_with_resources(sort_result: bool = None) -> list:
     return package_names_with_resources
 
 
+def iter_metadata_with_resources(
+    page_size: int = 100,
+    host: str = "https://www.envidat.ch",
+    path: str = "/api/3/action/package_search",
+) -> Iterator[dict]:
+    """Iterate over all current packages/metadata with associated resources from API.
+
+    Pages through package search in package id order, each page requesting the
+    packages with ids after the last id of the previous page. Unlike offsets,
+    this does not skip packages modified while iterating, as the order does not
+    depend on "metadata_modified". Pages are always requested from the API,
+    bypassing the HTTP cache, so all pages are equally recent.
+    The next page is requested in the background while the current one is consumed.
+
+    Args:
+        page_size (int): Number of packages requested per API call
+            (CKAN max 1000). Defaults to 100.
+        host (str): API host url. Attempts to get from environment if omitted.
+            Defaults to https://www.envidat.ch
+        path (str): API host path for package search.
+            Defaults to /api/3/action/package_search
+
+    Yields:
+        dict: Package, with nested resources.
+    """
+    settings = get_settings()
+    if settings.api_host:
+        log.debug("Getting API host from environment variable.")
+        host = settings.api_host
+
+    def get_page(after_id: str | None) -> list:
+        """Get a single page of packages from API, with ids after after_id."""
+        query = {"q": "*:*", "sort": "id asc", "rows": page_size}
+        if after_id:
+            query["fq"] = f'id:{{"{after_id}" TO *]'
+        url = f"{host}{path}?{urllib.parse.urlencode(query)}"
+        try:
+            return list(get_url(url).json()["result"]["results"])
+        except AttributeError as e:
+            log.error(e)
+            log.error(f"Getting package page from API failed: {url}")
+            raise AttributeError("Failed to extract package page as JSON.") from e
+
+    log.info(f"Iterating package list with resources from {host}.")
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        count = 0
+        next_page = executor.submit(get_page, None)
+
+        while next_page is not None:
+            page = next_page.result()
+
+            # Prefetch the next page, a short page means the end of the list
+            if len(page) >= page_size:
+                next_page = executor.submit(get_page, page[-1]["id"])
+            else:
+                next_page = None
+
+            count += len(page)
+            yield from page
+
+        log.info(f"Returned {count} metadata entries from API.")
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def get_metadata_name_doi() -> dict:
     """Get all current package/metadata names and DOIs as a dictionary.
 
@@ -254,5 +472,135 @@ def get_metadata_name_doi() -> dict:
         dict: Dictionary of package information with names as keys
         and associated DOIs as values.
     """
-    all_packages = get_metadata_list_with_resources()
-    return {package.get("name"): package.get("doi", "") for package in all_packages}
+    packages = iter_package_fields(("name", "doi"))
+    return {package["name"]: package["doi"] or "" for package in packages}
+
+
+def _solr_range_from(field: str, value: str) -> str:
+    """Get a Solr filter query of field values from value, inclusive."""
+    if field in SOLR_DATE_FIELDS:
+        # Seconds precision, so the range includes all fractions of the second
+        lower_bound = f"{value[:19]}Z"
+    else:
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        lower_bound = f'"{escaped}"'
+    return f"{field}:[{lower_bound} TO *]"
+
+
+def iter_package_search(
+    fq: str = "",
+    sort_field: str = "metadata_modified",
+    rows: int = 1000,
+    host: str = "https://www.envidat.ch",
+    path: str = "/api/3/action/package_search",
+    fl: str | None = None,
+) -> Iterator[dict]:
+    """Iterate over packages matching a search from API, paging through results.
+
+    Packages are sorted by sort_field, then id. Each page requests the packages
+    from the sort_field value of the last package of the previous page, instead
+    of an offset, skipping packages already returned. So packages modified while
+    iterating do not shift later pages. If sort_field is "metadata_modified",
+    a package modified while iterating is returned again, with the new version.
+
+    Args:
+        fq (str): Solr filter query,
+            e.g. "metadata_modified:[2023-01-01T00:00:00Z TO *]".
+            Defaults to empty string "", matching all packages.
+        sort_field (str): Package field to sort and page by, in ascending order.
+            Defaults to "metadata_modified".
+        rows (int): Number of packages requested per API call (CKAN max 1000).
+        host (str): API host url. Attempts to get from environment if omitted.
+            Defaults to https://www.envidat.ch
+        path (str): API host path for package search.
+            Defaults to /api/3/action/package_search
+        fl (str): Comma separated package fields to return, e.g. "name,doi".
+            "id" and sort_field are always returned, as they are used for paging.
+            Defaults to None, returning full packages.
+
+    Yields:
+        dict: Package, with nested resources, or only the fl fields if passed.
+    """
+    settings = get_settings()
+    if settings.api_host:
+        log.debug("Getting API host from environment variable.")
+        host = settings.api_host
+
+    if fl:
+        fl = ",".join(dict.fromkeys([*fl.split(","), "id", sort_field]))
+
+    range_fq = None
+    start = 0
+    seen = set()
+    while True:
+        filters = [f"({fq})"] if fq else []
+        if range_fq:
+            filters.append(range_fq)
+        query = {
+            "q": "*:*",
+            "sort": f"{sort_field} asc, id asc",
+            "rows": rows,
+            "start": start,
+        }
+        if filters:
+            query["fq"] = " AND ".join(filters)
+        if fl:
+            query["fl"] = fl
+        url = f"{host}{path}?{urllib.parse.urlencode(query)}"
+
+        try:
+            result = get_url(url).json()["result"]
+        except AttributeError as e:
+            log.error(e)
+            log.error(f"Searching packages from API failed: {url}")
+            raise AttributeError(
+                "Failed to extract package search results as JSON."
+            ) from e
+
+        packages = result.get("results", [])
+        for package in packages:
+            # Packages from the start of the range were returned by the last page
+            key = (package.get("id"), package.get(sort_field))
+            if key not in seen:
+                seen.add(key)
+                yield package
+
+        if len(packages) < rows:
+            return
+
+        next_range_fq = _solr_range_from(sort_field, packages[-1][sort_field])
+        if next_range_fq == range_fq:
+            # Whole page has the same value in the range, so use an offset
+            start += len(packages)
+        else:
+            range_fq = next_range_fq
+            start = 0
+
+
+def iter_package_fields(
+    fields: Iterable[str],
+    fq: str = "",
+    rows: int = 1000,
+    host: str = "https://www.envidat.ch",
+) -> Iterator[dict]:
+    """Iterate over selected fields of all packages from API.
+
+    Only the requested fields are transferred, so listing e.g. names and DOIs
+    does not download every package with all resources.
+
+    Args:
+        fields (Iterable[str]): Package fields to get, e.g. ("name", "doi").
+        fq (str): Solr filter query. Defaults to "", matching all packages.
+        rows (int): Number of packages requested per API call (CKAN max 1000).
+        host (str): API host url. Attempts to get from environment if omitted.
+            Defaults to https://www.envidat.ch
+
+    Yields:
+        dict: Package fields, with value None for fields a package does not have.
+    """
+    fields = tuple(fields)
+    packages = iter_package_search(
+        fq=fq, sort_field="name", rows=rows, host=host, fl=",".join(fields)
+    )
+    for package in packages:
+        yield {field: package.get(field) for field in fields}
@@ -1 +1,79 @@
-"""EnviDat converters to various formats for Open Data Platforms."""
+"""EnviDat converters to various formats for Open Data Platforms.
+
+Converters are looked up by format name with get_converter, and only imported
+on first use. Other converters can be added with register_converter.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from importlib import import_module
+from typing import NoReturn, Union
+
+log = logging.getLogger(__name__)
+
+# Built in converters, as "<module>:<function>" imported on first use
+_converters: dict[str, Union[str, Callable[[dict], str]]] = {
+    "xml": "envidat.converters.xml_converter:convert_xml",
+    "iso": "envidat.converters.iso_converter:convert_iso",
+    "bibtex": "envidat.converters.bibtex_converter:convert_bibtex",
+    "dif": "envidat.converters.dif_converter:convert_dif",
+    "datacite": "envidat.converters.datacite_converter:convert_datacite",
+    "ris": "envidat.converters.ris_converter:convert_ris",
+    "dcat-ap": "envidat.converters.dcat_ap_converter:convert_dcat_ap",
+}
+_converters_lock = threading.Lock()
+
+
+def register_converter(
+    file_format: str, converter: Union[str, Callable[[dict], str]]
+) -> NoReturn:
+    """Register a converter for a format, replacing any existing one.
+
+    Args:
+        file_format (str): Format name, e.g. "schema-org".
+        converter (Union[str, Callable]): Function taking a metadata record
+            dictionary and returning the converted string. Can also be a
+            "<module>:<function>" string, imported on first use.
+    """
+    if isinstance(converter, str) and ":" not in converter:
+        raise ValueError(
+            f"Converter path must be '<module>:<function>', got: {converter}"
+        )
+    with _converters_lock:
+        _converters[file_format] = converter
+
+
+def get_converter(file_format: str) -> Callable[[dict], str]:
+    """Get the converter for a format, importing it on first use.
+
+    Args:
+        file_format (str): Format name, e.g. "bibtex".
+
+    Returns:
+        Callable: Function taking a metadata record dictionary,
+            returning the converted string.
+
+    Raises:
+        ValueError: If no converter is registered for the format.
+    """
+    converter = _converters.get(file_format)
+    if converter is None:
+        raise ValueError(f"No converter registered for format: {file_format}")
+    if not isinstance(converter, str):
+        return converter
+
+    module_name, _, function_name = converter.partition(":")
+    log.debug(f"Importing {file_format} converter: {converter}")
+    function = getattr(import_module(module_name), function_name)
+
+    with _converters_lock:
+        # Only replace the path if the format was not registered again meanwhile
+        if _converters.get(file_format) == converter:
+            _converters[file_format] = function
+    return function
+
+
+def get_converter_formats() -> tuple[str, ...]:
+    """Get names of all formats with a registered converter."""
+    return tuple(_converters)
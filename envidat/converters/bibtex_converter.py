@@ -1,9 +1,9 @@
 """BibTeX reference management format, for LaTeX formatting."""
 
-import json
 from logging import getLogger
 
 from envidat.api.v1 import get_protocol_and_domain
+from envidat.converters.fields import load_json_field
 
 log = getLogger(__name__)
 
@@ -38,7 +38,7 @@ def bibtex_convert_dataset(dataset: dict) -> str:
     converted_package = "@misc { " + name
 
     # year (add to name) and journal
-    publication = json.loads(dataset.get("publication", "{}"))
+    publication = load_json_field(dataset, "publication", "{}")
     publication_year = publication["publication_year"]
 
     converted_package += f"-{publication_year}"
@@ -51,7 +51,7 @@ def bibtex_convert_dataset(dataset: dict) -> str:
     converted_package += ',\n\t title = "' + title + '"'
 
     # author
-    authors = json.loads(dataset.get("author", "[]"))
+    authors = load_json_field(dataset, "author", "[]")
     author_names = []
     for author in authors:
         author_name = ""
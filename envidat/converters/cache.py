@@ -0,0 +1,157 @@
+"""Optional persistent cache for converted metadata records."""
+
+import logging
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import NoReturn, Union
+
+from envidat.api.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE, DiskCache
+from envidat.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+try:
+    CONVERTER_VERSION = version("envidat-utils")
+except PackageNotFoundError:
+    CONVERTER_VERSION = "unknown"
+
+_conversion_cache = None
+
+
+class ConversionCache:
+    """Converted records stored on disk, keyed on record version and format.
+
+    An entry is stored per record id and format, and separately for records
+    reduced with compact_record, with the record metadata_modified and the
+    converter version. An entry is only used if both
+    still match, so records are converted again once modified, or after
+    upgrading the converters.
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str],
+        max_size: int = DEFAULT_MAX_SIZE,
+        converter_version: str = CONVERTER_VERSION,
+    ) -> NoReturn:
+        """Init the ConversionCache object.
+
+        Args:
+            directory (Union[Path, str]): Directory to store converted records in.
+            max_size (int): Maximum total size of stored records, in bytes.
+                Least recently used records are evicted. Defaults to 512 MB.
+            converter_version (str): Version of the converters.
+                Defaults to the installed envidat-utils version.
+        """
+        self.store = DiskCache(directory, max_size=max_size)
+        self.converter_version = converter_version
+
+    @staticmethod
+    def _key(record: dict, file_format: str, compact: bool) -> str | None:
+        """Get entry key of a record format, None if the record has no id."""
+        record_id = record.get("id")
+        if not record_id or not record.get("metadata_modified"):
+            return None
+        if compact:
+            return f"{file_format}:compact:{record_id}"
+        return f"{file_format}:{record_id}"
+
+    def get(
+        self, record: dict, file_format: str, compact: bool = False
+    ) -> str | None:
+        """Get a converted record, if stored for the current record version.
+
+        Args:
+            record (dict): Individual EnviDat metadata entry record dictionary.
+            file_format (str): Format name, e.g. "datacite".
+            compact (bool): If the record was reduced with compact_record.
+                Defaults to False.
+
+        Returns:
+            str: Converted record.
+            None: If not stored, or stored for an older record or converter.
+        """
+        key = self._key(record, file_format, compact)
+        if key is None:
+            return None
+
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+
+        body, metadata = entry
+        if (
+            metadata.get("metadata_modified") != record["metadata_modified"]
+            or metadata.get("converter_version") != self.converter_version
+        ):
+            log.debug(f"Discarding outdated {file_format} for record: {record['id']}")
+            self.store.delete(key)
+            return None
+
+        return body.decode("utf-8")
+
+    def set(
+        self, record: dict, file_format: str, output: str, compact: bool = False
+    ) -> NoReturn:
+        """Store a converted record, replacing older versions of it.
+
+        Args:
+            record (dict): Individual EnviDat metadata entry record dictionary.
+            file_format (str): Format name, e.g. "datacite".
+            output (str): Converted record.
+            compact (bool): If the record was reduced with compact_record.
+                Defaults to False.
+        """
+        key = self._key(record, file_format, compact)
+        if key is None:
+            return
+
+        metadata = {
+            "metadata_modified": record["metadata_modified"],
+            "converter_version": self.converter_version,
+        }
+        self.store.set(key, output.encode("utf-8"), metadata)
+
+    def clear(self) -> NoReturn:
+        """Remove all converted records."""
+        self.store.clear()
+
+
+def enable_conversion_cache(
+    directory: Union[Path, str] = None,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> ConversionCache:
+    """Cache converted records of Record.to_* methods and bulk conversions.
+
+    Args:
+        directory (Union[Path, str]): Directory to store converted records in.
+            Attempts to get from environment variable CONVERSION_CACHE_DIR if
+            omitted, else "envidat-cache/conversion" in the system temporary
+            directory.
+        max_size (int): Maximum total size of stored records, in bytes.
+            Defaults to 512 MB.
+
+    Returns:
+        ConversionCache: The enabled cache.
+    """
+    global _conversion_cache
+
+    if directory is None:
+        directory = (
+            get_settings().conversion_cache_dir or DEFAULT_CACHE_DIR / "conversion"
+        )
+
+    log.info(f"Enabling conversion cache in {directory}.")
+    _conversion_cache = ConversionCache(directory, max_size=max_size)
+    return _conversion_cache
+
+
+def disable_conversion_cache() -> NoReturn:
+    """Stop caching converted records. Stored records are kept on disk."""
+    global _conversion_cache
+    _conversion_cache = None
+
+
+def get_conversion_cache() -> ConversionCache | None:
+    """Get the enabled conversion cache, or None if caching is disabled."""
+    return _conversion_cache
@@ -2,8 +2,9 @@
 
 import collections
 import json
-import os
 import re
+import threading
+from collections.abc import Iterable
 from datetime import date
 from json import JSONDecodeError
 from logging import getLogger
@@ -13,13 +14,50 @@ import jsonschema
 import validators
 from xmltodict import unparse
 
-from envidat.utils import get_url, load_dotenv_if_in_debug_mode
+from envidat.api.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE, DiskCache
+from envidat.converters.doi_resolver import (
+    DEFAULT_DOI_TTL,
+    DEFAULT_NEGATIVE_TTL,
+    DOIResolver,
+)
+from envidat.converters.fields import load_json_field
+from envidat.settings import get_settings
+from envidat.utils import get_url
 
 log = getLogger(__name__)
 
-
-# Load config from environment variables
-load_dotenv_if_in_debug_mode()
+# DataCite converter config, loaded and validated once per process
+_datacite_config = None
+_datacite_config_loaded = False
+_datacite_config_lock = threading.Lock()
+
+# Resolver of DORA and EnviDat URLs in related identifiers to DOIs
+_doi_resolver = None
+_doi_resolver_lock = threading.Lock()
+
+# Keys in config "affiliation" for commonly used affiliations in EnviDat packages
+AFFILIATION_KEYS = {
+    "WSL": "wsl",
+    "Swiss Federal Institute for Forest, Snow and Landscape Research WSL": "wsl",
+    "WSL Swiss Federal Research Institute, Birmensdorf, Switzerland": "wsl",
+    "SLF": "slf",
+    "WSL Institute for Snow and Avalanche Research SLF, Davos Dorf, Switzerland":
+        "slf",
+    "WSL Institute for Snow and Avalanche Research SLF": "slf",
+    "ETH": "eth",
+    "ETHZ": "eth",
+    "UZH": "uzh",
+    "University of Zurich": "uzh",
+    "University of Zürich": "uzh",
+    "EPFL": "epfl",
+    "EPFL, Lausanne Swiss Federal Institute of Technology, Lausanne and Sion":
+        "epfl",
+    "PSI": "psi",
+    "PSI, Paul Scherrer Institute, Villigen": "psi",
+    "IAP": "iap",
+    "TROPOS": "tropos",
+    "UNIL": "unil"
+}
 
 
 def convert_datacite(metadata_record: dict) -> str | None:
@@ -57,12 +95,46 @@ def convert_datacite(metadata_record: dict) -> str | None:
         return None
 
 
-def get_config_datacite_converter() -> dict | None:
+def get_config_datacite_converter(reload: bool = False) -> dict | None:
     """Return validated datacite converter JSON config as Python dictionary.
 
     Dictionary maps Datacite XML schema tags (keys) to EnviDat schema fields
     (values).
 
+    The config is read and validated on first use only, and shared by all
+    conversions in the process. It must not be modified.
+
+    Args:
+        reload (bool): Read and validate the config file again.
+
+    Returns:
+        dict: datacite converter JSON config as Python dictionary
+        None: if config failed validation
+    """
+    global _datacite_config, _datacite_config_loaded
+
+    with _datacite_config_lock:
+        if reload or not _datacite_config_loaded:
+            _datacite_config = load_config_datacite_converter()
+            _datacite_config_loaded = True
+        return _datacite_config
+
+
+def reload_config_datacite_converter() -> dict | None:
+    """Read and validate the datacite converter config again, after it changed.
+
+    Returns:
+        dict: datacite converter JSON config as Python dictionary
+        None: if config failed validation
+    """
+    return get_config_datacite_converter(reload=True)
+
+
+def load_config_datacite_converter() -> dict | None:
+    """Read and validate datacite converter JSON config from the config file.
+
+    Use get_config_datacite_converter to get the config loaded once.
+
     Returns:
         dict: datacite converter JSON config as Python dictionary
         None: if config failed validation
@@ -136,7 +208,7 @@ def datacite_convert_dataset(dataset: dict, config: dict):
 
     if author_dataset:
         try:
-            authors = json.loads(author_dataset)
+            authors = load_json_field(dataset, config[dc_creators_tag], [])
         except JSONDecodeError:
             log.error(
                 f"ERROR cannot parse '{config[dc_creators_tag]}' value from package")
@@ -178,9 +250,8 @@ def datacite_convert_dataset(dataset: dict, config: dict):
         return None
 
     # Get publication dictionary
-    pub = dataset.get("publication", {})
     try:
-        publication = json.loads(pub)
+        publication = load_json_field(dataset, "publication", {})
     except JSONDecodeError:
         publication = {}
 
@@ -240,9 +311,8 @@ def datacite_convert_dataset(dataset: dict, config: dict):
 
     # Get "maintainer" from EnviDat package,
     # assigned as DataCite Contributor "ContactPerson"
-    maintainer_dataset = dataset.get(config[dc_contributors_tag], {})
     try:
-        maintainer = json.loads(maintainer_dataset)
+        maintainer = load_json_field(dataset, config[dc_contributors_tag], {})
     except JSONDecodeError:
         maintainer = {}
 
@@ -266,24 +336,25 @@ def datacite_convert_dataset(dataset: dict, config: dict):
     dc_date_type_tag = "dateType"
     dc_dates = []
 
-    date_input = dataset.get(config[dc_dates_tag], [])
     try:
-        dates = json.loads(date_input)
+        dates = load_json_field(dataset, config[dc_dates_tag], [])
     except JSONDecodeError:
         dates = []
 
     # "dateType" is REQUIRED DataCite attribute for each "Date", (default value is
     #    "Valid"), log values that are not "Created" or "colected"
+    date_type_key = config[dc_date_type_tag]
+    date_key = config[dc_date_tag]
     for dte in dates:
 
-        date_type = (dte.get(config[dc_date_type_tag]))
+        date_type = (dte.get(date_type_key))
         if date_type not in ["created", "Created", "collected", "Collected"]:
-            log.warning(f"WARNING {config[dc_date_type_tag]} value '{date_type}' "
+            log.warning(f"WARNING {date_type_key} value '{date_type}' "
                         f"not a valid DataCite {dc_date_type_tag} ")
             date_type = "Valid"
 
         dc_date = {
-            "#text": dte.get(config[dc_date_tag], ""),
+            "#text": dte.get(date_key, ""),
             f"@{dc_date_type_tag}": date_type.title()
         }
         dc_dates += [dc_date]
@@ -370,10 +441,13 @@ def datacite_convert_dataset(dataset: dict, config: dict):
         dc_related_items = []
 
         related_item_data = dataset.get(config.get('relatedItems', []), [])
+        related_item_config = config.get('relatedItem', {})
+        related_item_url_key = related_item_config.get('url', "")
+        related_item_title_key = related_item_config.get('title')
         for related_item in related_item_data:
             # required: title and url
-            url = related_item.get(config.get('relatedItem').get('url', ""), "")
-            title = related_item.get(config.get('relatedItem').get('title'), "")
+            url = related_item.get(related_item_url_key, "")
+            title = related_item.get(related_item_title_key, "")
             if url and title:
                 dc_related_item = collections.OrderedDict()
                 # relatedItemType (is always "Other")
@@ -475,7 +549,7 @@ def datacite_convert_dataset(dataset: dict, config: dict):
 
     # Get spatial data from dataset
     try:
-        spatial = json.loads(dataset.get(config[dc_geolocations_tag], ""))
+        spatial = load_json_field(dataset, config[dc_geolocations_tag], "")
         spatial_type = spatial.get("type", "").lower()
 
         if spatial and spatial_type:
@@ -503,31 +577,33 @@ def datacite_convert_dataset(dataset: dict, config: dict):
     dc_funding_refs_tag = "fundingReferences"
     dc_funding_ref_tag = "fundingReference"
 
-    funding_dataset = dataset.get(config[dc_funding_refs_tag], [])
     try:
-        funding = json.loads(funding_dataset)
+        funding = load_json_field(dataset, config[dc_funding_refs_tag], [])
     except JSONDecodeError:
         funding = []
 
     dc_funding_refs = []
 
+    dc_funder_name_tag = "funderName"
+    dc_award_number_tag = "awardNumber"
+    dc_award_uri_tag = "awardURI"
+    funding_ref_config = config[dc_funding_ref_tag]
+    funder_name_key = funding_ref_config[dc_funder_name_tag]
+    award_number_key = funding_ref_config[dc_award_number_tag]
+    award_uri_key = funding_ref_config[dc_award_uri_tag]
+
     for funder in funding:
 
         dc_funding_ref = collections.OrderedDict()
-        dc_funder_name_tag = "funderName"
 
         # "funderName" is a REQUIRED DataCite attribute for each "fundingReference"
-        funder_name = funder.get(config[dc_funding_ref_tag][dc_funder_name_tag], "")
+        funder_name = funder.get(funder_name_key, "")
         if funder_name:
             dc_funding_ref[dc_funder_name_tag] = funder_name.strip()
 
-            dc_award_number_tag = "awardNumber"
-            award_number = funder.get(
-                config[dc_funding_ref_tag][dc_award_number_tag], ""
-            )
+            award_number = funder.get(award_number_key, "")
 
-            dc_award_uri_tag = "awardURI"
-            award_uri = funder.get(config[dc_funding_ref_tag][dc_award_uri_tag], "")
+            award_uri = funder.get(award_uri_key, "")
 
             # Assign awardNumber and awardURI if they exist
             # and if awardURI is a valid URL
@@ -558,11 +634,11 @@ def datacite_convert_dataset(dataset: dict, config: dict):
 
 def get_dc_creator(author: dict, config: dict):
     """Returns author information in DataCite "creator" tag format."""
-    dc_creator_tag = "creator"
+    creator_config = config["creator"]
     dc_creator = collections.OrderedDict()
 
-    creator_family_name = author.get(config[dc_creator_tag]["familyName"], "").strip()
-    creator_given_name = author.get(config[dc_creator_tag]["givenName"], "").strip()
+    creator_family_name = author.get(creator_config["familyName"], "").strip()
+    creator_given_name = author.get(creator_config["givenName"], "").strip()
 
     if creator_given_name and creator_family_name:
         dc_creator["creatorName"] = f"{creator_given_name} {creator_family_name}"
@@ -573,7 +649,7 @@ def get_dc_creator(author: dict, config: dict):
 
     # REQUIRED DataCite property for each "Creator"
     # with a "nameIdentifier": "nameIdentifierScheme" (value assigned to "ORCID")
-    creator_identifier = author.get(config[dc_creator_tag]["nameIdentifier"], "")
+    creator_identifier = author.get(creator_config["nameIdentifier"], "")
     if creator_identifier:
         dc_creator["nameIdentifier"] = {
             "#text": creator_identifier.strip(),
@@ -582,7 +658,7 @@ def get_dc_creator(author: dict, config: dict):
         }
 
     affiliations = []
-    affiliation = author.get(config[dc_creator_tag]["affiliation"], "")
+    affiliation = author.get(creator_config["affiliation"], "")
     if affiliation:
         aff = affiliation_to_dc(affiliation, config)
         if aff:
@@ -620,12 +696,13 @@ def get_dc_contributor(maintainer: dict, config: dict):
     """
     dc_contributor = collections.OrderedDict()
     dc_contributor_tag = "contributor"
+    contributor_config = config[dc_contributor_tag]
 
     contributor_family_name = maintainer.get(
-        config[dc_contributor_tag]["familyName"], ""
+        contributor_config["familyName"], ""
     ).strip()
     contributor_given_name = maintainer.get(
-        config[dc_contributor_tag]["givenName"], ""
+        contributor_config["givenName"], ""
     ).strip()
 
     if contributor_given_name:
@@ -637,7 +714,7 @@ def get_dc_contributor(maintainer: dict, config: dict):
         dc_contributor["contributorName"] = contributor_family_name
 
     contributor_identifier = maintainer.get(
-        config[dc_contributor_tag]["nameIdentifier"], ""
+        contributor_config["nameIdentifier"], ""
     )
     if contributor_identifier:
         dc_contributor["nameIdentifier"] = {
@@ -652,7 +729,7 @@ def get_dc_contributor(maintainer: dict, config: dict):
         }
 
     contributor_affiliation = maintainer.get(
-        config[dc_contributor_tag]["affiliation"], ""
+        contributor_config["affiliation"], ""
     )
 
     if contributor_affiliation:
@@ -677,30 +754,6 @@ def affiliation_to_dc(affiliation, config) -> dict[str, str]:
     (i.e. "WSL", "SLF") with long names of instiutions
     and ROR identifiers when available.
     """
-    # Get key from config that corresponds to affiliation
-    aff_keys = {
-        "WSL": "wsl",
-        "Swiss Federal Institute for Forest, Snow and Landscape Research WSL": "wsl",
-        "WSL Swiss Federal Research Institute, Birmensdorf, Switzerland": "wsl",
-        "SLF": "slf",
-        "WSL Institute for Snow and Avalanche Research SLF, Davos Dorf, Switzerland":
-            "slf",
-        "WSL Institute for Snow and Avalanche Research SLF": "slf",
-        "ETH": "eth",
-        "ETHZ": "eth",
-        "UZH": "uzh",
-        "University of Zurich": "uzh",
-        "University of Zürich": "uzh",
-        "EPFL": "epfl",
-        "EPFL, Lausanne Swiss Federal Institute of Technology, Lausanne and Sion":
-            "epfl",
-        "PSI": "psi",
-        "PSI, Paul Scherrer Institute, Villigen": "psi",
-        "IAP": "iap",
-        "TROPOS": "tropos",
-        "UNIL": "unil"
-    }
-
     # Get affiliation config
     aff_config = config["affiliation"]
 
@@ -708,7 +761,8 @@ def affiliation_to_dc(affiliation, config) -> dict[str, str]:
     aff = affiliation.strip()
 
     # Return org dictionary if it exists in config
-    aff_key = aff_keys.get(aff, "")
+    # Get key from config that corresponds to affiliation
+    aff_key = AFFILIATION_KEYS.get(aff, "")
     org = aff_config.get(aff_key, {})
     if org:
         # If "affiliationIdentifier" exists then "affiliationIdentifierScheme" REQUIRED
@@ -773,28 +827,26 @@ def get_dc_related_identifiers(related_identifiers: str,
     # Validate related_identifiers
     if related_identifiers:
 
-        # Remove special characters "\r", "\n" and
-        # remove Markdown link syntax using brackets and parentheses
-        # and replace with one space " "
-        related_identifiers = re.sub(r"\r|\n|\[|\]|\(|\)", " ", related_identifiers)
+        words = split_related_identifiers(related_identifiers)
+
+        # Resolve DORA and EnviDat URLs to DOIs, concurrently and cached
+        resolved_dois = get_doi_resolver().resolve_words(
+            word for word in words if not get_doi(word)
+        )
 
         # Assign empty array to hold "related_ids" values that will be used to check for
         # duplicates
         related_ids = []
 
         # Extract DOIs
-        for word in related_identifiers.split(" "):
+        for word in words:
 
             # Apply search function to find DOIs
             doi = get_doi(word)
 
-            # If not doi then apply DORA API DOI search function
+            # If not doi then use DOI from DORA API or EnviDat CKAN API
             if not doi:
-                doi = get_dora_doi(word)
-
-            # If not doi then apply EnviDat CKAN API DOI search function
-            if not doi:
-                doi = get_envidat_doi(word)
+                doi = resolved_dois.get(word)
 
             # Add doi to dc_related_identifiers if it meets conditions
             if doi and "/" in doi and doi not in related_ids:
@@ -1172,8 +1224,22 @@ def get_envidat_doi(word: str,
         str: String of DOI
         None: If DOI could not be found
     """
-    doi = None
+    package_name = get_envidat_package_name(word)
+    if package_name is None:
+        return None
+    return get_envidat_package_doi(package_name, api_host, api_package_show)
+
 
+def get_envidat_package_name(word: str) -> str | None:
+    """Get EnviDat package name from an EnviDat package URL.
+
+    Args:
+        word (str): Input string to test if it is an EnviDat package URL.
+
+    Returns:
+        str: Package name
+        None: If word is not an EnviDat package URL
+    """
     # Check if word meets search criteria to be an EnviDat package URL
     if word.startswith(
             ("https://www.envidat.ch/#/metadata/", "https://www.envidat.ch/dataset/")) \
@@ -1182,28 +1248,73 @@ def get_envidat_doi(word: str,
         # Extract package_name from package URL
         last_slash_index = word.rfind("/")
         if last_slash_index != -1:
-            package_name = word[(last_slash_index + 1):]
-
-            # Extract environment variables from config, else use default values
-            api_host = os.getenv("API_HOST", default=api_host)
-            api_package_show = os.getenv("API_PACKAGE_SHOW", default=api_package_show)
-
-            # Assemble URL used to call EnviDat CKAN API
-            api_url = f"{api_host}{api_package_show}{package_name}"
-
-            # Call API and try to return doi
-            try:
-                data = get_url(api_url).json()
-                if data:
-                    doi = data.get("result").get("doi")
-                    if doi:
-                        return doi
-            except Exception as e:
-                log.error(f"ERROR: Failed to retrieve'{api_url}' and extract DOI")
-                log.error(e)
-                return None
+            return word[(last_slash_index + 1):]
 
-    return doi
+    return None
+
+
+def get_envidat_package_doi(
+        package_name: str,
+        api_host="https://envidat.ch",
+        api_package_show="/api/action/package_show?id=") -> str | None:
+    """Get DOI of an EnviDat package by calling EnviDat API.
+
+    Args:
+        package_name (str): EnviDat package name.
+        api_host (str): API host URL. Attempts to get from environment.
+            Default value is "https://envidat.ch".
+        api_package_show (str): API host path to show package. Attempts to get from
+             environment. Default value is "/api/action/package_show?id="
+
+    Returns:
+        str: String of DOI
+        None: If DOI could not be found
+    """
+    try:
+        return resolve_envidat_package_doi(package_name, api_host, api_package_show)
+    except Exception as e:
+        log.error(e)
+        return None
+
+
+def resolve_envidat_package_doi(
+        package_name: str,
+        api_host="https://envidat.ch",
+        api_package_show="/api/action/package_show?id=") -> str | None:
+    """Get DOI of an EnviDat package by calling EnviDat API, raising on failure.
+
+    Unlike get_envidat_package_doi, a failed request is not returned as None,
+    so the DOI resolver does not cache it as a package without DOI.
+
+    Args:
+        package_name (str): EnviDat package name.
+        api_host (str): API host URL. Attempts to get from environment.
+            Default value is "https://envidat.ch".
+        api_package_show (str): API host path to show package. Attempts to get from
+             environment. Default value is "/api/action/package_show?id="
+
+    Returns:
+        str: String of DOI
+        None: If the package has no DOI
+
+    Raises:
+        AttributeError: If the package could not be retrieved or parsed.
+    """
+    # Extract environment variables from config, else use default values
+    settings = get_settings()
+    api_host = settings.api_host or api_host
+    api_package_show = settings.api_package_show or api_package_show
+
+    # Assemble URL used to call EnviDat CKAN API
+    api_url = f"{api_host}{api_package_show}{package_name}"
+
+    try:
+        package = get_url(api_url).json()["result"]
+        return package.get("doi") or None
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise AttributeError(
+            f"Failed to retrieve '{api_url}' and extract DOI: {e!r}"
+        ) from e
 
 
 def get_dora_doi(word: str) -> str | None:
@@ -1221,29 +1332,46 @@ def get_dora_doi(word: str) -> str | None:
         str: String of DOI
         None: If DOI could not be found
     """
-    doi = None
+    dora_pid = get_dora_pid(word)
+    if dora_pid is None:
+        return None
+
+    # Call DORA API and get DOI if it listed in citation
+    return get_dora_doi_string(dora_pid) or None
+
 
+def get_dora_pid(word: str) -> str | None:
+    """Get DORA PID (permanent identification) from a DORA URL.
+
+    Example:
+        an input of "https://www.dora.lib4ri.ch/wsl/islandora/object/wsl%3A3213"
+        would return "wsl%3A3213" as output.
+
+    Args:
+        word (str): Input string to test if it is a DORA URL
+
+    Returns:
+        str: DORA PID
+        None: If word is not a DORA URL
+    """
     # Apply search criteria to find DOIs from DORA API
     # DORA API documentation:
     # https://www.wiki.lib4ri.ch/display/HEL/Technical+details+of+DORA
     dora_str = "dora.lib4ri.ch/wsl/islandora/object/"
-    if dora_str in word:
-        dora_start_index = word.find(dora_str)
-        dora_pid = word[(dora_start_index + len(dora_str)):]
+    if dora_str not in word:
+        return None
 
-        # Remove any characters that may exist after DORA PID
-        dora_end_index = dora_pid.find("/")
+    dora_start_index = word.find(dora_str)
+    dora_pid = word[(dora_start_index + len(dora_str)):]
 
-        # Modify dora_pid if dora_end_index found in dora_pid
-        if dora_end_index != -1:
-            dora_pid = dora_pid[:dora_end_index]
+    # Remove any characters that may exist after DORA PID
+    dora_end_index = dora_pid.find("/")
 
-        # Call DORA API and get DOI if it listed in citation
-        doi_dora = get_dora_doi_string(dora_pid)
-        if doi_dora:
-            doi = doi_dora
+    # Modify dora_pid if dora_end_index found in dora_pid
+    if dora_end_index != -1:
+        dora_pid = dora_pid[:dora_end_index]
 
-    return doi
+    return dora_pid
 
 
 def get_dora_doi_string(
@@ -1264,8 +1392,34 @@ def get_dora_doi_string(
         str: String of DOI
         None: If DOI could not be found
     """
+    try:
+        return resolve_dora_doi_string(dora_pid, dora_api_url)
+    except Exception as e:
+        log.error(e)
+        return None
+
+
+def resolve_dora_doi_string(
+        dora_pid: str, dora_api_url: str = "https://envidat.ch/dora") -> str | None:
+    """Get DOI string from WSL DORA API using DORA PID, raising on failure.
+
+    Unlike get_dora_doi_string, a failed request is not returned as None,
+    so the DOI resolver does not cache it as a DORA record without DOI.
+
+    Args:
+        dora_pid (str): DORA PID (permanent identification)
+        dora_api_url (str): API host url. Attempts to get from environment.
+            Defaults to "https://envidat.ch/dora"
+
+    Returns:
+        str: String of DOI
+        None: If the DORA record citation has no DOI
+
+    Raises:
+        AttributeError: If the DORA record could not be retrieved or parsed.
+    """
     # Extract environment variables from config, else use default values
-    dora_api_url = os.getenv("DORA_API_URL", default=dora_api_url)
+    dora_api_url = get_settings().dora_api_url or dora_api_url
 
     # Replace '%3A' ASCII II code with semicolon ':'
     dora_pid = re.sub("%3A", ":", dora_pid)
@@ -1277,26 +1431,115 @@ def get_dora_doi_string(
     dora_url = f"{dora_api_url}/{dora_pid}"
 
     try:
-        data = get_url(dora_url).json()
+        citation = get_url(dora_url).json()[dora_pid]["citation"]["WSL"]
+        words = citation.split(" ")
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise AttributeError(
+            f"Failed to retrieve '{dora_url}' and extract DOI: {e!r}"
+        ) from e
 
-        if data:
-            citation = data[dora_pid]["citation"]["WSL"]
+    # Return DOI if it exists in citation, else None
+    return next((doi for doi in map(get_doi, words) if doi), None)
 
-            for word in citation.split(" "):
-                # Return DOI if it exists
-                doi = get_doi(word)
-                if doi:
-                    return doi
 
-            # If DOI not found then return None
-            return None
+def split_related_identifiers(related_identifiers: str) -> list[str]:
+    r"""Split EnviDat "related_datasets" or "related_publications" value into words.
 
-        return None
+    Special characters "\r", "\n" and Markdown link syntax using brackets and
+    parentheses are replaced with one space " " first.
 
-    except Exception as e:
-        log.error(f"ERROR: Failed to retrieve'{dora_url}' and extract DOI")
-        log.error(e)
-        return None
+    Args:
+        related_identifiers (str): Input related identifiers.
+
+    Returns:
+        list[str]: Words, that may be DOIs or URLs.
+    """
+    return re.sub(r"\r|\n|\[|\]|\(|\)", " ", related_identifiers).split(" ")
+
+
+def get_doi_resolver() -> DOIResolver:
+    """Get the resolver of DORA and EnviDat URLs to DOIs, shared in the process.
+
+    Resolves DORA URLs with resolve_dora_doi_string, then EnviDat package URLs
+    with resolve_envidat_package_doi. Results are cached in memory, use
+    enable_doi_cache to also store them on disk. Failed lookups are not cached.
+
+    Returns:
+        DOIResolver: The resolver.
+    """
+    global _doi_resolver
+
+    with _doi_resolver_lock:
+        if _doi_resolver is None:
+            _doi_resolver = DOIResolver()
+            # Looked up on each call, so settings and test patches apply
+            _doi_resolver.register(
+                "dora", get_dora_pid, lambda pid: resolve_dora_doi_string(pid)
+            )
+            _doi_resolver.register(
+                "envidat",
+                get_envidat_package_name,
+                lambda name: resolve_envidat_package_doi(name),
+            )
+        return _doi_resolver
+
+
+def enable_doi_cache(
+    directory: Path | str = None,
+    ttl: float = DEFAULT_DOI_TTL,
+    negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> DOIResolver:
+    """Store DOIs resolved from related identifiers on disk, between processes.
+
+    Args:
+        directory (Union[Path, str]): Directory to store DOIs in.
+            Attempts to get from environment variable DOI_CACHE_DIR if
+            omitted, else "envidat-cache/doi" in the system temporary directory.
+        ttl (float): Seconds a resolved DOI is used. Defaults to 7 days.
+        negative_ttl (float): Seconds an identifier without DOI is not
+            resolved again. Defaults to 1 day.
+        max_size (int): Maximum total size of stored DOIs, in bytes.
+            Defaults to 512 MB.
+
+    Returns:
+        DOIResolver: The resolver, using the store.
+    """
+    if directory is None:
+        directory = get_settings().doi_cache_dir or DEFAULT_CACHE_DIR / "doi"
+
+    log.info(f"Enabling DOI cache in {directory}.")
+    resolver = get_doi_resolver()
+    resolver.store = DiskCache(directory, max_size=max_size)
+    resolver.ttl = ttl
+    resolver.negative_ttl = negative_ttl
+    return resolver
+
+
+def prefetch_related_identifier_dois(records: Iterable[dict]) -> int:
+    """Resolve DOIs of related identifiers for many records at once.
+
+    DORA and EnviDat URLs of all records are de-duplicated and resolved
+    concurrently, so converting the records afterwards uses cached DOIs.
+
+    Args:
+        records (Iterable[dict]): EnviDat metadata entry record dictionaries.
+
+    Returns:
+        int: Number of URLs resolved.
+    """
+    words = set()
+    for record in records:
+        for key in ("related_datasets", "related_publications"):
+            related_identifiers = record.get(key)
+            if related_identifiers:
+                words.update(
+                    word
+                    for word in split_related_identifiers(related_identifiers)
+                    if not get_doi(word)
+                )
+
+    return len(get_doi_resolver().resolve_words(words))
 
 
 def log_falsy_value(key: str):
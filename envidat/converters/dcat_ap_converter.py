@@ -1,15 +1,28 @@
 """DCAT-AP CH for OpenDataSwiss."""
 
-import json
+import codecs
+import io
 import logging
 from collections import OrderedDict
-from typing import Union
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import IO, Union
 
-from dateutil.parser import parse as parse_date
-from xmltodict import parse, unparse
+from xmltodict import unparse
+
+from envidat.converters.fields import (
+    get_maintainer_name,
+    get_record_keywords,
+    load_json_field,
+    load_resource_json_field,
+)
+from envidat.utils import parse_date
 
 log = logging.getLogger(__name__)
 
+# Placeholder for datasets, to split catalog XML into header and footer
+_DATASETS_SENTINEL = "__envidat_dcat_datasets__"
+
 
 def convert_dcat_ap(metadata_records: Union[dict, list[dict]]) -> str:
     """Generate output string in DCAT-AP format.
@@ -31,21 +44,9 @@ def convert_dcat_ap(metadata_records: Union[dict, list[dict]]) -> str:
     try:
 
         if isinstance(metadata_records, list):
-            converted_records = []
-            for record in metadata_records:
-                converted_records.append(
-                    dcat_ap_convert_dataset(
-                        record,
-                    )
-                )
-            return wrap_packages_dcat_ap_xml(converted_records)
+            return "".join(iter_dcat_ap_catalog(metadata_records))
 
-        return wrap_packages_dcat_ap_xml(
-            dcat_ap_convert_dataset(
-                metadata_records,
-                as_xml=True,
-            )
-        )
+        return wrap_packages_dcat_ap_xml(dcat_ap_convert_dataset(metadata_records))
     except AttributeError as e:
         log.error(e)
         log.error("Cannot convert package to DCAT-AP format.")
@@ -126,13 +127,8 @@ def dcat_ap_convert_dataset(
     }
 
     # contact point (MANDATORY)
-    maintainer = json.loads(metadata_record.get("maintainer", "{}"))
-    maintainer_name = ""
-
-    if maintainer.get("given_name"):
-        maintainer_name += maintainer["given_name"].strip() + " "
-
-    maintainer_name += maintainer["name"]
+    maintainer = load_json_field(metadata_record, "maintainer", "{}")
+    maintainer_name = get_maintainer_name(metadata_record)
     maintainer_email = "mailto:" + maintainer["email"]
     individual_contact_point = {
         "vcard:Individual": {
@@ -201,11 +197,7 @@ def clean_text(text: str) -> str:
 
 def get_keywords(metadata_record: dict) -> list:
     """Keywords from tags in package (metadata record)."""
-    keywords = []
-    for tag in metadata_record.get("tags", []):
-        name = tag.get("display_name", "").upper()
-        keywords += [name]
-    return keywords
+    return list(get_record_keywords(metadata_record))
 
 
 def get_distribution_list(metadata_record: dict, package_name: str) -> list:
@@ -255,8 +247,11 @@ def get_distribution_list(metadata_record: dict, package_name: str) -> list:
             resource_size = 0
             try:
                 if len(resource.get("resource_size", "")) > 0:
-                    resource_size_obj = json.loads(
-                        resource.get("resource_size", "{'size_value': '0'}")
+                    resource_size_obj = load_resource_json_field(
+                        metadata_record,
+                        resource,
+                        "resource_size",
+                        "{'size_value': '0'}",
                     )
                     sizes_dict = {
                         "KB": 1024,
@@ -322,9 +317,13 @@ def get_distribution_list(metadata_record: dict, package_name: str) -> list:
     return distribution_list
 
 
-def wrap_packages_dcat_ap_xml(dcat_xml_packages: list) -> str:
+def wrap_packages_dcat_ap_xml(dcat_xml_packages: Union[list, dict, str]) -> str:
     """Add required DCAT-AP catalog XML tags for full DCAT-AP XML.
 
+    Dictionaries are rendered one dataset at a time. XML strings are inserted
+    into the catalog as they are, without parsing them again, so only their
+    first line is indented to the catalog depth.
+
     Args:
         dcat_xml_packages (list[str,dict]): All DCAT-AP formatted packages to include.
             In string XML or dictionary format.
@@ -332,6 +331,45 @@ def wrap_packages_dcat_ap_xml(dcat_xml_packages: list) -> str:
     Note:
         This is a required final step for producing a DCAT-AP CH format XML.
     """
+    if isinstance(dcat_xml_packages, (dict, str)):
+        dcat_xml_packages = [dcat_xml_packages]
+    elif not isinstance(dcat_xml_packages, list):
+        log.error("Packages in incorrect format. Must be string XML or dict.")
+        raise ValueError("Packages in incorrect format. Must be string XML or dict.")
+
+    datasets_xml = []
+    for package in dcat_xml_packages:
+        if isinstance(package, dict):
+            datasets_xml.append(get_dcat_ap_dataset_xml(package))
+        elif isinstance(package, str):
+            datasets_xml.append(_insert_dataset_xml(package))
+        else:
+            log.error("Packages in incorrect format. Must be string XML or dict.")
+            raise ValueError(
+                "Packages in incorrect format. Must be string XML or dict."
+            )
+
+    header, footer = _split_catalog_xml(True)
+    return header + "".join(datasets_xml) + footer
+
+
+def _insert_dataset_xml(dataset_xml: str) -> str:
+    """Wrap XML of a dataset in a "dcat:dataset" element, without parsing it."""
+    if dataset_xml.startswith("<?xml"):
+        # Remove XML declaration
+        dataset_xml = dataset_xml[dataset_xml.index("?>") + 2 :]
+    return f"\t\t<dcat:dataset>\n\t\t\t{dataset_xml.strip()}\n\t\t</dcat:dataset>\n"
+
+
+def get_dcat_ap_catalog_dict(datasets: Union[list, dict, str]) -> OrderedDict:
+    """Get DCAT-AP catalog dictionary with required namespaces, for unparsing.
+
+    Args:
+        datasets (list, dict, str): Value of the "dcat:dataset" element.
+
+    Returns:
+        OrderedDict: Dictionary with "rdf:RDF" root element.
+    """
     catalog_dict = OrderedDict()
 
     # header
@@ -346,22 +384,114 @@ def wrap_packages_dcat_ap_xml(dcat_xml_packages: list) -> str:
     catalog_dict["@xmlns:odrs"] = "http://schema.theodi.org/odrs#"
     catalog_dict["@xmlns:schema"] = "http://schema.org/"
 
-    if isinstance(dcat_xml_packages, dict):
-        packages_dict_list = dcat_xml_packages
-    elif isinstance(dcat_xml_packages, str):
-        packages_dict_list = parse(dcat_xml_packages)
-    elif isinstance(dcat_xml_packages, list):
-        if isinstance(dcat_xml_packages[0], dict):
-            packages_dict_list = dcat_xml_packages
-        elif isinstance(dcat_xml_packages[0], str):
-            packages_dict_list = [parse(package) for package in dcat_xml_packages]
-    else:
-        log.error("Packages in incorrect format. Must be string XML or dict.")
-        raise ValueError("Packages in incorrect format. Must be string XML or dict.")
-    catalog_dict["dcat:Catalog"] = {"dcat:dataset": packages_dict_list}
+    catalog_dict["dcat:Catalog"] = {"dcat:dataset": datasets}
 
     # Assign dcat_catalog_dict dictionary for root element in XML file
     dcat_catalog_dict = OrderedDict()
     dcat_catalog_dict["rdf:RDF"] = catalog_dict
+    return dcat_catalog_dict
+
+
+@lru_cache(maxsize=None)
+def _split_catalog_xml(full_document: bool) -> tuple[str, str]:
+    """Get catalog XML before and after the datasets, split on a placeholder.
 
-    return unparse(dcat_catalog_dict, short_empty_elements=True, pretty=True)
+    With full_document, the XML declaration and namespaces are included.
+    Else a bare catalog is used, to slice datasets out of a rendered catalog.
+    """
+    if full_document:
+        catalog_dict = get_dcat_ap_catalog_dict(_DATASETS_SENTINEL)
+    else:
+        catalog_dict = {
+            "rdf:RDF": {"dcat:Catalog": {"dcat:dataset": _DATASETS_SENTINEL}}
+        }
+    catalog_xml = unparse(
+        catalog_dict,
+        full_document=full_document,
+        short_empty_elements=True,
+        pretty=True,
+    )
+    header, footer = catalog_xml.split(
+        f"\t\t<dcat:dataset>{_DATASETS_SENTINEL}</dcat:dataset>\n"
+    )
+    return header, footer
+
+
+def get_dcat_ap_dataset_xml(dcat_dataset: dict) -> str:
+    """Get XML of one dataset, indented to be written inside the catalog.
+
+    Args:
+        dcat_dataset (dict): DCAT-AP dataset, from dcat_ap_convert_dataset.
+
+    Returns:
+        str: XML "dcat:dataset" element, as in the wrap_packages_dcat_ap_xml output.
+    """
+    prefix, suffix = _split_catalog_xml(False)
+    catalog_xml = unparse(
+        {"rdf:RDF": {"dcat:Catalog": {"dcat:dataset": dcat_dataset}}},
+        full_document=False,
+        short_empty_elements=True,
+        pretty=True,
+    )
+    return catalog_xml[len(prefix) : len(catalog_xml) - len(suffix)]
+
+
+def iter_dcat_ap_catalog(metadata_records: Iterable[dict]) -> Iterator[str]:
+    """Iterate over DCAT-AP catalog XML, converting one metadata entry at a time.
+
+    Yields the catalog header, then the XML of each dataset as it is converted,
+    then the footer. Joined together, the output is the same as
+    convert_dcat_ap for a list of entries, without holding all of them.
+
+    Args:
+        metadata_records (Iterable[dict]): EnviDat metadata record dictionaries,
+            for example from iter_metadata_with_resources().
+
+    Yields:
+        str: Chunks of DCAT-AP CH XML.
+    """
+    header, footer = _split_catalog_xml(True)
+    yield header
+    for metadata_record in metadata_records:
+        yield get_dcat_ap_dataset_xml(dcat_ap_convert_dataset(metadata_record))
+    yield footer
+
+
+def write_dcat_ap_catalog(
+    metadata_records: Iterable[dict],
+    output: IO,
+    encoding: str = "utf-8",
+    binary: bool | None = None,
+) -> int:
+    """Write a DCAT-AP catalog to a file-like object, one entry at a time.
+
+    Memory use does not depend on the number of entries.
+
+    Args:
+        metadata_records (Iterable[dict]): EnviDat metadata record dictionaries,
+            for example from iter_metadata_with_resources().
+        output (IO): Text or binary file-like object, such as an open file,
+            a gzip stream or an S3 multipart upload stream.
+        encoding (str): Encoding used if output is binary. Defaults to "utf-8".
+        binary (bool): Write bytes if True, else str.
+            Defaults to None, writing bytes only to binary io objects
+            (io.RawIOBase or io.BufferedIOBase), such as files opened with "wb",
+            gzip files and io.BytesIO. Pass True for other binary outputs.
+
+    Returns:
+        int: Number of datasets written.
+    """
+    if binary is None:
+        binary = isinstance(output, (io.RawIOBase, io.BufferedIOBase))
+    # Incremental, so encodings with a byte order mark only write it once
+    encoder = codecs.getincrementalencoder(encoding)()
+
+    count = -2  # Header and footer are not datasets
+    for chunk in iter_dcat_ap_catalog(metadata_records):
+        output.write(encoder.encode(chunk) if binary else chunk)
+        count += 1
+    if binary:
+        output.write(encoder.encode("", final=True))
+
+    log.info(f"Wrote DCAT-AP catalog of {count} datasets.")
+    return count
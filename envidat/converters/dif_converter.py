@@ -1,7 +1,6 @@
 """GCMD DIF 10.2 for identifying updates in metadata over time."""
 
 import copy
-import json
 import sys
 from collections import OrderedDict
 from logging import getLogger
@@ -9,6 +8,13 @@ from logging import getLogger
 from xmltodict import unparse
 
 from envidat.api.v1 import get_protocol_and_domain
+from envidat.converters.fields import (
+    as_parsed_record,
+    get_maintainer_name,
+    get_record_keywords,
+    load_json_field,
+    load_resource_json_field,
+)
 
 log = getLogger(__name__)
 
@@ -28,7 +34,7 @@ def convert_dif(metadata_record: dict) -> str:
     """
     try:
         converted_dict = dif_convert_dataset(
-            metadata_record
+            as_parsed_record(metadata_record)
         )  # Convert package to OrderedDict
         return unparse(converted_dict, pretty=True)  # Convert OrderedDict to XML
     except ValueError as e:
@@ -69,7 +75,7 @@ def dif_convert_dataset(dataset_dict: dict):
     # "Dataset_Creator" organization
     author_names = []
     try:
-        for author in json.loads(dataset_dict.get("author", "[]")):
+        for author in load_json_field(dataset_dict, "author", "[]"):
             author_name = ""
             if author.get("given_name"):
                 author_name += author["given_name"].strip() + " "
@@ -84,11 +90,7 @@ def dif_convert_dataset(dataset_dict: dict):
 
     # "Dataset_Editor" maintainer
     try:
-        maintainer = json.loads(dataset_dict.get("maintainer", "{}"))
-        maintainer_name = ""
-        if maintainer.get("given_name"):
-            maintainer_name += maintainer["given_name"].strip() + " "
-        maintainer_name += maintainer["name"]
+        maintainer_name = get_maintainer_name(dataset_dict)
         dif_metadata_dict["Dataset_Citation"][
             "Dataset_Editor"
         ] = maintainer_name.strip()
@@ -102,9 +104,8 @@ def dif_convert_dataset(dataset_dict: dict):
 
     # "Dataset_Series_Name"
     # "Dataset_Release_Date"
-    publication_year = json.loads(dataset_dict.get("publication", "{}")).get(
-        "publication_year", ""
-    )
+    publication = load_json_field(dataset_dict, "publication", "{}")
+    publication_year = publication.get("publication_year", "")
     dif_metadata_dict["Dataset_Citation"]["Dataset_Release_Date"] = publication_year
 
     # "Dataset_Release_Place"
@@ -114,7 +115,7 @@ def dif_convert_dataset(dataset_dict: dict):
 
     # "Dataset_Publisher"
     dif_metadata_dict["Dataset_Citation"]["Dataset_Publisher"] = (
-        json.loads(dataset_dict.get("publication", "{}")).get("publisher", "").strip()
+        publication.get("publisher", "").strip()
     )
 
     # "Version"
@@ -142,7 +143,7 @@ def dif_convert_dataset(dataset_dict: dict):
     dif_metadata_dict["Dataset_Citation"]["Online_Resource"] = package_url
 
     # "Personnel"
-    maintainer = json.loads(dataset_dict.get("maintainer", "{}"))
+    maintainer = load_json_field(dataset_dict, "maintainer", "{}")
     dif_metadata_dict["Personnel"] = OrderedDict()
     dif_metadata_dict["Personnel"]["Role"] = "TECHNICAL CONTACT"
     dif_metadata_dict["Personnel"]["Contact_Person"] = OrderedDict()
@@ -204,7 +205,7 @@ def dif_convert_dataset(dataset_dict: dict):
 
         # "Geometry" [1]
         try:
-            spatial = json.loads(dataset_dict.get("spatial", "{}"))
+            spatial = load_json_field(dataset_dict, "spatial", "{}")
         except ValueError:
             spatial = {}
         if spatial:
@@ -411,11 +412,7 @@ def dif_convert_dataset(dataset_dict: dict):
 
 def get_keywords(data_dict):
     """Extract keywords from tags."""
-    keywords = []
-    for tag in data_dict.get("tags", []):
-        name = tag.get("display_name", "").upper()
-        keywords += [name]
-    return keywords
+    return list(get_record_keywords(data_dict))
 
 
 def get_science_keywords(data_dict, extras_dict):
@@ -605,7 +602,9 @@ def get_resource_restrictions(dataset_dict):
     resource_restrictions = []
     for resource in dataset_dict.get("resources", []):
         try:
-            restricted = json.loads(resource.get("restricted"))
+            restricted = load_resource_json_field(
+                dataset_dict, resource, "restricted", None
+            )
         except ValueError:
             restricted = {}
         resource_restriction = restricted.get("level", "")
@@ -0,0 +1,185 @@
+"""Concurrent, cached resolution of related identifiers to DOIs."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import NoReturn
+
+from envidat.api.cache import DiskCache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DOI_TTL = 7 * 24 * 3600
+DEFAULT_NEGATIVE_TTL = 24 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class DOIResolver:
+    """Resolve words from related identifiers to DOIs with pluggable resolvers.
+
+    Each resolver extracts a key from a word, such as a DORA PID from a DORA URL,
+    and resolves the key to a DOI, usually with an API call. Keys of many words
+    are de-duplicated and resolved concurrently. Results are cached in memory,
+    and on disk if a store is set, including keys without a DOI. Keys whose
+    resolver raised an exception are not cached, so they are resolved again.
+
+    Usage:
+        resolver = DOIResolver()
+        resolver.register("dora", get_dora_pid, resolve_dora_doi_string)
+        dois = resolver.resolve_words(related_publications.split())
+    """
+
+    def __init__(
+        self,
+        store: DiskCache | None = None,
+        ttl: float = DEFAULT_DOI_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_workers: int = 8,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> NoReturn:
+        """Init the DOIResolver object.
+
+        Args:
+            store (DiskCache): Persistent store of results.
+                Defaults to None, only caching results in memory.
+            ttl (float): Seconds a resolved DOI is cached. Defaults to 7 days.
+            negative_ttl (float): Seconds a key without DOI is cached,
+                before resolving it again. Defaults to 1 day.
+            max_workers (int): Maximum number of concurrent lookups.
+            max_entries (int): Maximum number of results cached in memory,
+                the least recently used are removed first. Defaults to 100000.
+        """
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._resolvers = {}
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        extract: Callable[[str], str | None],
+        resolve: Callable[[str], str | None],
+    ) -> NoReturn:
+        """Add a resolver, tried after the resolvers already registered.
+
+        Args:
+            name (str): Resolver name, used in cache keys, e.g. "dora".
+            extract (Callable): Function getting the key to resolve from a word,
+                or None if the resolver does not apply to the word.
+            resolve (Callable): Function getting the DOI of a key,
+                or None if it has no DOI. Must raise an exception if the DOI
+                could not be looked up, e.g. on a failed request, so the
+                failure is not cached as a key without DOI.
+        """
+        self._resolvers[name] = (extract, resolve)
+
+    def _cached(self, cache_key: str) -> tuple[bool, str | None]:
+        """Get a cached result, as (<bool: found>, <str: DOI or None>)."""
+        now = time.time()
+        with self._lock:
+            entry = self._results.get(cache_key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._results.move_to_end(cache_key)
+                    return True, entry[1]
+                del self._results[cache_key]
+
+        if self.store is not None:
+            stored = self.store.get(cache_key)
+            if stored is not None and stored[1].get("expires", 0) > now:
+                doi = stored[0].decode("utf-8") or None
+                self._remember(cache_key, stored[1]["expires"], doi)
+                return True, doi
+
+        return False, None
+
+    def _remember(self, cache_key: str, expires: float, doi: str | None) -> NoReturn:
+        """Cache a result in memory, removing the least recently used if full."""
+        with self._lock:
+            self._results[cache_key] = (expires, doi)
+            self._results.move_to_end(cache_key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def _resolve(self, name: str, key: str) -> str | None:
+        """Resolve a key with a resolver and cache the result."""
+        _, resolve = self._resolvers[name]
+        try:
+            doi = resolve(key)
+        except Exception as e:
+            # Not cached, so the key is resolved again next time
+            log.error(f"Failed to resolve '{key}' with resolver '{name}': {e}")
+            return None
+
+        expires = time.time() + (self.ttl if doi else self.negative_ttl)
+        self._remember(f"{name}:{key}", expires, doi)
+        if self.store is not None:
+            self.store.set(
+                f"{name}:{key}", (doi or "").encode("utf-8"), {"expires": expires}
+            )
+        return doi
+
+    def resolve_words(self, words: Iterable[str]) -> dict[str, str | None]:
+        """Resolve words to DOIs, looking up keys not cached concurrently.
+
+        Args:
+            words (Iterable[str]): Words, e.g. from "related_publications"
+                of one or many records.
+
+        Returns:
+            dict: DOI of each word a resolver applies to, None if not resolved.
+                Words no resolver applies to are not included.
+        """
+        word_keys = {}
+        results = {}
+        for word in words:
+            if word in word_keys:
+                continue
+            keys = []
+            for name, (extract, _) in self._resolvers.items():
+                key = extract(word)
+                if key:
+                    keys.append((name, key))
+            if keys:
+                word_keys[word] = keys
+
+        to_resolve = set()
+        for keys in word_keys.values():
+            for name, key in keys:
+                found, doi = self._cached(f"{name}:{key}")
+                if found:
+                    results[(name, key)] = doi
+                else:
+                    to_resolve.add((name, key))
+
+        if to_resolve:
+            log.debug(f"Resolving {len(to_resolve)} related identifiers to DOIs.")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    name_key: executor.submit(self._resolve, *name_key)
+                    for name_key in to_resolve
+                }
+            results.update(
+                {name_key: future.result() for name_key, future in futures.items()}
+            )
+
+        # DOI from the first resolver that found one, as resolvers are tried in order
+        return {
+            word: next((results[key] for key in keys if results[key]), None)
+            for word, keys in word_keys.items()
+        }
+
+    def clear(self) -> NoReturn:
+        """Remove all cached results, in memory and on disk."""
+        with self._lock:
+            self._results.clear()
+        if self.store is not None:
+            self.store.clear()
+
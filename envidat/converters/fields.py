@@ -0,0 +1,264 @@
+"""Parsing of JSON string fields in EnviDat metadata records, shared by converters."""
+
+import json
+from collections.abc import Callable
+from typing import Any, NoReturn
+
+
+class ParsedRecord(dict):
+    """Metadata record dictionary that memoizes its parsed JSON string fields.
+
+    Behaves as a normal dictionary. Parsing a field with json_field() decodes the
+    JSON string on first use only, so several converters rendering the same
+    record share the parsed values. Errors are memoized too, and raised again
+    on each call. Setting or deleting a field discards its parsed value.
+
+    Note:
+        Parsed values are shared between callers and must not be modified.
+    """
+
+    __slots__ = ("_parsed", "_parsed_resources", "_derived")
+
+    def __init__(self, *args, **kwargs) -> NoReturn:
+        """Init the ParsedRecord object, with the same arguments as dict."""
+        super().__init__(*args, **kwargs)
+        self._parsed = {}
+        self._parsed_resources = {}
+        self._derived = {}
+
+    def json_field(self, field: str, default: Any = "{}") -> Any:
+        """Get a JSON string field, parsed.
+
+        Args:
+            field (str): Record key, e.g. "author".
+            default (Any): JSON string used if the field is missing.
+                Defaults to "{}".
+
+        Returns:
+            Any: Parsed value, as json.loads(record.get(field, default)).
+
+        Raises:
+            ValueError, TypeError: If the value is not a valid JSON string.
+        """
+        if field not in self:
+            return json.loads(default)
+        if field not in self._parsed:
+            self._parsed[field] = _parse(self[field])
+        return _result(self._parsed[field])
+
+    def resource_json_field(
+        self, resource: dict, field: str, default: Any = "{}"
+    ) -> Any:
+        """Get a JSON string field of one of the record resources, parsed.
+
+        Args:
+            resource (dict): Resource from the record "resources" list.
+            field (str): Resource key, e.g. "resource_size".
+            default (Any): JSON string used if the field is missing.
+                Defaults to "{}".
+
+        Returns:
+            Any: Parsed value, as json.loads(resource.get(field, default)).
+
+        Note:
+            Resources are matched by identity, changes made to a resource
+            in place after parsing are not detected.
+        """
+        if field not in resource:
+            return json.loads(default)
+        key = (id(resource), field)
+        entry = self._parsed_resources.get(key)
+        # Check identity, as ids may be reused if resources were replaced
+        if entry is None or entry[0] is not resource:
+            entry = (resource, _parse(resource[field]))
+            self._parsed_resources[key] = entry
+        return _result(entry[1])
+
+    def derived(self, key: str, compute: Callable[[dict], Any]) -> Any:
+        """Get a value derived from the record, computed on first use only.
+
+        Derived values are discarded when any field is changed, as they may
+        depend on several fields.
+
+        Args:
+            key (str): Name of the derived value, e.g. "keywords".
+            compute (Callable): Function taking the record, returning the value.
+
+        Returns:
+            Any: Derived value.
+        """
+        if key not in self._derived:
+            self._derived[key] = compute(self)
+        return self._derived[key]
+
+    def clear_parsed(self) -> NoReturn:
+        """Discard all parsed and derived values, keeping the fields."""
+        self._discard()
+
+    def __reduce__(self) -> tuple:
+        """Pickle as fields only, parsed values are not copied."""
+        return self.__class__, (dict(self),)
+
+    def _discard(self, key: Any = None) -> NoReturn:
+        """Discard parsed values for a key, or all if key is None."""
+        self._derived.clear()
+        if key is None:
+            self._parsed.clear()
+            self._parsed_resources.clear()
+        else:
+            self._parsed.pop(key, None)
+            if key == "resources":
+                self._parsed_resources.clear()
+
+    def __setitem__(self, key: Any, value: Any) -> NoReturn:
+        """Set a field, discarding its parsed value."""
+        self._discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> NoReturn:
+        """Delete a field, discarding its parsed value."""
+        self._discard(key)
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *args) -> Any:
+        """Remove a field, discarding its parsed value."""
+        self._discard(key)
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple:
+        """Remove the last field, discarding all parsed values."""
+        self._discard()
+        return super().popitem()
+
+    def clear(self) -> NoReturn:
+        """Remove all fields and parsed values."""
+        self._discard()
+        super().clear()
+
+    def update(self, *args, **kwargs) -> NoReturn:
+        """Update fields, discarding all parsed values."""
+        self._discard()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Set a field if missing, discarding its parsed value."""
+        self._discard(key)
+        return super().setdefault(key, default)
+
+    def __ior__(self, other: Any) -> "ParsedRecord":
+        """Update fields with |=, discarding all parsed values."""
+        self._discard()
+        return super().__ior__(other)
+
+
+def _parse(value: Any) -> tuple[bool, Any]:
+    """Parse a JSON string, returning (True, value) or (False, exception)."""
+    try:
+        return True, json.loads(value)
+    except (TypeError, ValueError) as e:
+        return False, e
+
+
+def _result(outcome: tuple[bool, Any]) -> Any:
+    """Return a parsed value, or raise the parsing exception."""
+    is_parsed, value = outcome
+    if not is_parsed:
+        raise value.with_traceback(None)
+    return value
+
+
+def as_parsed_record(record: dict) -> ParsedRecord:
+    """Get a record as ParsedRecord, wrapping it only if it is not one already.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+
+    Returns:
+        ParsedRecord: The record.
+    """
+    if isinstance(record, ParsedRecord):
+        return record
+    return ParsedRecord(record)
+
+
+def load_json_field(record: dict, field: str, default: Any = "{}") -> Any:
+    """Parse a JSON string field of a record, memoized if it is a ParsedRecord.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+        field (str): Record key, e.g. "author".
+        default (Any): JSON string used if the field is missing.
+            Defaults to "{}".
+
+    Returns:
+        Any: Parsed value, as json.loads(record.get(field, default)).
+    """
+    if isinstance(record, ParsedRecord):
+        return record.json_field(field, default)
+    return json.loads(record.get(field, default))
+
+
+def load_resource_json_field(
+    record: dict, resource: dict, field: str, default: Any = "{}"
+) -> Any:
+    """Parse a JSON string field of a record resource, memoized if a ParsedRecord.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+        resource (dict): Resource from the record "resources" list.
+        field (str): Resource key, e.g. "resource_size".
+        default (Any): JSON string used if the field is missing.
+            Defaults to "{}".
+
+    Returns:
+        Any: Parsed value, as json.loads(resource.get(field, default)).
+    """
+    if isinstance(record, ParsedRecord):
+        return record.resource_json_field(resource, field, default)
+    return json.loads(resource.get(field, default))
+
+
+def _keywords(record: dict) -> list[str]:
+    """Upper case tag names of a record."""
+    return [tag.get("display_name", "").upper() for tag in record.get("tags", [])]
+
+
+def _maintainer_name(record: dict) -> str:
+    """Maintainer given name and name of a record."""
+    maintainer = load_json_field(record, "maintainer", "{}")
+    maintainer_name = ""
+    if maintainer.get("given_name"):
+        maintainer_name += maintainer["given_name"].strip() + " "
+    return maintainer_name + maintainer["name"]
+
+
+def get_record_keywords(record: dict) -> list[str]:
+    """Get keywords of a record, from upper case tag names.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+
+    Returns:
+        list[str]: Keywords, shared between callers if record is a ParsedRecord.
+    """
+    if isinstance(record, ParsedRecord):
+        return record.derived("keywords", _keywords)
+    return _keywords(record)
+
+
+def get_maintainer_name(record: dict) -> str:
+    """Get full name of the maintainer of a record, as "<given_name> <name>".
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+
+    Returns:
+        str: Maintainer name.
+
+    Raises:
+        ValueError: If the maintainer field is not valid JSON.
+        KeyError: If the maintainer has no name.
+    """
+    if isinstance(record, ParsedRecord):
+        return record.derived("maintainer_name", _maintainer_name)
+    return _maintainer_name(record)
@@ -2,15 +2,20 @@
 
 import collections
 import copy
-import json
 import string
 from logging import getLogger
 from urllib.parse import urlparse
 
-from dateutil.parser import parse
 from xmltodict import unparse
 
 from envidat.api.v1 import get_protocol_and_domain
+from envidat.converters.fields import (
+    as_parsed_record,
+    get_maintainer_name,
+    get_record_keywords,
+    load_json_field,
+)
+from envidat.utils import parse_date
 
 log = getLogger(__name__)
 
@@ -30,7 +35,7 @@ def convert_iso(metadata_record: dict) -> str:
     """
     try:
         converted_dict = iso_convert_dataset(
-            metadata_record
+            as_parsed_record(metadata_record)
         )  # Convert package dictionary to OrderedDict
         return unparse(converted_dict, pretty=True)  # Convert OrderedDict to XML
     except ValueError as e:
@@ -94,11 +99,8 @@ def iso_convert_dataset(dataset_dict: dict):
     }
 
     # Point of Contact (M)
-    maintainer = json.loads(dataset_dict.get("maintainer", "{}"))
-    maintainer_name = ""
-    if maintainer.get("given_name"):
-        maintainer_name += maintainer["given_name"].strip() + " "
-    maintainer_name += maintainer["name"]
+    maintainer = load_json_field(dataset_dict, "maintainer", "{}")
+    maintainer_name = get_maintainer_name(dataset_dict)
 
     responsible_party_contact = collections.OrderedDict()
 
@@ -151,7 +153,7 @@ def iso_convert_dataset(dataset_dict: dict):
     }
 
     # Metadata Creation Date (M)
-    metadata_created = parse(dataset_dict.get("metadata_created", "")).strftime(
+    metadata_created = parse_date(dataset_dict.get("metadata_created", "")).strftime(
         "%Y-%m-%dT%H:%M:%S"
     )
     md_metadata_dict["gmd:dateStamp"] = {"gco:DateTime": {"#text": metadata_created}}
@@ -327,7 +329,7 @@ def iso_convert_dataset(dataset_dict: dict):
     # temporal extent
     dates = []
     try:
-        dates = json.loads(dataset_dict.get("date", "[]"))
+        dates = load_json_field(dataset_dict, "date", "[]")
     except ValueError:
         dates = []
     gml_id_index = 0
@@ -358,7 +360,7 @@ def iso_convert_dataset(dataset_dict: dict):
 
     # geographic extent
     try:
-        spatial = json.loads(dataset_dict.get("spatial", "{}"))
+        spatial = load_json_field(dataset_dict, "spatial", "{}")
     except ValueError:
         spatial = {}
     if spatial:
@@ -564,17 +566,17 @@ def get_publication_date(data_dict: dict) -> str:
     """
     publication_date = ""
     try:
-        dates = json.loads(data_dict.get("date", "[]"))
+        dates = load_json_field(data_dict, "date", "[]")
     except ValueError:
         dates = []
     for date in dates:
         if date.get("date_type") == "available":
-            publication_date = parse(date.get("date")).strftime("%Y-%m-%d")
+            publication_date = parse_date(date.get("date")).strftime("%Y-%m-%d")
     if not publication_date:
-        publication = json.loads(data_dict.get("publication", "{}"))
-        publication_date = parse(publication["publication_year"] + "-12-31").strftime(
-            "%Y-%m-%d"
-        )
+        publication = load_json_field(data_dict, "publication", "{}")
+        publication_date = parse_date(
+            publication["publication_year"] + "-12-31"
+        ).strftime("%Y-%m-%d")
     return publication_date
 
 
@@ -593,11 +595,9 @@ def cap_code(text: str) -> str:
 
 def get_keywords(data_dict: dict) -> str:
     """Extract keywords from tags."""
-    keywords = []
-    for tag in data_dict.get("tags", []):
-        name = tag.get("display_name", "").upper()
-        keywords += [{"gco:CharacterString": name}]
-    return keywords
+    return [
+        {"gco:CharacterString": name} for name in get_record_keywords(data_dict)
+    ]
 
 
 def is_a_box(coordinates: list) -> bool:
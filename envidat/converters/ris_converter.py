@@ -1,9 +1,9 @@
 """Council information system (RIS) of the municipal council of Zurich."""
 
-import json
 from logging import getLogger
 
 from envidat.api.v1 import get_protocol_and_domain
+from envidat.converters.fields import get_record_keywords, load_json_field
 
 log = getLogger(__name__)
 
@@ -41,7 +41,7 @@ def ris_convert_dataset(dataset_dict: dict) -> str:
     ris_list += ["T1  - " + title]
 
     #   AU  - Authors
-    authors = json.loads(dataset_dict.get("author", "[]"))
+    authors = load_json_field(dataset_dict, "author", "[]")
     for author in authors:
         author_name = author["name"].strip()
         if author.get("given_name"):
@@ -65,7 +65,7 @@ def ris_convert_dataset(dataset_dict: dict) -> str:
         ris_list += ["KW  - " + keyword]
 
     #   PY  - publication year
-    publication = json.loads(dataset_dict.get("publication", "{}"))
+    publication = load_json_field(dataset_dict, "publication", "{}")
     publication_year = publication["publication_year"]
     ris_list += ["PY  - " + publication_year]
 
@@ -87,8 +87,4 @@ def ris_convert_dataset(dataset_dict: dict) -> str:
 
 def get_keywords(data_dict: dict):
     """Extract keywords from tags."""
-    keywords = []
-    for tag in data_dict.get("tags", []):
-        name = tag.get("display_name", "").upper()
-        keywords += [name]
-    return keywords
+    return list(get_record_keywords(data_dict))
@@ -2,16 +2,12 @@ import base64
 import json
 from logging import getLogger
 
-import requests
-
 from envidat.converters.datacite_converter import convert_datacite
-from envidat.utils import load_dotenv_if_in_debug_mode
+from envidat.session import get_session
+from envidat.settings import get_settings
 
 log = getLogger(__name__)
 
-# Load config from environment variables
-load_dotenv_if_in_debug_mode()
-
 
 # TODO review if DOIs should continue to be reserved in CKAN database!!!!
 
@@ -39,13 +35,13 @@ def reserve_draft_doi_datacite(metadata_record: dict) -> str | None:
         str|None: DOI reserved in DataCite or None if DOI reservation failed
     """
     # Extract variables from config needed to call DataCite API
-    try:
-        api_url = os.environ("DATACITE_API_URL")
-        client_id = os.environ("DATACITE_CLIENT_ID")
-        password = os.envion("DATACITE_PASSWORD")
-        doi_prefix = os.environ("DOI_PREFIX")
-    except KeyError as e:
-        log.error(f"KeyError: {e} does not exist in config")
+    settings = get_settings()
+    api_url = settings.datacite_api_url
+    client_id = settings.datacite_client_id
+    password = settings.datacite_password
+    doi_prefix = settings.doi_prefix
+    if None in (api_url, client_id, password, doi_prefix):
+        log.error("DataCite API variables do not exist in config")
         return None
 
     payload = {"data": {"type": "dois"}}
@@ -63,7 +59,7 @@ def reserve_draft_doi_datacite(metadata_record: dict) -> str | None:
     payload_json = json.dumps(payload)
     headers = {"Content-Type": "application/vnd.api+json"}
 
-    r = requests.post(
+    r = get_session().post(
         api_url, headers=headers, auth=(client_id, password), data=payload_json
     )
 
@@ -107,13 +103,13 @@ def publish_datacite(metadata_record: dict, is_update=False) -> dict | None:
         str/None: DOI reserved in DataCite or None if DOI reservation failed
     """
     # Extract variables from config needed to call DataCite API
-    try:
-        api_url = os.environ("DATACITE_API_URL")
-        client_id = os.enviro("DATACITE_CLIENT_ID")
-        password = os.environ("DATACITE_PASSWORD")
-        site_url = os.environ("SITE_DATASET_URL")
-    except KeyError as e:
-        log.error(f"KeyError: {e} does not exist in config")
+    settings = get_settings()
+    api_url = settings.datacite_api_url
+    client_id = settings.datacite_client_id
+    password = settings.datacite_password
+    site_url = settings.site_dataset_url
+    if None in (api_url, client_id, password, site_url):
+        log.error("DataCite API variables do not exist in config")
         return None
 
     # Get DOI
@@ -156,12 +152,12 @@ def publish_datacite(metadata_record: dict, is_update=False) -> dict | None:
     # If is_update is True update DOI that is already registered
     if is_update:
         api_url = f"{api_url}/{doi}"
-        r = requests.put(
+        r = get_session().put(
             api_url, headers=headers, auth=(client_id, password), data=payload_json
         )
     # Else create new DOI
     else:
-        r = requests.post(
+        r = get_session().post(
             api_url, headers=headers, auth=(client_id, password), data=payload_json
         )
 
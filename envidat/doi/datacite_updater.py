@@ -3,11 +3,11 @@ import logging
 # Setup logging
 from logging import getLogger
 
-import requests
-
-from envidat.api.v1 import get_envidat_record
+from envidat.api.v1 import get_envidat_record, get_packages, iter_package_fields
+from envidat.converters.datacite_converter import prefetch_related_identifier_dois
 from envidat.doi.datacite_publisher import publish_datacite
-from envidat.utils import get_response_json
+from envidat.session import get_session
+from envidat.settings import get_settings
 
 log = getLogger(__name__)
 log.setLevel(level=logging.INFO)
@@ -22,9 +22,6 @@ fileHandler.setFormatter(logFileFormatter)
 fileHandler.setLevel(level=logging.INFO)
 log.addHandler(fileHandler)
 
-# Load config from environment variables
-load_dotenv_if_in_debug_mode()
-
 
 def datacite_update_all_records():
     """Updates existing DOIs for all EnviDat records on DataCite.
@@ -70,7 +67,7 @@ def datacite_update_all_records():
     return
 
 
-def datacite_update_records(record_names: list[str]):
+def datacite_update_records(record_names: list[str], max_workers: int = 8):
     """Updates existing DOIs for EnviDat records on DataCite.
 
     ASSUMPTION: Records already exist on DataCite and should be updated.
@@ -89,11 +86,23 @@ def datacite_update_records(record_names: list[str]):
     Args:
         record_names (list[str]): List of EnviDat records names that should be
             updated. Example: ["mountland-jura", "envidat-lwf-51"]
+        max_workers (int): Maximum number of concurrent requests used to get
+            the EnviDat records from CKAN API. Default value is 8.
     """
+    # Get all EnviDat records from CKAN API concurrently
+    envidat_records = get_packages(record_names, max_workers=max_workers)
+
+    # Resolve DOIs of related identifiers of all records at once
+    prefetch_related_identifier_dois(
+        envidat_record["result"]
+        for envidat_record in envidat_records.values()
+        if envidat_record.get("status_code") == 200
+    )
+
     # Update DOIs in DataCite for EnviDat record_names
-    for name in record_names:
+    for name, envidat_record in envidat_records.items():
 
-        dc_response = datacite_update_one_record(name)
+        dc_response = datacite_update_one_record(name, envidat_record=envidat_record)
 
         # Log successful update
         # Unsuccessful update error messages logged
@@ -105,7 +114,9 @@ def datacite_update_records(record_names: list[str]):
     return
 
 
-def datacite_update_one_record(name: str, dc_dois: list[str] = None) -> dict | None:
+def datacite_update_one_record(
+    name: str, dc_dois: list[str] = None, envidat_record: dict | None = None
+) -> dict | None:
     """Updates existing DOI for one EnviDat record on DataCite.
 
     ASSUMPTION: Record already exists on DataCite and should be updated.
@@ -130,6 +141,10 @@ def datacite_update_one_record(name: str, dc_dois: list[str] = None) -> dict | N
           This arg is used during update of
           all records in datacite_update_all_records()
           Default value is None.
+        envidat_record (dict | None): EnviDat record already retrieved from CKAN
+          API, with "status_code" and "result" keys as returned by
+          get_envidat_record(). If None then the record is retrieved.
+          Default value is None.
 
     Returns:
         dict/None: Returns dictionary with DataCite response data.
@@ -137,7 +152,8 @@ def datacite_update_one_record(name: str, dc_dois: list[str] = None) -> dict | N
     """
     try:
         # Get EnviDat record from CKAN API
-        envidat_record = get_envidat_record(name)
+        if envidat_record is None:
+            envidat_record = get_envidat_record(name)
 
         # Extract result from record
         result = envidat_record.get("result")
@@ -216,11 +232,11 @@ def get_dc_dois(num_records: int = 10000) -> list[str] | None:
     """
     # Extract variables from config needed to call DataCite API
     # NOTE: List of DOIs should not be obtained from DataCite "test" API
-    try:
-        api_url = os.environ("DOI_API_URL")
-        prefix = os.environ("DOI_PREFIX")
-    except KeyError as e:
-        log.error(f"KeyError: {e} does not exist in config")
+    settings = get_settings()
+    api_url = settings.doi_api_url
+    prefix = settings.doi_prefix
+    if None in (api_url, prefix):
+        log.error("DataCite API variables do not exist in config")
         return None
 
     # Add prefix query param to url
@@ -228,7 +244,7 @@ def get_dc_dois(num_records: int = 10000) -> list[str] | None:
     api_url = f"{api_url}?prefix={prefix}&page[size]={num_records}"
 
     # Call API
-    r = requests.get(api_url)
+    r = get_session().get(api_url)
 
     # Return DOIs is successful
     if r.status_code == 200:
@@ -263,19 +279,17 @@ def get_published_record_names_with_dois() -> list[dict] | None:
     """
     err_message = "Failed to get names of published records with DOIs."
 
-    # Get JSON response from call to CKAN
-    # "API_CURRENT_PACKAGE_LIST_WITH_RESOURCES" endpoint
-    response_json = get_response_json(
-        api_host="API_HOST",
-        api_path="API_CURRENT_PACKAGE_LIST_WITH_RESOURCES",
-        query={"limit": 100000},
-    )
+    # Get only the needed fields of all records from CKAN package search
+    try:
+        records = list(iter_package_fields(("name", "doi", "publication_state")))
+    except AttributeError as e:
+        log.error(e)
+        records = None
 
     # Extract and return record names from records that have a DOI and are
     # published
-    if response_json:
+    if records is not None:
 
-        records = response_json["result"]
         if records:
             published_records = []
 
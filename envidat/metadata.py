@@ -2,22 +2,140 @@
 
 import json
 import logging
-from typing import Literal, NoReturn, Union
-
-from envidat.api.v1 import (
-    get_metadata_list_with_resources,
-    get_package,
+import multiprocessing
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal, NoReturn, Union
+
+from envidat import converters
+from envidat.api.snapshot import CatalogueSnapshot
+from envidat.api.sources import RecordSource, get_record_source
+from envidat.api.v1 import iter_metadata_with_resources
+from envidat.converters import (
+    get_converter,
+    get_converter_formats,
+    register_converter,
 )
-from envidat.converters.bibtex_converter import convert_bibtex
-from envidat.converters.datacite_converter import convert_datacite
-from envidat.converters.dcat_ap_converter import convert_dcat_ap
-from envidat.converters.dif_converter import convert_dif
-from envidat.converters.iso_converter import convert_iso
-from envidat.converters.ris_converter import convert_ris
-from envidat.converters.xml_converter import convert_xml
+from envidat.converters.cache import enable_conversion_cache, get_conversion_cache
+from envidat.converters.fields import ParsedRecord
+from envidat.settings import get_settings
+from envidat.validation import REQUIRED_FIELDS, validate_record
 
 log = logging.getLogger(__name__)
 
+# Formats that Record.render() can convert to
+RENDER_FORMATS = ("xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap")
+
+# Top level string fields with values repeated across records
+COMPACT_INTERNED_FIELDS = frozenset(
+    (
+        "creator_user_id",
+        "license_id",
+        "license_title",
+        "license_url",
+        "owner_org",
+        "publication_state",
+        "resource_type",
+        "resource_type_general",
+        "state",
+        "type",
+        "language",
+    )
+)
+
+# Fields of nested dictionaries kept in compact mode, others are not converted
+COMPACT_NESTED_FIELDS = {
+    "organization": frozenset(("id", "name", "title")),
+    "groups": frozenset(("id", "name", "title", "display_name")),
+    "tags": frozenset(("display_name", "name")),
+    "resources": frozenset(
+        (
+            "id",
+            "name",
+            "description",
+            "url",
+            "doi",
+            "format",
+            "mimetype",
+            "mimetype_inner",
+            "resource_type",
+            "size",
+            "resource_size",
+            "restricted",
+            "created",
+            "last_modified",
+            "metadata_modified",
+        )
+    ),
+}
+
+# Nested fields with values repeated across records, such as formats
+COMPACT_INTERNED_NESTED_FIELDS = frozenset(
+    (
+        "display_name",
+        "format",
+        "mimetype",
+        "mimetype_inner",
+        "resource_type",
+        "restricted",
+    )
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value, returning other values unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _compact_nested(value: dict, fields: frozenset) -> dict:
+    """Keep only the given fields of a nested dictionary, with interned keys."""
+    return {
+        sys.intern(key): (
+            _intern(item) if key in COMPACT_INTERNED_NESTED_FIELDS else item
+        )
+        for key, item in value.items()
+        if key in fields
+    }
+
+
+def compact_record(record: dict) -> dict:
+    """Reduce the memory used by a metadata record, for large in-memory catalogues.
+
+    Keys and repeated values, such as license ids, organization names, formats
+    and tag names, are interned so all records share one copy. Nested
+    organization, groups, tags and resources only keep the fields used by
+    the converters. Top level fields are all kept.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+
+    Returns:
+        dict: Compacted copy of the record.
+    """
+    compacted = {}
+    for key, value in record.items():
+        key = sys.intern(key)
+        nested_fields = COMPACT_NESTED_FIELDS.get(key)
+
+        if nested_fields is not None and isinstance(value, dict):
+            value = _compact_nested(value, nested_fields)
+        elif nested_fields is not None and isinstance(value, list):
+            value = [
+                _compact_nested(item, nested_fields) if isinstance(item, dict) else item
+                for item in value
+            ]
+        elif key in COMPACT_INTERNED_FIELDS:
+            value = _intern(value)
+
+        compacted[key] = value
+    return compacted
+
 
 def validate_json(json_data):
     """Test if JSON parses and is valid."""
@@ -32,6 +150,7 @@ class Record:
     """Class manipulate an EnviDat record in various ways."""
 
     content = None
+    compact = False
 
     def __init__(
         self,
@@ -39,6 +158,8 @@ class Record:
         convert: Literal[
             "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
         ] = None,
+        compact: bool = False,
+        source: RecordSource | None = None,
     ) -> NoReturn:
         """Init the Record object.
 
@@ -46,26 +167,44 @@ class Record:
 
         Args:
             input_data ([str, dict]): Data input, in JSON or dict form.
-                Can also accept a package name to extract a record from the API.
+                Can also accept a package name or id, to get the record from
+                the source.
             convert (str):
                 Options: Convert the content immediately to specified type.
                     "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
-
+            compact (bool): Reduce memory used by the content, for holding many
+                records in memory. See compact_record. Parsed values are not
+                kept after converting or validating. Defaults to False.
+                Note: XML output does not include the removed nested fields.
+            source (RecordSource): Source of the package, if input_data is a
+                package name. Defaults to None, using get_record_source(),
+                the EnviDat API unless set with set_record_source().
+
+        Raises:
+            KeyError: If the package name is not found in the source.
         """
+        self.compact = compact
+
         if isinstance(input_data, dict):
             # Is dict
             log.debug("Dictionary input provided, reading as JSON")
-            self.content = input_data
+            self.content = ParsedRecord(input_data)
 
         elif isinstance(input_data, str):
             if validate_json(input_data):
                 # Is JSON String, parse to JSON object/dict
                 log.debug("Valid input JSON parsed")
-                self.content = json.loads(input_data)
+                self.content = ParsedRecord(json.loads(input_data))
             else:
-                # Get from API (JSON object/dict)
-                log.debug("Attempting to get package JSON from API")
-                self.content = dict(get_package(input_data))
+                # Get from API or local source (JSON object/dict)
+                if source is None:
+                    source = get_record_source()
+                source_name = type(source).__name__
+                log.debug(f"Attempting to get package JSON from {source_name}")
+                package = source.get(input_data)
+                if package is None:
+                    raise KeyError(f"Package not found in record source: {input_data}")
+                self.content = ParsedRecord(package)
 
         else:
             log.error("Input is not a valid type from (str,dict)")
@@ -74,18 +213,83 @@ class Record:
         # Validate metadata record
         self.validate()
 
+        if compact:
+            self.content = ParsedRecord(compact_record(self.content))
+
         if convert:
-            mapping = {
-                "json": self.to_json,
-                "xml": self.to_xml,
-                "iso": self.to_iso,
-                "bibtex": self.to_bibtex,
-                "dif": self.to_dif,
-                "datacite": self.to_datacite,
-                "ris": self.to_ris,
-                "dcat-ap": self.to_dcat_ap,
-            }
-            self.content = mapping[convert]()
+            self.content = self._render(convert)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: Union[CatalogueSnapshot, Path, str],
+        key: str,
+        convert: Literal[
+            "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+        ] = None,
+        compact: bool = False,
+    ) -> "Record":
+        """Init a Record from a local catalogue snapshot, without calling the API.
+
+        Args:
+            snapshot (Union[CatalogueSnapshot, Path, str]): Snapshot, or path
+                of the snapshot JSON Lines file.
+            key (str): Package name, id or DOI.
+            convert (str): Convert the content immediately to specified type.
+                See Record.__init__ for options.
+            compact (bool): Reduce memory used by the content.
+                See Record.__init__.
+
+        Returns:
+            Record: Record of the package.
+        """
+        if not isinstance(snapshot, CatalogueSnapshot):
+            snapshot = CatalogueSnapshot(snapshot)
+        return cls(snapshot[key], convert=convert, compact=compact)
+
+    def _converters(self) -> dict:
+        """Mapping of format name to conversion method."""
+        return {
+            "json": self.to_json,
+            "xml": self.to_xml,
+            "iso": self.to_iso,
+            "bibtex": self.to_bibtex,
+            "dif": self.to_dif,
+            "datacite": self.to_datacite,
+            "ris": self.to_ris,
+            "dcat-ap": self.to_dcat_ap,
+        }
+
+    def _render(self, file_format: str) -> str:
+        """Convert content to a built in or registered format."""
+        method = self._converters().get(file_format)
+        if method is not None:
+            return method()
+        return self._convert(file_format)
+
+    def render(self, formats: Iterable[str] | None = None) -> dict[str, str]:
+        """Convert content to several formats in one call.
+
+        Content is not replaced. Parsed fields and values derived from them,
+        such as keywords and maintainer name, are computed once and shared by
+        all converters, unless the Record is compact.
+
+        Args:
+            formats (Iterable[str]): Formats to convert to, from
+                "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap",
+                or formats added with envidat.converters.register_converter.
+                Defaults to None, converting to the built in formats.
+
+        Returns:
+            dict: Converted strings, with format names as keys, in request order.
+        """
+        formats = RENDER_FORMATS if formats is None else tuple(formats)
+
+        unknown_formats = set(formats) - set(get_converter_formats())
+        if unknown_formats:
+            raise ValueError(f"Cannot render unknown formats: {unknown_formats}")
+
+        return {file_format: self._render(file_format) for file_format in formats}
 
     def get_content(self):
         """Get current content of Record.
@@ -95,58 +299,32 @@ class Record:
         """
         return self.content
 
-    def validate(self) -> bool:
+    @property
+    def parsed(self) -> ParsedRecord:
+        """Content as a ParsedRecord, memoizing its parsed JSON string fields.
+
+        All converters called via this Record share the parsed fields, so each
+        field is only decoded once. If content was replaced with a dictionary,
+        it is wrapped as a ParsedRecord first.
+
+        Returns:
+            ParsedRecord: Metadata record dictionary.
+        """
+        if not isinstance(self.content, ParsedRecord):
+            self.content = ParsedRecord(self.content)
+        return self.content
+
+    def validate(self, deep: bool = False) -> bool:
         """Validate metadata record.
 
+        Args:
+            deep (bool): Also check the structure of the record, see
+                envidat.validation.validate_record. Defaults to False,
+                only checking required fields are present.
+
         Returns:
             bool: True if valid, raises error if not.
         """
-        metadata_keys = [
-            "author",
-            "author_email",
-            "creator_user_id",
-            "date",
-            "doi",
-            # "extras", NOT ALWAYS PRESENT
-            "funding",
-            "id",
-            "isopen",
-            # "language", NOT ALWAYS PRESENT
-            "license_id",
-            "license_title",
-            # "license_url", NOT ALWAYS PRESENT
-            "maintainer",
-            "maintainer_email",
-            "metadata_created",
-            "metadata_modified",
-            "name",
-            "notes",
-            "num_resources",
-            "num_tags",
-            "organization",
-            "owner_org",
-            "private",
-            "publication",
-            "publication_state",
-            # "related_datasets", NOT ALWAYS PRESENT
-            "related_publications",
-            "resource_type",
-            "resource_type_general",
-            "spatial",
-            "spatial_info",
-            "state",
-            "subtitle",
-            "title",
-            "type",
-            "url",
-            "version",
-            "resources",
-            "tags",
-            "groups",
-            "relationships_as_subject",
-            "relationships_as_object",
-        ]
-
         if not isinstance(self.content, dict):
             log.error(f"Content is not a valid dictionary of metadata: {self.content}")
             raise ValueError("Content is not a valid dictionary of metadata.")
@@ -154,16 +332,51 @@ class Record:
         package_name = self.content.get("name", "No name present")
         log.debug(f"Validating metadata record: {package_name}")
 
-        missing_keys = list(set(metadata_keys) - set(self.content.keys()))
-        if missing_keys:
+        if not REQUIRED_FIELDS.issubset(self.content.keys()):
+            missing_keys = list(REQUIRED_FIELDS.difference(self.content.keys()))
             log.error(f"Metadata entry is missing fields: {missing_keys}")
             raise ValueError(
                 "Content does not have all required fields for a metadata entry. "
                 f"Missing: {missing_keys}"
             )
 
+        if deep:
+            errors = validate_record(self.parsed)
+            self._release_parsed()
+            if errors:
+                log.error(f"Metadata entry {package_name} is not valid: {errors}")
+                raise ValueError(f"Content is not a valid metadata entry: {errors}")
+
         return True
 
+    def _release_parsed(self) -> NoReturn:
+        """Discard parsed values in compact mode, so they are not kept in memory."""
+        if self.compact and isinstance(self.content, ParsedRecord):
+            self.content.clear_parsed()
+
+    def _convert(self, file_format: str) -> str:
+        """Convert content, through the conversion cache if enabled.
+
+        The converter is looked up with envidat.converters.get_converter.
+        See envidat.converters.cache.enable_conversion_cache.
+        In compact mode, parsed values are discarded after converting.
+        """
+        converter = get_converter(file_format)
+        cache = get_conversion_cache()
+        try:
+            if cache is None:
+                return converter(self.parsed)
+
+            # Compact content can convert differently, so it is cached separately
+            output = cache.get(self.parsed, file_format, compact=self.compact)
+            if output is None:
+                output = converter(self.parsed)
+                if output is not None:
+                    cache.set(self.parsed, file_format, output, compact=self.compact)
+            return output
+        finally:
+            self._release_parsed()
+
     def to_json(self) -> str:
         """Convert content to JSON string.
 
@@ -178,7 +391,7 @@ class Record:
         Returns:
             str: XML formatted string of metadata record.
         """
-        return convert_xml(self.content)
+        return self._convert("xml")
 
     def to_iso(self) -> str:
         """Convert content to ISO format.
@@ -186,7 +399,7 @@ class Record:
         Returns:
             str: ISO formatted string of metadata record.
         """
-        return convert_iso(self.content)
+        return self._convert("iso")
 
     def to_ris(self) -> str:
         """Convert content to RIS format.
@@ -194,7 +407,7 @@ class Record:
         Returns:
             str: RIS formatted string of metadata record.
         """
-        return convert_ris(self.content)
+        return self._convert("ris")
 
     def to_bibtex(self) -> str:
         """Convert content to BibTeX format.
@@ -202,7 +415,7 @@ class Record:
         Returns:
             str: BibTeX formatted string of metadata record.
         """
-        return convert_bibtex(self.content)
+        return self._convert("bibtex")
 
     def to_dif(self) -> str:
         """Convert content to GCMD DIF 10.2 format.
@@ -210,7 +423,7 @@ class Record:
         Returns:
             str: GCMD DIF 10.2 formatted string of metadata record.
         """
-        return convert_dif(self.content)
+        return self._convert("dif")
 
     def to_datacite(self) -> str:
         """Convert content to DataCite format.
@@ -218,7 +431,7 @@ class Record:
         Returns:
             str: DataCite formatted string of metadata record.
         """
-        return convert_datacite(self.content)
+        return self._convert("datacite")
 
     def to_dcat_ap(self) -> str:
         """Convert content to DCAT-AP CH format.
@@ -226,7 +439,7 @@ class Record:
         Returns:
             str: DCAT-AP CH formatted string of metadata record.
         """
-        return convert_dcat_ap(self.content)
+        return self._convert("dcat-ap")
 
 
 # TODO implement error handling
@@ -235,50 +448,318 @@ def get_all_metadata_record_list(
         "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
     ] = None,
     content_only: bool = False,
+    page_size: int = 100,
+    workers: int | None = None,
+    chunksize: int = 8,
 ) -> Union[list, str]:
     """Return all EnviDat metadata entries as Record objects.
 
     Defaults to standard Record, content in json format.
 
+    Note:
+        Entries are paged from the API package search, see
+        iter_metadata_with_resources, so they are ordered by package id.
+        Before, they were requested at once from
+        current_package_list_with_resources, ordered by "metadata_modified".
+        Sort the returned list if a particular order is required.
+
     Args:
         convert (str): Convert the content immediately to specified type.
             Options: "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
         content_only (bool): Extract content from Record objects.
+        page_size (int): Number of metadata entries requested per API call.
+        workers (int): Number of processes converting entries in parallel.
+            Defaults to None, converting in the current process.
+            Not used for "dcat-ap".
+        chunksize (int): Number of entries sent to a process at once.
 
     Returns:
         (list, string): Of Record entries for EnviDat metadata.
             Note: returns a string in the case of a single metadata entry
             and content_only is set to True.
     """
-    metadata = get_metadata_list_with_resources()
+    metadata = iter_metadata_with_resources(page_size=page_size)
 
     # DCAT-AP special case, return as single XML
     if convert == "dcat-ap":
         loaded_metadata = [Record(entry).content for entry in metadata]
-        return convert_dcat_ap(loaded_metadata)
+        return get_converter("dcat-ap")(loaded_metadata)
 
     record_list = []
 
-    for metadata_entry in metadata:
-        record = Record(metadata_entry)
-
-        if convert:
-            mapping = {
-                "json": record.to_json,
-                "xml": record.to_xml,
-                "iso": record.to_iso,
-                "bibtex": record.to_bibtex,
-                "dif": record.to_dif,
-                "datacite": record.to_datacite,
-                "ris": record.to_ris,
-                # dcat-ap handled separately above
-            }
-
-            record.content = mapping[convert]()
-
+    records = _iter_records(metadata, convert, workers=workers, chunksize=chunksize)
+    for _, record in records:
         if content_only:
             record_list.append(record.content)
         else:
             record_list.append(record)
 
     return record_list
+
+
+def iter_metadata_records(
+    convert: Literal[
+        "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+    ] = None,
+    packages: Iterable[dict] | None = None,
+    page_size: int = 100,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[tuple[str, Union[Record, str]]]:
+    """Iterate over all EnviDat metadata entries, converting one at a time.
+
+    Only one entry is held in memory at a time, so converted outputs can be
+    written to disk or S3 as they are yielded, for any catalogue size.
+    Entries from the API are ordered by package id, see
+    iter_metadata_with_resources.
+
+    Args:
+        convert (str): Convert each entry to specified type.
+            Options: "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+            For "dcat-ap", each entry is a complete DCAT-AP document.
+        packages (Iterable[dict]): Packages to convert, for example a
+            CatalogueSnapshot or stream_metadata_with_resources().
+            Defaults to None, paging through packages from the API.
+        page_size (int): Number of metadata entries requested per API call,
+            if packages is None.
+        workers (int): Number of processes converting entries in parallel.
+            Defaults to None, converting in the current process.
+        chunksize (int): Number of entries sent to a process at once.
+
+    Yields:
+        tuple (<str: name>, <Record | str: output>): Package name and the
+            converted string, or the Record if convert is None.
+    """
+    if packages is None:
+        packages = iter_metadata_with_resources(page_size=page_size)
+
+    records = _iter_records(packages, convert, workers=workers, chunksize=chunksize)
+    for name, record in records:
+        yield name, record.content if convert else record
+
+
+def _init_conversion_worker(
+    cache_args: tuple | None = None, registered_converters: dict | None = None
+) -> NoReturn:
+    """Load settings and converter config once, when a worker process starts.
+
+    Args:
+        cache_args (tuple): Directory and max_size of the conversion cache
+            enabled in the parent process, if any.
+        registered_converters (dict): Converters registered in the parent
+            process, by format name, see register_converter.
+    """
+    # Imported here, as converters are only loaded when first used
+    from envidat.converters.datacite_converter import get_config_datacite_converter
+
+    for file_format, converter in (registered_converters or {}).items():
+        register_converter(file_format, converter)
+    get_settings()
+    get_config_datacite_converter()
+    if cache_args is not None and get_conversion_cache() is None:
+        enable_conversion_cache(*cache_args)
+
+
+def _convert_record(package: dict, convert: str | None) -> tuple[str, Record]:
+    """Create a Record from a package, converted if convert is passed."""
+    return package.get("name"), Record(package, convert=convert)
+
+
+def _convert_record_result(package: dict, convert: str | None) -> dict:
+    """Convert a package, returning a result dict instead of raising errors."""
+    start_time = time.perf_counter()
+    result = {
+        "name": package.get("name"),
+        "output": None,
+        "error_type": None,
+        "error_message": None,
+    }
+    try:
+        output = Record(package, convert=convert).content
+        if output is None:
+            result["error_type"] = "ConversionError"
+            result["error_message"] = "Converter returned no output."
+        else:
+            result["output"] = output
+    except Exception as e:
+        result["error_type"] = type(e).__name__
+        result["error_message"] = str(e)
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+
+def _iter_records(
+    packages: Iterable[dict],
+    convert: str | None,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[tuple[str, Record]]:
+    """Iterate over packages as Records, in order, in parallel if workers is passed."""
+    convert_record = partial(_convert_record, convert=convert)
+    return _map_packages(convert_record, packages, workers, chunksize)
+
+
+def _map_packages(
+    function: Callable[[dict], Any],
+    packages: Iterable[dict],
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[Any]:
+    """Apply a function to packages, in order, in parallel if workers is passed.
+
+    Packages are sent to the process pool in windows of a few chunks per
+    worker, so memory use does not grow with the number of packages.
+
+    Worker processes are started with "spawn", not forked, as the parent can
+    run other threads, e.g. prefetching the next page of packages from API.
+    So function, and converters registered with register_converter, must be
+    importable functions, or "<module>:<function>" strings for converters.
+    """
+    if not workers:
+        for package in packages:
+            yield function(package)
+        return
+
+    log.info(f"Converting records with {workers} processes.")
+    packages = iter(packages)
+    window_size = workers * chunksize * 2
+
+    # Workers use the same conversion cache, if enabled
+    cache = get_conversion_cache()
+    cache_args = None
+    if cache is not None:
+        cache_args = (cache.store.directory, cache.store.max_size)
+    # Forking while other threads hold locks, e.g. of logging, can deadlock
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_conversion_worker,
+        initargs=(cache_args, dict(converters._converters)),
+    )
+    try:
+        # Keep the next window converting while yielding the current one
+        pending = deque()
+        while window := list(islice(packages, window_size)):
+            pending.append(executor.map(function, window, chunksize=chunksize))
+            if len(pending) > 1:
+                yield from pending.popleft()
+        while pending:
+            yield from pending.popleft()
+    finally:
+        # Do not convert remaining windows if the caller stops early
+        executor.shutdown(cancel_futures=True)
+
+
+def iter_conversion_results(
+    convert: Literal[
+        "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+    ],
+    packages: Iterable[dict] | None = None,
+    page_size: int = 100,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[dict]:
+    """Iterate over conversion results of all entries, continuing past failures.
+
+    Errors converting one entry are reported in its result, instead of
+    stopping the conversion of the remaining entries.
+
+    Args:
+        convert (str): Convert each entry to specified type.
+            Options: "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+        packages (Iterable[dict]): Packages to convert.
+            Defaults to None, paging through packages from the API.
+        page_size (int): Number of metadata entries requested per API call,
+            if packages is None.
+        workers (int): Number of processes converting entries in parallel.
+            Defaults to None, converting in the current process.
+        chunksize (int): Number of entries sent to a process at once.
+
+    Yields:
+        dict: Result per entry, in order, with keys:
+            "name" (str): Package name.
+            "output" (str): Converted entry, None if conversion failed.
+            "error_type" (str): Exception class name, None if converted.
+            "error_message" (str): Exception message, None if converted.
+            "seconds" (float): Time taken to convert the entry.
+    """
+    if packages is None:
+        packages = iter_metadata_with_resources(page_size=page_size)
+
+    convert_record = partial(_convert_record_result, convert=convert)
+    yield from _map_packages(convert_record, packages, workers, chunksize)
+
+
+def summarise_conversion_results(results: Iterable[dict]) -> dict:
+    """Summarise results from iter_conversion_results.
+
+    Args:
+        results (Iterable[dict]): Conversion results.
+
+    Returns:
+        dict: Summary with keys:
+            "total" (int): Number of entries.
+            "converted" (int): Number of entries converted.
+            "failed" (dict): Names of failed entries, keyed by error type.
+            "seconds" (float): Total conversion time of all entries.
+    """
+    summary = {"total": 0, "converted": 0, "failed": {}, "seconds": 0.0}
+    for result in results:
+        summary["total"] += 1
+        summary["seconds"] += result["seconds"]
+        if result["error_type"] is None:
+            summary["converted"] += 1
+        else:
+            summary["failed"].setdefault(result["error_type"], []).append(
+                result["name"]
+            )
+    return summary
+
+
+def convert_all_metadata_records(
+    convert: Literal[
+        "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+    ],
+    packages: Iterable[dict] | None = None,
+    page_size: int = 100,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> dict:
+    """Convert all EnviDat metadata entries, reporting failures instead of raising.
+
+    Args:
+        convert (str): Convert each entry to specified type.
+            Options: "str", "xml", "iso", "bibtex", "dif", "datacite", "ris", "dcat-ap"
+        packages (Iterable[dict]): Packages to convert.
+            Defaults to None, paging through packages from the API.
+        page_size (int): Number of metadata entries requested per API call,
+            if packages is None.
+        workers (int): Number of processes converting entries in parallel.
+            Defaults to None, converting in the current process.
+        chunksize (int): Number of entries sent to a process at once.
+
+    Returns:
+        dict: With keys:
+            "results" (list[dict]): Result per entry,
+                see iter_conversion_results.
+            "summary" (dict): See summarise_conversion_results.
+    """
+    results = list(
+        iter_conversion_results(
+            convert,
+            packages=packages,
+            page_size=page_size,
+            workers=workers,
+            chunksize=chunksize,
+        )
+    )
+    summary = summarise_conversion_results(results)
+
+    log.info(
+        f"Converted {summary['converted']} of {summary['total']} records "
+        f"to {convert}."
+    )
+    for error_type, names in summary["failed"].items():
+        log.error(f"Failed to convert {len(names)} records with {error_type}.")
+
+    return {"results": results, "summary": summary}
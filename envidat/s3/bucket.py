@@ -15,6 +15,7 @@ from botocore.exceptions import ClientError
 from s3transfer.manager import TransferConfig, TransferManager
 
 from envidat.s3 import exceptions
+from envidat.settings import get_settings
 from envidat.utils import get_url
 
 log = logging.getLogger(__name__)
@@ -55,6 +56,25 @@ class MetaBucket:
         cls._AWS_ENDPOINT = endpoint
         cls._AWS_REGION = region
 
+    def _config_from_settings(cls) -> NoReturn:
+        """Config the bucket connection parameters from settings, if not set.
+
+        Note:
+            Settings are read once per process, see envidat.settings.
+            If environment variables are changed after that, call
+            envidat.settings.reload_settings() before creating a Bucket.
+        """
+        if None in [cls._AWS_ACCESS_KEY_ID, cls._AWS_SECRET_ACCESS_KEY]:
+            settings = get_settings()
+            if settings.aws_access_key and settings.aws_secret_key:
+                log.debug("Configuring Bucket with settings from environment.")
+                cls.config(
+                    settings.aws_access_key,
+                    settings.aws_secret_key,
+                    endpoint=settings.aws_endpoint,
+                    region=settings.aws_region,
+                )
+
     def get_boto3_resource() -> NoReturn:
         """Get boto3 resource object directly, for further use.
 
@@ -62,6 +82,7 @@ class MetaBucket:
             Usage: Bucket.get_boto3_resource()
         """
         log.debug("Accessing boto3 resource.")
+        Bucket._config_from_settings()
         return boto3.resource(
             "s3",
             aws_access_key_id=Bucket._AWS_ACCESS_KEY_ID,
@@ -78,6 +99,7 @@ class MetaBucket:
             Usage: Bucket.get_boto3_client()
         """
         log.debug("Accessing boto3 client.")
+        Bucket._config_from_settings()
         return boto3.client(
             "s3",
             aws_access_key_id=Bucket._AWS_ACCESS_KEY_ID,
@@ -105,13 +127,15 @@ class Bucket:
     Handles boto3 exceptions with custom exception classes.
     """
 
-    _AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY")
-    _AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_KEY")
-    _AWS_ENDPOINT = os.getenv("AWS_ENDPOINT")
-    _AWS_REGION = os.getenv("AWS_REGION", default="")
+    # Set from settings on first use, or with Bucket.config
+    _AWS_ACCESS_KEY_ID = None
+    _AWS_SECRET_ACCESS_KEY = None
+    _AWS_ENDPOINT = None
+    _AWS_REGION = ""
 
     # Set class & staticmethods from MetaBucket
     config = classmethod(MetaBucket.config)
+    _config_from_settings = classmethod(MetaBucket._config_from_settings)
     get_boto3_resource = staticmethod(MetaBucket.get_boto3_resource)
     get_boto3_client = staticmethod(MetaBucket.get_boto3_client)
     list_buckets = classmethod(MetaBucket.list_buckets)
@@ -130,19 +154,7 @@ class Bucket:
             is_new (bool): If true, creates a new bucket.
             is_public (bool): If true, makes the bucket public on creation.
         """
-        if None in [Bucket._AWS_ACCESS_KEY_ID, Bucket._AWS_SECRET_ACCESS_KEY]:
-            missing_vars = {"AWS_ACCESS_KEY", "AWS_SECRET_KEY"} - set(os.environ)
-            if not missing_vars:
-                log.info(
-                    "Environment variables set after Bucket class import. "
-                    "Re-configuring Bucket with specified environment variables."
-                )
-                Bucket.config(
-                    os.getenv("AWS_ACCESS_KEY"),
-                    os.getenv("AWS_SECRET_KEY"),
-                    endpoint=os.getenv("AWS_ENDPOINT"),
-                    region=os.getenv("AWS_REGION", default=""),
-                )
+        Bucket._config_from_settings()
 
         log.debug(
             "S3 Bucket object instantiated. "
@@ -159,11 +171,14 @@ class Bucket:
             raise TypeError(
                 "AWS Access Key ID and AWS Secret Access Key must be configured. "
                 "Set them with environment variables AWS_ACCESS_KEY and AWS_ACCESS_KEY "
-                "or with Bucket.config(access_key, secret_key, endpoint, region)"
+                "or with Bucket.config(access_key, secret_key, endpoint, region). "
+                "Call envidat.settings.reload_settings() if environment variables "
+                "were set after settings were first read."
             )
-        if "AWS_BUCKET_NAME" in os.environ:
+        settings = get_settings()
+        if settings.aws_bucket_name:
             log.debug("Getting bucket name from environment variable.")
-            self.bucket_name = os.getenv("AWS_BUCKET_NAME")
+            self.bucket_name = settings.aws_bucket_name
         else:
             self.bucket_name = bucket_name
 
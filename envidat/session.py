@@ -0,0 +1,167 @@
+"""Shared HTTP session with connection pooling, retries and per-host timeouts."""
+
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import NoReturn
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+# (connect, read) timeout in seconds, see requests documentation
+DEFAULT_TIMEOUT = (5, 120)
+
+_session = None
+_session_lock = threading.Lock()
+_session_config = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+    "status_forcelist": DEFAULT_STATUS_FORCELIST,
+    "timeout": DEFAULT_TIMEOUT,
+    "host_timeouts": {},
+}
+
+
+class PooledSession(requests.Session):
+    """Session applying a default timeout per host to every request.
+
+    Note:
+        Cookies returned by servers are never stored, so the session can be
+        shared between threads and callers without leaking state between calls.
+    """
+
+    def __init__(
+        self,
+        timeout: float | tuple = DEFAULT_TIMEOUT,
+        host_timeouts: dict | None = None,
+    ) -> NoReturn:
+        """Init the PooledSession object.
+
+        Args:
+            timeout (float, tuple): Default timeout, in seconds, for all hosts.
+                Either a single value or a (connect, read) tuple.
+            host_timeouts (dict): Mapping of hostname to timeout, overriding
+                the default timeout for that host.
+        """
+        super().__init__()
+        self.timeout = timeout
+        self.host_timeouts = dict(host_timeouts or {})
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, adding the host timeout if none is passed explicitly."""
+        if kwargs.get("timeout") is None:
+            host = urlsplit(url).hostname
+            kwargs["timeout"] = self.host_timeouts.get(host, self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def _build_session() -> PooledSession:
+    """Create a new PooledSession from the current session config."""
+    retry = Retry(
+        total=_session_config["max_retries"],
+        backoff_factor=_session_config["backoff_factor"],
+        status_forcelist=_session_config["status_forcelist"],
+        respect_retry_after_header=True,
+        # Return the final response instead of raising, status is handled by caller
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_session_config["pool_connections"],
+        pool_maxsize=_session_config["pool_maxsize"],
+        max_retries=retry,
+    )
+
+    session = PooledSession(
+        timeout=_session_config["timeout"],
+        host_timeouts=_session_config["host_timeouts"],
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    log.debug(f"Created pooled HTTP session with config: {_session_config}")
+    return session
+
+
+def get_session() -> PooledSession:
+    """Get the shared, thread-safe HTTP session.
+
+    The session is created on first use and reused afterwards, so connections
+    to the same host are kept alive between calls.
+
+    Returns:
+        PooledSession: The shared session.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    status_forcelist: tuple[int, ...] = DEFAULT_STATUS_FORCELIST,
+    timeout: float | tuple = DEFAULT_TIMEOUT,
+    host_timeouts: dict | None = None,
+) -> NoReturn:
+    """Config the shared HTTP session parameters.
+
+    The current session is closed and rebuilt with the new config on next use.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache.
+        pool_maxsize (int): Maximum number of connections kept per host.
+            Should be at least the number of threads calling the same host.
+        max_retries (int): Number of retries on connection errors
+            and on responses with a status in status_forcelist.
+        backoff_factor (float): Exponential backoff factor between retries,
+            sleeps for backoff_factor * (2 ** (retry - 1)) seconds.
+        status_forcelist (tuple[int]): Response status codes to retry on.
+        timeout (float, tuple): Default timeout in seconds for all hosts.
+        host_timeouts (dict): Mapping of hostname to timeout for specific hosts.
+            Example: {"www.envidat.ch": (5, 300)}
+    """
+    global _session
+
+    with _session_lock:
+        _session_config.update(
+            {
+                "pool_connections": pool_connections,
+                "pool_maxsize": pool_maxsize,
+                "max_retries": max_retries,
+                "backoff_factor": backoff_factor,
+                "status_forcelist": tuple(status_forcelist),
+                "timeout": timeout,
+                "host_timeouts": dict(host_timeouts or {}),
+            }
+        )
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def close_session() -> NoReturn:
+    """Close the shared HTTP session and release pooled connections."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,101 @@
+"""Settings from environment variables, resolved once per process."""
+
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from typing import NoReturn
+
+from envidat.utils import load_dotenv_if_in_debug_mode
+
+log = logging.getLogger(__name__)
+
+_settings = None
+_settings_lock = threading.Lock()
+
+
+class Settings:
+    """Config values read from environment variables.
+
+    Values not set in the environment are None, unless noted otherwise.
+    """
+
+    def __init__(self, environ: Mapping[str, str] = os.environ) -> NoReturn:
+        """Init the Settings object.
+
+        Args:
+            environ (Mapping[str, str]): Environment variables to read from.
+                Defaults to os.environ.
+        """
+        # EnviDat CKAN API
+        self.api_host = environ.get("API_HOST")
+        self.api_package_show = environ.get("API_PACKAGE_SHOW")
+        self.api_current_package_list_with_resources = environ.get(
+            "API_PATH_CURRENT_PACKAGE_LIST_WITH_RESOURCES"
+        )
+        if self.api_host:
+            self.api_protocol, _, self.api_domain = self.api_host.partition("://")
+        else:
+            self.api_protocol = self.api_domain = None
+
+        # DataCite and DORA
+        self.datacite_api_url = environ.get("DATACITE_API_URL")
+        self.datacite_client_id = environ.get("DATACITE_CLIENT_ID")
+        self.datacite_password = environ.get("DATACITE_PASSWORD")
+        self.doi_prefix = environ.get("DOI_PREFIX")
+        self.doi_api_url = environ.get("DOI_API_URL")
+        self.site_dataset_url = environ.get("SITE_DATASET_URL")
+        self.dora_api_url = environ.get("DORA_API_URL")
+
+        # S3
+        self.aws_access_key = environ.get("AWS_ACCESS_KEY")
+        self.aws_secret_key = environ.get("AWS_SECRET_KEY")
+        self.aws_endpoint = environ.get("AWS_ENDPOINT")
+        self.aws_region = environ.get("AWS_REGION", "")
+        self.aws_bucket_name = environ.get("AWS_BUCKET_NAME")
+
+        # Caching
+        self.http_cache_dir = environ.get("HTTP_CACHE_DIR")
+        self.conversion_cache_dir = environ.get("CONVERSION_CACHE_DIR")
+        self.doi_cache_dir = environ.get("DOI_CACHE_DIR")
+
+    def __repr__(self) -> str:
+        """Settings representation, without secret values."""
+        return (
+            f"Settings(api_host={self.api_host!r}, "
+            f"datacite_api_url={self.datacite_api_url!r}, "
+            f"aws_endpoint={self.aws_endpoint!r})"
+        )
+
+
+def get_settings() -> Settings:
+    """Get the settings, reading environment variables on first use only.
+
+    A .env file is loaded first if running in debug mode,
+    see load_dotenv_if_in_debug_mode.
+
+    Returns:
+        Settings: The shared settings.
+    """
+    global _settings
+
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                load_dotenv_if_in_debug_mode()
+                _settings = Settings()
+                log.debug(f"Loaded {_settings}")
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Read environment variables again, e.g. after they were changed.
+
+    Returns:
+        Settings: The new shared settings.
+    """
+    global _settings
+
+    with _settings_lock:
+        _settings = None
+    return get_settings()
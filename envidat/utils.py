@@ -1,16 +1,27 @@
 """Extra utils used internally and within EnviDat projects."""
 
+import codecs
+import json
 import logging
 import os
+import re
 import sys
 import urllib.parse
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import NoReturn, Union
+from typing import Any, NoReturn, Union
 
 import requests
 
+from envidat.session import get_session
+
 log = logging.getLogger(__name__)
 
+# Dotenv files already loaded by load_dotenv_if_in_debug_mode
+_loaded_env_files = set()
+
 
 def _debugger_is_active() -> bool:
     """Check to see if running in debug mode.
@@ -22,6 +33,7 @@ def _debugger_is_active() -> bool:
     return gettrace() is not None
 
 
+@lru_cache(maxsize=None)
 def _is_docker() -> bool:
     """Check to see if running in a docker container.
 
@@ -43,6 +55,9 @@ def load_dotenv_if_in_debug_mode(
 ) -> NoReturn:
     """Load secret .env variables from repo for debugging.
 
+    Note:
+        Each file is only read once per process, later calls return immediately.
+
     Args:
         env_file (Union[Path, str]): String or Path like object pointer to
             secret dot env file to read.
@@ -51,6 +66,10 @@ def load_dotenv_if_in_debug_mode(
     if not _debugger_is_active():
         return
 
+    if str(env_file) in _loaded_env_files:
+        return
+    _loaded_env_files.add(str(env_file))
+
     if ignore_docker_check:
         log.debug("Override ignore_docker_check, skipping docker test")
     else:
@@ -122,10 +141,10 @@ def get_response_json(
     key = None
     # Extract environment variables needed to call API URL
     try:
-        host = os.environ(api_host)
-        path = os.environ(api_path)
+        host = os.environ[api_host]
+        path = os.environ[api_path]
         if api_key:
-            key = os.environ(api_key)
+            key = os.environ[api_key]
     except KeyError as e:
         log.error(f"KeyError: {e} does not exist in environnment vars")
         return None
@@ -145,9 +164,9 @@ def get_response_json(
         # Add headers to request if key truthy
         if key:
             headers = {"Authorization": key}
-            response = requests.get(api_url, headers=headers)
+            response = get_session().get(api_url, headers=headers)
         else:
-            response = requests.get(api_url)
+            response = get_session().get(api_url)
 
         # Handle unexpected response status_code
         # Default expected response status_code is 200
@@ -172,30 +191,35 @@ def get_response_json(
         return None
 
 
-def get_url(url: str) -> requests.Response:
+def get_url(url: str, stream: bool = False) -> requests.Response:
     """Get a URL with additional error handling.
 
+    Note:
+        Uses the shared pooled session, see envidat.session.
+
     Args:
         url (str): The URL to GET.
+        stream (bool): Defer downloading the response body until it is read,
+            e.g. with response.iter_content(). Defaults to False.
     """
     try:
         log.debug(f"Attempting to get {url}")
-        r = requests.get(url)
+        r = get_session().get(url, stream=stream)
         r.raise_for_status()
         return r
     except requests.exceptions.ConnectionError as e:
-        log.error(f"Could not connect to internet on get: {r.request.url}")
+        log.error(f"Could not connect to internet on get: {url}")
         log.error(e)
     except requests.exceptions.HTTPError as e:
-        log.error(f"HTTP response error on get: {r.request.url}")
+        log.error(f"HTTP response error on get: {url}")
         log.error(e)
     except requests.exceptions.RequestException as e:
-        log.error(f"Request error on get: {r.request.url}")
+        log.error(f"Request error on get: {url}")
         log.error(f"Request: {e.request}")
         log.error(f"Response: {e.response}")
     except Exception as e:
         log.error(e)
-        log.error(f"Unhandled exception occurred on get: {r.request.url}")
+        log.error(f"Unhandled exception occurred on get: {url}")
 
     return None
 
@@ -204,35 +228,173 @@ def get_url(url: str) -> requests.Response:
 def get_url_response(url: str, cookie: str | None = None) -> requests.Response:
     """Get a URL with additional error handling.
 
+    Note:
+        Uses the shared pooled session, see envidat.session.
+
     Args:
         url (str): The URL to GET.
         cookie (str | None): Cookie passed to API call in header,
                              default value is None as this argument is not always used
     """
+    r = None
     try:
         log.debug(f"Attempting to get {url}")
 
         # Call API with cookie in header if it exists
         if cookie:
             headers = {"Cookie": cookie}
-            r = requests.get(url, headers=headers)
+            r = get_session().get(url, headers=headers)
         # Else call API (without header)
         else:
-            r = requests.get(url)
+            r = get_session().get(url)
 
         # Raise HTTP error it if occured
         r.raise_for_status()
     except requests.exceptions.ConnectionError as e:
-        log.error(f"Could not connect to internet on get: {r.request.url}")
+        log.error(f"Could not connect to internet on get: {url}")
         log.error(e)
     except requests.exceptions.HTTPError:
-        log.error(f"HTTP response error on get: {r.request.url}")
+        log.error(f"HTTP response error on get: {url}")
     except requests.exceptions.RequestException as e:
-        log.error(f"Request error on get: {r.request.url}")
+        log.error(f"Request error on get: {url}")
         log.error(f"Request: {e.request}")
         log.error(f"Response: {e.response}")
     except Exception as e:
         log.error(e)
-        log.error(f"Unhandled exception occurred on get: {r.request.url}")
+        log.error(f"Unhandled exception occurred on get: {url}")
 
     return r
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "result") -> Iterator[Any]:
+    """Incrementally decode the items of an array in a top-level JSON object.
+
+    Only one item (plus the unread part of the current chunk) is held in memory
+    at a time, instead of the full document and the decoded Python objects.
+
+    Example:
+        For chunks of '{"success": true, "result": [{"name": "a"}, {"name": "b"}]}',
+        yields {"name": "a"} then {"name": "b"}.
+
+    Args:
+        chunks (Iterable[bytes]): UTF-8 encoded JSON document in chunks,
+            e.g. from response.iter_content().
+        key (str): Key of the array in the top-level object. Defaults to "result".
+
+    Yields:
+        Any: Each decoded array item.
+
+    Raises:
+        ValueError: If the document is not a JSON object or is truncated.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+
+    def fill() -> bool:
+        """Append the next chunk to the buffer, dropping consumed text."""
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            text = text_decoder.decode(b"", final=True)
+        else:
+            text = text_decoder.decode(chunk)
+        buffer = buffer[pos:] + text
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        """Skip whitespace and return the next character, without consuming it."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                raise ValueError("Unexpected end of JSON document.")
+
+    def consume(expected: str) -> str:
+        """Consume the next character, which must be one of expected."""
+        nonlocal pos
+        char = next_char()
+        if char not in expected:
+            raise ValueError(f"Expected one of '{expected}' at '{char}' in JSON.")
+        pos += 1
+        return char
+
+    def decode_value() -> Any:
+        """Decode the next complete JSON value from the buffer."""
+        nonlocal pos
+        next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A value ending the buffer may be a truncated number
+                if end < len(buffer) or exhausted:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            fill()
+
+    consume("{")
+    if next_char() == "}":
+        return
+
+    while True:
+        name = decode_value()
+        consume(":")
+
+        if name == key:
+            consume("[")
+            if next_char() == "]":
+                return
+            while True:
+                yield decode_value()
+                if consume(",]") == "]":
+                    return
+        else:
+            decode_value()
+
+        if consume(",}") == "}":
+            return
+
+
+# Dates starting with YYYY-MM-DD, as in CKAN timestamps, parsed without dateutil
+_ISO_DATE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_string: str) -> datetime:
+    """Parse a date string, memoising results of repeated values.
+
+    ISO 8601 dates and timestamps, such as "2021-03-04T05:06:07.123456",
+    are parsed with datetime.fromisoformat. Other strings, and ISO strings it
+    does not accept, fall back to dateutil.parser.parse, giving the same result.
+
+    Args:
+        date_string (str): Date or timestamp, e.g. "2021-03-04".
+
+    Returns:
+        datetime: Parsed date, timezone aware if the string has a timezone.
+
+    Raises:
+        ValueError: If the string cannot be parsed as a date.
+    """
+    if _ISO_DATE_PREFIX.match(date_string):
+        try:
+            return datetime.fromisoformat(date_string)
+        except ValueError:
+            pass
+
+    from dateutil.parser import parse
+
+    return parse(date_string)
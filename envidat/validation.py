@@ -0,0 +1,227 @@
+"""Validation of EnviDat metadata records, before conversion."""
+
+import logging
+from collections.abc import Callable, Iterable
+
+from envidat.converters.fields import (
+    as_parsed_record,
+    load_json_field,
+    load_resource_json_field,
+)
+
+log = logging.getLogger(__name__)
+
+# Fields every metadata entry must have.
+# Not always present: extras, language, license_url, related_datasets
+REQUIRED_FIELDS = frozenset(
+    (
+        "author",
+        "author_email",
+        "creator_user_id",
+        "date",
+        "doi",
+        "funding",
+        "id",
+        "isopen",
+        "license_id",
+        "license_title",
+        "maintainer",
+        "maintainer_email",
+        "metadata_created",
+        "metadata_modified",
+        "name",
+        "notes",
+        "num_resources",
+        "num_tags",
+        "organization",
+        "owner_org",
+        "private",
+        "publication",
+        "publication_state",
+        "related_publications",
+        "resource_type",
+        "resource_type_general",
+        "spatial",
+        "spatial_info",
+        "state",
+        "subtitle",
+        "title",
+        "type",
+        "url",
+        "version",
+        "resources",
+        "tags",
+        "groups",
+        "relationships_as_subject",
+        "relationships_as_object",
+    )
+)
+
+# JSON string fields parsed by the converters, with the expected parsed type
+JSON_FIELDS = {
+    "author": list,
+    "maintainer": dict,
+    "publication": dict,
+    "funding": list,
+    "date": list,
+    "spatial": dict,
+}
+
+# JSON string fields of resources parsed by the converters
+RESOURCE_JSON_FIELDS = {
+    "restricted": dict,
+    "resource_size": dict,
+}
+
+
+def _check_required_fields(record: dict) -> list[str]:
+    """Check all required fields are present."""
+    if REQUIRED_FIELDS.issubset(record.keys()):
+        return []
+    missing_keys = sorted(REQUIRED_FIELDS.difference(record.keys()))
+    return [f"Missing fields: {missing_keys}"]
+
+
+def _check_json_fields(record: dict) -> list[str]:
+    """Check JSON string fields parse, to the expected type."""
+    errors = []
+    for field, expected_type in JSON_FIELDS.items():
+        if not record.get(field):
+            continue
+        try:
+            value = load_json_field(record, field)
+        except (TypeError, ValueError) as e:
+            errors.append(f"Field '{field}' is not valid JSON: {e}")
+            continue
+        if not isinstance(value, expected_type):
+            errors.append(
+                f"Field '{field}' is not a JSON {expected_type.__name__}, "
+                f"got {type(value).__name__}"
+            )
+    return errors
+
+
+def _parsed_field(record: dict, field: str, expected_type: type) -> object | None:
+    """Get a parsed JSON field, None if missing or invalid (reported elsewhere)."""
+    if not record.get(field):
+        return None
+    try:
+        value = load_json_field(record, field)
+    except (TypeError, ValueError):
+        return None
+    return value if isinstance(value, expected_type) else None
+
+
+def _check_authors(record: dict) -> list[str]:
+    """Check each author has a name."""
+    authors = _parsed_field(record, "author", list)
+    if authors is None:
+        return []
+    return [
+        f"Author {position} has no name"
+        for position, author in enumerate(authors)
+        if not isinstance(author, dict) or not author.get("name")
+    ]
+
+
+def _check_maintainer(record: dict) -> list[str]:
+    """Check the maintainer has a name and email."""
+    maintainer = _parsed_field(record, "maintainer", dict)
+    if maintainer is None:
+        return []
+    return [
+        f"Maintainer has no {key}"
+        for key in ("name", "email")
+        if not maintainer.get(key)
+    ]
+
+
+def _check_resources(record: dict) -> list[str]:
+    """Check resources have a created date, and their JSON fields parse."""
+    resources = record.get("resources")
+    if resources is None:
+        return []
+    if not isinstance(resources, list):
+        return [f"Field 'resources' is not a list, got {type(resources).__name__}"]
+
+    errors = []
+    for position, resource in enumerate(resources):
+        if not isinstance(resource, dict):
+            errors.append(f"Resource {position} is not a dictionary")
+            continue
+        if not resource.get("created"):
+            errors.append(f"Resource {position} has no created date")
+        for field, expected_type in RESOURCE_JSON_FIELDS.items():
+            if not resource.get(field):
+                continue
+            try:
+                value = load_resource_json_field(record, resource, field)
+            except (TypeError, ValueError) as e:
+                errors.append(
+                    f"Resource {position} field '{field}' is not valid JSON: {e}"
+                )
+                continue
+            if not isinstance(value, expected_type):
+                errors.append(
+                    f"Resource {position} field '{field}' is not "
+                    f"a JSON {expected_type.__name__}"
+                )
+    return errors
+
+
+# Checks run by validate_record, in order
+RULES: tuple[Callable[[dict], list[str]], ...] = (
+    _check_required_fields,
+    _check_json_fields,
+    _check_authors,
+    _check_maintainer,
+    _check_resources,
+)
+
+
+def validate_record(record: dict) -> list[str]:
+    """Validate the fields and structure of a metadata record.
+
+    Checks required fields are present, the JSON string fields parse,
+    authors and the maintainer have the fields used by the converters,
+    and resources have a created date.
+
+    Each JSON string field is parsed once. If record is a ParsedRecord, the
+    parsed fields are kept for the converters.
+
+    Args:
+        record (dict): Individual EnviDat metadata entry record dictionary.
+
+    Returns:
+        list[str]: Validation errors, empty if the record is valid.
+    """
+    if not isinstance(record, dict):
+        return [f"Record is not a dictionary, got {type(record).__name__}"]
+
+    record = as_parsed_record(record)
+    errors = []
+    for rule in RULES:
+        errors.extend(rule(record))
+    return errors
+
+
+def validate_records(records: Iterable[dict]) -> list[dict]:
+    """Validate many metadata records in one call.
+
+    Args:
+        records (Iterable[dict]): EnviDat metadata entry record dictionaries.
+
+    Returns:
+        list[dict]: Report per record, in order, with keys:
+            "name" (str): Package name, None if missing.
+            "valid" (bool): True if the record has no errors.
+            "errors" (list[str]): Validation errors.
+    """
+    report = []
+    for record in records:
+        errors = validate_record(record)
+        name = record.get("name") if isinstance(record, dict) else None
+        if errors:
+            log.debug(f"Metadata record {name} is not valid: {errors}")
+        report.append({"name": name, "valid": not errors, "errors": errors})
+    return report
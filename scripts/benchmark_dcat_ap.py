@@ -0,0 +1,74 @@
+"""Time DCAT-AP output for one record and for the full catalogue.
+
+Compares the current assembly to parsing and unparsing each dataset XML again,
+as done before datasets were inserted into the catalog directly.
+Packages are read from a catalogue snapshot, or from the API if omitted.
+
+Example commands to run script:
+    python -m scripts.benchmark_dcat_ap --snapshot catalogue.jsonl
+    python -m scripts.benchmark_dcat_ap --repeat 5
+"""
+
+# Imports
+import argparse
+import time
+
+from xmltodict import parse, unparse
+
+from envidat.api.snapshot import CatalogueSnapshot
+from envidat.api.v1 import get_metadata_list_with_resources
+from envidat.converters.dcat_ap_converter import (
+    convert_dcat_ap,
+    dcat_ap_convert_dataset,
+    get_dcat_ap_catalog_dict,
+)
+
+
+def convert_dcat_ap_round_trip(records: list[dict]) -> str:
+    """DCAT-AP catalog, parsing each dataset XML string and unparsing it again."""
+    datasets = [
+        parse(dcat_ap_convert_dataset(record, as_xml=True)) for record in records
+    ]
+    return unparse(
+        get_dcat_ap_catalog_dict(datasets), short_empty_elements=True, pretty=True
+    )
+
+
+def best_time(function, argument, repeat: int) -> float:
+    """Get the fastest of several runs of a function, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+# Create the parser
+parser = argparse.ArgumentParser()
+
+# Add arguments
+parser.add_argument(
+    "--snapshot", type=str, help="Path of a catalogue snapshot JSON Lines file"
+)
+parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+args = parser.parse_args()
+
+# Get packages
+if args.snapshot:
+    records = list(CatalogueSnapshot(args.snapshot))
+else:
+    records = get_metadata_list_with_resources()
+
+print(f"Timing DCAT-AP output of {len(records)} records....")
+cases = (
+    ("single record", records[0], convert_dcat_ap),
+    ("single record, round trip", [records[0]], convert_dcat_ap_round_trip),
+    ("full catalogue", records, convert_dcat_ap),
+    ("full catalogue, round trip", records, convert_dcat_ap_round_trip),
+)
+
+# Print best time per case
+for name, argument, function in cases:
+    seconds = best_time(function, argument, args.repeat)
+    print(f"{name}: {seconds * 1000:.1f} ms")
@@ -0,0 +1,56 @@
+"""Compare the memory used per Record, with and without compact mode.
+
+Packages are read from a catalogue snapshot, or from the API if omitted.
+
+Example commands to run script:
+    python -m scripts.benchmark_record_memory --snapshot catalogue.jsonl
+    python -m scripts.benchmark_record_memory
+"""
+
+# Imports
+import argparse
+import gc
+import json
+import tracemalloc
+
+from envidat.api.snapshot import CatalogueSnapshot
+from envidat.api.v1 import iter_metadata_with_resources
+from envidat.metadata import Record
+
+
+def measure_records(lines: list[str], compact: bool) -> int:
+    """Get bytes allocated to hold all packages as Records."""
+    gc.collect()
+    tracemalloc.start()
+    records = [Record(json.loads(line), compact=compact) for line in lines]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+# Create the parser
+parser = argparse.ArgumentParser()
+
+# Add snapshot argument
+parser.add_argument(
+    "--snapshot", type=str, help="Path of a catalogue snapshot JSON Lines file"
+)
+args = parser.parse_args()
+
+# Get packages as JSON strings, so each mode parses its own copy
+if args.snapshot:
+    packages = CatalogueSnapshot(args.snapshot)
+else:
+    packages = iter_metadata_with_resources()
+lines = [json.dumps(package) for package in packages]
+
+print(f"Measuring memory of {len(lines)} records....")
+default_size = measure_records(lines, compact=False)
+compact_size = measure_records(lines, compact=True)
+
+# Print size per record
+for mode, size in (("default", default_size), ("compact", compact_size)):
+    print(f"{mode}: {size / len(lines) / 1024:.1f} KiB per record")
+print(f"compact mode uses {compact_size / default_size:.0%} of default memory")
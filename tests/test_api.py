@@ -1,8 +1,244 @@
 """Tests for API calls."""
 
-# from envidat.api.v1 import get_metadata_list_with_resources, get_package
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from envidat.api import v1
+from envidat.api.cache import MemoryCache
+from envidat.api.v1 import iter_metadata_with_resources
+from envidat.settings import Settings
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response in offline tests."""
+
+    def __init__(self, data, status_code=200):
+        """Init the FakeResponse object."""
+        self.data = data
+        self.status_code = status_code
+        self.content = str(data).encode()
+
+    def json(self):
+        """Return the response data."""
+        return self.data
+
+
+@pytest.fixture(autouse=True)
+def default_settings(monkeypatch):
+    """Use default API host and paths, ignoring environment variables."""
+    monkeypatch.setattr(v1, "get_settings", lambda: Settings({}))
+
+
+@pytest.fixture
+def paged_api(monkeypatch):
+    """Serve a fake package search in id order, recording requested pages."""
+    packages = [
+        {"id": f"id-{i:02}", "name": f"package-{i}", "doi": f"10.16904/{i}"}
+        for i in range(25)
+    ]
+    after_ids = []
+
+    def fake_get_url(url):
+        query = parse_qs(urlsplit(url).query)
+        assert query["sort"] == ["id asc"]
+        rows = int(query["rows"][0])
+        # Filter query of the form id:{"<id>" TO *]
+        after_id = query["fq"][0].split('"')[1] if "fq" in query else None
+        after_ids.append(after_id)
+        results = [
+            package
+            for package in sorted(packages, key=lambda package: package["id"])
+            if after_id is None or package["id"] > after_id
+        ]
+        result = {"count": len(results), "results": results[:rows]}
+        return FakeResponse({"result": result})
+
+    monkeypatch.setattr(v1, "get_url", fake_get_url)
+    return packages, after_ids
 
 
 def test_package_list_with_resources():
     """TODO."""
     assert True
+
+
+def test_iter_metadata_with_resources(paged_api):
+    """Test paging through all packages in order."""
+    packages, after_ids = paged_api
+
+    result = list(iter_metadata_with_resources(page_size=10))
+
+    assert result == packages
+    assert after_ids == [None, "id-09", "id-19"]
+
+
+def test_iter_metadata_with_resources_modified(paged_api):
+    """Test no package is skipped if packages change while iterating."""
+    packages, _ = paged_api
+
+    iterator = iter_metadata_with_resources(page_size=10)
+    first = next(iterator)
+    # A package listed before the next pages is deleted, another one added
+    packages.remove(first)
+    packages.append({"id": "id-99", "name": "package-99", "doi": None})
+    result = [first] + list(iterator)
+
+    assert [package["id"] for package in result] == sorted(
+        [f"id-{i:02}" for i in range(25)] + ["id-99"]
+    )
+
+
+def test_iter_metadata_with_resources_lazy(paged_api):
+    """Test only the pages needed (plus one prefetched) are requested."""
+    packages, after_ids = paged_api
+
+    iterator = iter_metadata_with_resources(page_size=10)
+    assert next(iterator) == packages[0]
+    iterator.close()
+
+    assert "id-19" not in after_ids
+
+
+def test_get_metadata_name_doi(monkeypatch):
+    """Test name to DOI mapping built from a paged, field-projected search."""
+    packages = [{"name": f"package-{i}", "doi": f"10.16904/{i}"} for i in range(25)]
+    packages[5]["doi"] = None
+    queries = []
+
+    def fake_get_url(url):
+        query = parse_qs(urlsplit(url).query)
+        queries.append(query)
+        start, rows = int(query["start"][0]), int(query["rows"][0])
+        results = packages[start : start + rows]
+        return FakeResponse({"result": {"count": len(packages), "results": results}})
+
+    monkeypatch.setattr(v1, "get_url", fake_get_url)
+
+    name_doi = v1.get_metadata_name_doi()
+
+    assert len(name_doi) == len(packages)
+    assert name_doi["package-3"] == "10.16904/3"
+    assert name_doi["package-5"] == ""
+    assert all(query["fl"] == ["name,doi,id"] for query in queries)
+    assert len(queries) == 1
+
+
+def test_iter_package_search_modified(monkeypatch):
+    """Test pages by last metadata_modified skip no package modified meanwhile."""
+    packages = {
+        f"id-{i}": {"id": f"id-{i}", "metadata_modified": f"2023-01-0{i + 1}T10:00:00"}
+        for i in range(5)
+    }
+    queries = []
+
+    def fake_get_url(url):
+        query = parse_qs(urlsplit(url).query)
+        queries.append(query)
+        assert query["sort"] == ["metadata_modified asc, id asc"]
+        start, rows = int(query["start"][0]), int(query["rows"][0])
+        # Filter query of the form metadata_modified:[<date>Z TO *]
+        since = query["fq"][0].split("[")[1].split("Z")[0] if "fq" in query else ""
+        results = sorted(
+            (
+                package
+                for package in packages.values()
+                if package["metadata_modified"][:19] >= since
+            ),
+            key=lambda package: (package["metadata_modified"], package["id"]),
+        )[start : start + rows]
+        return FakeResponse({"result": {"count": len(packages), "results": results}})
+
+    monkeypatch.setattr(v1, "get_url", fake_get_url)
+
+    iterator = v1.iter_package_search(rows=2)
+    result = [next(iterator), next(iterator)]
+    # A package already returned is modified, moving to the end of the sort order
+    packages["id-0"] = {"id": "id-0", "metadata_modified": "2023-02-01T10:00:00"}
+    result.extend(iterator)
+
+    assert [package["id"] for package in result] == [
+        "id-0",
+        "id-1",
+        "id-2",
+        "id-3",
+        "id-4",
+        "id-0",
+    ]
+    assert result[-1]["metadata_modified"] == "2023-02-01T10:00:00"
+    assert "fq" not in queries[0]
+    assert queries[1]["fq"] == ["metadata_modified:[2023-01-02T10:00:00Z TO *]"]
+
+
+def test_get_packages(monkeypatch):
+    """Test bulk package fetch keeps input order and isolates errors."""
+
+    def fake_get_url_response(url, cookie=None):
+        name = url.rpartition("=")[2]
+        if name == "missing":
+            return FakeResponse({"error": "Not found"}, status_code=404)
+        if name == "broken":
+            raise ValueError("Broken response")
+        return FakeResponse({"result": {"name": name}})
+
+    monkeypatch.setattr(v1, "cached_get_url_response", fake_get_url_response)
+
+    names = [f"package-{i}" for i in range(20)] + ["missing", "broken", "package-0"]
+    records = v1.get_packages(names, max_workers=4)
+
+    assert list(records) == names[:-1]
+    assert records["package-7"] == {"status_code": 200, "result": {"name": "package-7"}}
+    assert records["missing"]["status_code"] == 404
+    assert records["broken"] == {"status_code": 500, "result": "Broken response"}
+
+
+def test_get_package_cached(monkeypatch):
+    """Test packages are cached by name and id, and invalidated by either."""
+    monkeypatch.setattr(v1, "package_cache", MemoryCache())
+    fetched = []
+
+    def fake_get_package(package_name):
+        fetched.append(package_name)
+        return {"id": "1234", "name": "package-a"}
+
+    monkeypatch.setattr(v1, "get_package", fake_get_package)
+
+    assert v1.get_package_cached("package-a")["id"] == "1234"
+    assert v1.get_package_cached("1234")["name"] == "package-a"
+    assert fetched == ["package-a"]
+
+    v1.invalidate_package("1234")
+    v1.get_package_cached("package-a")
+    assert fetched == ["package-a", "package-a"]
+    assert v1.get_package_cache_stats()["hits"] == 1
+
+
+def test_stream_metadata_with_resources(monkeypatch):
+    """Test packages are decoded one at a time from the response stream."""
+    body = json.dumps(
+        {
+            "help": "https://www.envidat.ch/api/3/action/help_show",
+            "success": True,
+            "result": [{"name": f"package-{i}", "notes": "ü" * i} for i in range(50)],
+        }
+    ).encode()
+
+    class FakeStreamResponse:
+        closed = False
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(body), chunk_size):
+                yield body[i : i + chunk_size]
+
+        def close(self):
+            self.closed = True
+
+    response = FakeStreamResponse()
+    monkeypatch.setattr(v1, "get_url", lambda url, stream=False: response)
+
+    packages = list(v1.stream_metadata_with_resources(chunk_size=7))
+
+    assert [package["name"] for package in packages][-1] == "package-49"
+    assert packages == json.loads(body)["result"]
+    assert response.closed
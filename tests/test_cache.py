@@ -0,0 +1,178 @@
+"""Tests for the API response cache."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from envidat.api import cache as api_cache
+from envidat.api.cache import DiskCache, HTTPCache, MemoryCache
+
+
+def make_response(status_code=200, body=b"", headers=None):
+    """Build a requests.Response for offline tests."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Replace the shared session, recording request headers."""
+
+    class FakeSession:
+        def __init__(self):
+            self.requests = []
+            self.responses = []
+
+        def get(self, url, headers=None):
+            self.requests.append(headers or {})
+            return self.responses.pop(0)
+
+    session = FakeSession()
+    monkeypatch.setattr(api_cache, "get_session", lambda: session)
+    return session
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    """Test least recently used entries are evicted over max_size."""
+    store = DiskCache(tmp_path, max_size=25)
+
+    store.set("a", b"0123456789", {})
+    store.set("b", b"0123456789", {})
+    # Use "a", so "b" is least recently used
+    past = time.time() - 100
+    os.utime(store._paths("b")[0], (past, past))
+    assert store.get("a")[0] == b"0123456789"
+
+    store.set("c", b"0123456789", {})
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert DiskCache(tmp_path, max_size=25)._size == 20
+
+
+def test_disk_cache_shared_directory(tmp_path):
+    """Test eviction counts entries written by another cache in the directory."""
+    store = DiskCache(tmp_path, max_size=25)
+    other = DiskCache(tmp_path, max_size=25)
+
+    store.set("a", b"0123456789", {})
+    past = time.time() - 100
+    os.utime(store._paths("a")[0], (past, past))
+    other.set("b", b"0123456789", {})
+    store.set("c", b"0123456789", {})
+    # Over max_size only counting the entries of store, and evicts "b" too
+    store.set("d", b"0123456789", {})
+
+    assert store.get("a") is None
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.body")) <= 25
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_http_cache_ttl(tmp_path, fake_session):
+    """Test fresh responses are served without a request."""
+    http_cache = HTTPCache(tmp_path, ttl=60)
+    fake_session.responses.append(make_response(body=b'{"result": 1}'))
+
+    assert http_cache.get_url("https://api/package_list").json() == {"result": 1}
+    response = http_cache.get_url("https://api/package_list")
+
+    assert response.json() == {"result": 1}
+    assert response.from_cache
+    assert len(fake_session.requests) == 1
+
+
+def test_http_cache_revalidation(tmp_path, fake_session):
+    """Test stale responses are revalidated with conditional headers."""
+    http_cache = HTTPCache(tmp_path, ttl=0)
+    fake_session.responses += [
+        make_response(body=b'{"result": 1}', headers={"ETag": '"v1"'}),
+        make_response(status_code=304),
+        make_response(body=b'{"result": 2}', headers={"ETag": '"v2"'}),
+    ]
+
+    http_cache.get_url("https://api/package_show?id=a")
+    assert http_cache.get_url("https://api/package_show?id=a").json() == {"result": 1}
+    assert http_cache.get_url("https://api/package_show?id=a").json() == {"result": 2}
+
+    assert fake_session.requests[1] == {"If-None-Match": '"v1"'}
+    assert fake_session.requests[2] == {"If-None-Match": '"v1"'}
+
+
+def test_http_cache_errors_not_stored(tmp_path, fake_session):
+    """Test error responses are returned but not cached."""
+    http_cache = HTTPCache(tmp_path)
+    fake_session.responses += [make_response(status_code=404), make_response()]
+
+    assert http_cache.get_url("https://api/package_show?id=x") is None
+    assert http_cache.get_url_response("https://api/package_show?id=x").ok
+    assert len(fake_session.requests) == 2
+
+
+def test_enable_http_cache(tmp_path):
+    """Test enabling and disabling the module level cache."""
+    enabled = api_cache.enable_http_cache(tmp_path)
+    assert api_cache.get_http_cache() is enabled
+
+    api_cache.disable_http_cache()
+    assert api_cache.get_http_cache() is None
+
+
+def test_memory_cache_ttl_and_lru(monkeypatch):
+    """Test entries expire after ttl and least recently used are evicted."""
+    now = [1000.0]
+    monkeypatch.setattr(api_cache.time, "monotonic", lambda: now[0])
+    memory_cache = MemoryCache(max_entries=2, ttl=10)
+
+    assert memory_cache.get("a", lambda: 1) == 1
+    assert memory_cache.get("b", lambda: 2) == 2
+    assert memory_cache.get("a", lambda: -1) == 1
+    memory_cache.get("c", lambda: 3)
+    assert memory_cache.peek("b") is None
+    assert memory_cache.peek("a") == 1
+
+    now[0] += 11
+    assert memory_cache.get("a", lambda: 4) == 4
+    assert memory_cache.stats == {"hits": 1, "misses": 4, "shared_loads": 0, "size": 2}
+
+
+def test_memory_cache_single_flight():
+    """Test concurrent gets for a missing key call the loader once."""
+    memory_cache = MemoryCache()
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return {"name": "a"}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(memory_cache.get, "a", loader) for _ in range(8)]
+        while memory_cache.stats["shared_loads"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_memory_cache_errors_not_stored():
+    """Test loader errors are raised and nothing is cached."""
+    memory_cache = MemoryCache()
+
+    def loader():
+        raise AttributeError("Failed")
+
+    with pytest.raises(AttributeError):
+        memory_cache.get("a", loader)
+    assert memory_cache.get("a", lambda: 1) == 1
@@ -1,13 +1,29 @@
 """Tests for package converters."""
 
+import codecs
+import gzip
+import io
+import json
 import os
 from collections import Counter, OrderedDict
 
+import pytest
 from xmltodict import parse, unparse
 
 from envidat.api.v1 import get_metadata_list_with_resources, get_package
-from envidat.converters.dcat_ap_converter import wrap_packages_dcat_ap_xml
-from envidat.utils import get_url
+from envidat.converters import datacite_converter, fields
+from envidat.converters.dcat_ap_converter import (
+    convert_dcat_ap,
+    dcat_ap_convert_dataset,
+    iter_dcat_ap_catalog,
+    wrap_packages_dcat_ap_xml,
+    write_dcat_ap_catalog,
+)
+from envidat.converters.doi_resolver import DOIResolver
+from envidat.converters.fields import ParsedRecord
+from envidat.metadata import Record
+from envidat.settings import Settings
+from envidat.utils import get_url, parse_date
 
 
 def get_ckan_exporter_endpoint(
@@ -471,3 +487,232 @@ def test_ris_converters_all_packages(ris_converter_all_packages):
     )
 
     assert ckan_packages == converter_packages
+
+
+def test_parsed_record_parses_once(monkeypatch, example_ckan_dict):
+    """Test each JSON field is decoded once when rendering a Record to all formats."""
+    record = Record(example_ckan_dict)
+    record.to_iso()
+
+    parsed_values = []
+    json_loads = json.loads
+
+    def counting_loads(value, *args, **kwargs):
+        parsed_values.append(value)
+        return json_loads(value, *args, **kwargs)
+
+    monkeypatch.setattr(fields.json, "loads", counting_loads)
+
+    record.to_iso()
+    record.to_dif()
+    record.to_ris()
+    record.to_bibtex()
+    record.to_dcat_ap()
+
+    assert example_ckan_dict["publication"] not in parsed_values
+    assert example_ckan_dict["maintainer"] not in parsed_values
+
+
+def test_parsed_record_errors_and_invalidation():
+    """Test parse errors are raised again and changed fields are parsed again."""
+    record = ParsedRecord(maintainer="not json", author='[{"name": "A"}]')
+
+    for _ in range(2):
+        with pytest.raises(json.JSONDecodeError):
+            record.json_field("maintainer")
+
+    record["maintainer"] = '{"name": "B"}'
+    assert record.json_field("maintainer") == {"name": "B"}
+    assert record.json_field("author") is record.json_field("author")
+    assert record.json_field("spatial", "{}") == {}
+
+
+def test_dcat_ap_streaming_writer(tmp_path, example_ckan_dict):
+    """Test the streamed DCAT-AP catalog is the same as converting a list."""
+    records = [dict(example_ckan_dict, name=f"package-{i}") for i in range(3)]
+    expected = convert_dcat_ap(records)
+
+    assert "".join(iter_dcat_ap_catalog(records)) == expected
+
+    path = tmp_path / "dcat-ap-ch.xml.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        assert write_dcat_ap_catalog(iter(records), f) == 3
+    with gzip.open(path, "rb") as f:
+        assert f.read() == expected.encode("utf-8")
+
+    # Binary io objects get bytes, other objects str unless binary is passed
+    with gzip.open(path, "wb") as f:
+        write_dcat_ap_catalog(records, f)
+    with gzip.open(path, "rb") as f:
+        assert f.read() == expected.encode("utf-8")
+
+    writer = codecs.getwriter("utf-8")(io.BytesIO())
+    write_dcat_ap_catalog(records, writer)
+    assert writer.stream.getvalue() == expected.encode("utf-8")
+
+    class ChunkWriter:
+        def __init__(self):
+            self.chunks = []
+
+        def write(self, chunk):
+            self.chunks.append(chunk)
+
+    writer = ChunkWriter()
+    write_dcat_ap_catalog(records, writer, encoding="utf-16", binary=True)
+    assert b"".join(writer.chunks).decode("utf-16") == expected
+
+
+def test_dcat_ap_wrap_xml_strings(example_ckan_dict):
+    """Test XML string datasets are inserted without changing their content."""
+    records = [dict(example_ckan_dict, name=f"package-{i}") for i in range(2)]
+    datasets_xml = [dcat_ap_convert_dataset(record, as_xml=True) for record in records]
+
+    wrapped_xml = wrap_packages_dcat_ap_xml(datasets_xml)
+
+    assert parse(wrapped_xml) == parse(convert_dcat_ap(records))
+    assert wrapped_xml.count("<?xml") == 1
+
+
+def test_datacite_config_loaded_once(monkeypatch, example_ckan_dict):
+    """Test the DataCite config is validated once, until reloaded."""
+    validated = []
+    monkeypatch.setattr(
+        datacite_converter, "validate_dc_config", lambda config: validated.append(1)
+    )
+    monkeypatch.setattr(datacite_converter, "get_dora_doi_string", lambda *args: None)
+    monkeypatch.setattr(
+        datacite_converter, "get_envidat_package_doi", lambda *args: None
+    )
+    config = datacite_converter.reload_config_datacite_converter()
+
+    for _ in range(3):
+        datacite_converter.convert_datacite(example_ckan_dict)
+
+    assert datacite_converter.get_config_datacite_converter() is config
+    assert len(validated) == 1
+
+    datacite_converter.reload_config_datacite_converter()
+    assert len(validated) == 2
+
+
+def test_doi_resolver_batched_and_cached(tmp_path, monkeypatch):
+    """Test related identifier URLs are resolved once, including missing DOIs."""
+    lookups = []
+
+    def fake_dora_doi_string(dora_pid):
+        lookups.append(dora_pid)
+        return {"wsl%3A1": "10.1000/dora.1"}.get(dora_pid)
+
+    def fake_envidat_package_doi(package_name):
+        lookups.append(package_name)
+        return {"alpine-lakes": "10.16904/envidat.1"}.get(package_name)
+
+    monkeypatch.setattr(datacite_converter, "_doi_resolver", None)
+    monkeypatch.setattr(
+        datacite_converter, "resolve_dora_doi_string", fake_dora_doi_string
+    )
+    monkeypatch.setattr(
+        datacite_converter, "resolve_envidat_package_doi", fake_envidat_package_doi
+    )
+    datacite_converter.enable_doi_cache(tmp_path)
+
+    dora_url = "https://www.dora.lib4ri.ch/wsl/islandora/object/wsl%3A1"
+    missing_url = "https://www.dora.lib4ri.ch/wsl/islandora/object/wsl%3A2"
+    envidat_url = "https://www.envidat.ch/#/metadata/alpine-lakes"
+    records = [
+        {"related_publications": f"{dora_url}\n{missing_url} 10.1000/direct"},
+        {
+            "related_publications": f"[link]({dora_url})",
+            "related_datasets": envidat_url,
+        },
+    ]
+
+    assert datacite_converter.prefetch_related_identifier_dois(records) == 3
+    assert sorted(lookups) == ["alpine-lakes", "wsl%3A1", "wsl%3A2"]
+
+    related = datacite_converter.get_dc_related_identifiers(
+        records[0]["related_publications"]
+    )
+    assert [identifier["#text"] for identifier in related] == [
+        "10.1000/dora.1",
+        "10.1000/direct",
+    ]
+    assert len(lookups) == 3
+
+    # Results are read from disk by a new resolver
+    monkeypatch.setattr(datacite_converter, "_doi_resolver", None)
+    datacite_converter.enable_doi_cache(tmp_path)
+    assert datacite_converter.prefetch_related_identifier_dois(records) == 3
+    assert len(lookups) == 3
+
+
+def test_doi_resolver_failure_not_cached(tmp_path, monkeypatch):
+    """Test a failed DOI lookup is resolved again, in memory and from disk."""
+
+    class FakeResponse:
+        def json(self):
+            return {"result": {"doi": "10.16904/envidat.1"}}
+
+    # Failed request first, as get_url returns None on errors
+    responses = [None, FakeResponse()]
+    monkeypatch.setattr(datacite_converter, "_doi_resolver", None)
+    monkeypatch.setattr(datacite_converter, "get_url", lambda url: responses.pop(0))
+    datacite_converter.enable_doi_cache(tmp_path)
+
+    envidat_url = "https://www.envidat.ch/#/metadata/alpine-lakes"
+    resolver = datacite_converter.get_doi_resolver()
+    assert resolver.resolve_words([envidat_url]) == {envidat_url: None}
+    assert resolver._results == {}
+    assert resolver.store.get("envidat:alpine-lakes") is None
+
+    assert resolver.resolve_words([envidat_url]) == {
+        envidat_url: "10.16904/envidat.1"
+    }
+    assert not responses
+
+
+def test_doi_resolver_max_entries():
+    """Test the least recently used results are removed from memory first."""
+    resolver = DOIResolver(max_entries=2)
+    resolver.register("upper", lambda word: word, lambda key: key.upper())
+
+    resolver.resolve_words(["a", "b"])
+    resolver.resolve_words(["a", "c"])
+
+    assert list(resolver._results) == ["upper:a", "upper:c"]
+
+
+def test_doi_cache_dir_from_settings(tmp_path, monkeypatch):
+    """Test the DOI cache directory is read from settings if omitted."""
+    monkeypatch.setattr(datacite_converter, "_doi_resolver", None)
+    monkeypatch.setattr(
+        datacite_converter,
+        "get_settings",
+        lambda: Settings({"DOI_CACHE_DIR": str(tmp_path / "doi")}),
+    )
+
+    resolver = datacite_converter.enable_doi_cache()
+
+    assert resolver.store.directory == tmp_path / "doi"
+
+
+def test_parse_date_matches_dateutil():
+    """Test dates parsed without dateutil give the same result as dateutil."""
+    from dateutil.parser import parse
+
+    date_strings = [
+        "2021-03-04",
+        "2021-03-04T05:06:07",
+        "2021-03-04T05:06:07.123456",
+        "2021-03-04 05:06:07",
+        "2021-03-04T05:06:07Z",
+        "2021-03-04T05:06:07+02:00",
+        "04.03.2021",
+        "March 4, 2021",
+    ]
+    for date_string in date_strings:
+        assert parse_date(date_string) == parse(date_string)
+
+    assert parse_date("2021-03-04") is parse_date("2021-03-04")
+    with pytest.raises(ValueError):
+        parse_date("not a date")
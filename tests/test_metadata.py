@@ -1,11 +1,24 @@
 """Tests for metadata Record."""
 
+import json
+import subprocess
+import sys
 from collections import Counter
 
 import pytest
 from xmltodict import parse
 
-from envidat.metadata import Record, get_all_metadata_record_list
+from envidat import converters
+from envidat.converters import fields, register_converter
+from envidat.converters.cache import disable_conversion_cache, enable_conversion_cache
+from envidat.metadata import (
+    Record,
+    convert_all_metadata_records,
+    get_all_metadata_record_list,
+    iter_conversion_results,
+    iter_metadata_records,
+)
+from envidat.validation import validate_records
 
 
 def test_record_init_from_json(example_ckan_json, metadata_keys):
@@ -119,3 +132,261 @@ def test_get_all_metadata_dcat_ap_formatted_xml():
 
     dataset_list = dcat_dict["rdf:RDF"]["dcat:Catalog"]["dcat:dataset"]
     assert len(dataset_list) > 500
+
+
+def test_record_render(monkeypatch, example_ckan_dict):
+    """Test rendering several formats at once, deriving shared values once."""
+    record = Record(example_ckan_dict)
+    formats = ["iso", "dif", "ris", "dcat-ap", "bibtex"]
+
+    keyword_calls = []
+    record_keywords = fields._keywords
+    monkeypatch.setattr(
+        fields,
+        "_keywords",
+        lambda record: keyword_calls.append(1) or record_keywords(record),
+    )
+
+    rendered = record.render(formats)
+    assert len(keyword_calls) == 1
+
+    assert list(rendered) == formats
+    assert rendered["iso"] == Record(example_ckan_dict, convert="iso").content
+    assert rendered["bibtex"] == Record(example_ckan_dict).to_bibtex()
+    assert isinstance(record.content, dict)
+
+    with pytest.raises(ValueError, match="unknown formats"):
+        record.render(["pdf"])
+
+
+def test_iter_metadata_records(example_ckan_dict):
+    """Test records are converted lazily, one package at a time."""
+    consumed = []
+
+    def packages():
+        for i in range(3):
+            consumed.append(i)
+            yield dict(example_ckan_dict, name=f"package-{i}")
+
+    records = iter_metadata_records(convert="ris", packages=packages())
+
+    name, output = next(records)
+    assert name == "package-0"
+    assert output.startswith("TY  - DATA")
+    assert consumed == [0]
+
+    assert [name for name, _ in records] == ["package-1", "package-2"]
+    name, record = next(iter_metadata_records(packages=[example_ckan_dict]))
+    assert isinstance(record, Record)
+
+
+def test_iter_metadata_records_parallel(example_ckan_dict):
+    """Test conversion in worker processes keeps input order."""
+    packages = [dict(example_ckan_dict, name=f"package-{i}") for i in range(7)]
+
+    records = list(
+        iter_metadata_records(
+            convert="bibtex", packages=packages, workers=2, chunksize=2
+        )
+    )
+
+    assert [name for name, _ in records] == [package["name"] for package in packages]
+    assert records[3][1] == Record(packages[3], convert="bibtex").content
+
+
+def test_iter_metadata_records_parallel_registered(monkeypatch, example_ckan_dict):
+    """Test converters registered in the parent are used in worker processes."""
+    monkeypatch.setitem(
+        converters._converters,
+        "citation",
+        "envidat.converters.bibtex_converter:convert_bibtex",
+    )
+    packages = [dict(example_ckan_dict, name=f"package-{i}") for i in range(3)]
+
+    records = list(
+        iter_metadata_records(convert="citation", packages=packages, workers=2)
+    )
+
+    assert records[1][1] == Record(packages[1], convert="bibtex").content
+
+
+def test_convert_all_metadata_records_isolates_errors(example_ckan_dict):
+    """Test a malformed entry is reported without stopping the conversion."""
+    packages = [
+        dict(example_ckan_dict, name="package-0"),
+        dict(example_ckan_dict, name="package-1", author="not json"),
+        dict(example_ckan_dict, name="package-2"),
+    ]
+
+    report = convert_all_metadata_records(convert="bibtex", packages=packages)
+
+    results = report["results"]
+    assert [result["name"] for result in results] == [
+        "package-0",
+        "package-1",
+        "package-2",
+    ]
+    assert results[0]["output"] == Record(packages[0], convert="bibtex").content
+    assert results[0]["error_type"] is None
+    assert results[1]["output"] is None
+    assert results[1]["error_type"] == "JSONDecodeError"
+    assert results[1]["error_message"]
+    assert all(result["seconds"] >= 0 for result in results)
+
+    summary = report["summary"]
+    assert summary["total"] == 3
+    assert summary["converted"] == 2
+    assert summary["failed"] == {"JSONDecodeError": ["package-1"]}
+
+
+def test_iter_conversion_results_parallel(example_ckan_dict):
+    """Test errors are reported from worker processes, in order."""
+    packages = [dict(example_ckan_dict, name=f"package-{i}") for i in range(5)]
+    packages[2]["author"] = "not json"
+
+    results = list(
+        iter_conversion_results(
+            convert="bibtex", packages=packages, workers=2, chunksize=2
+        )
+    )
+
+    assert [result["name"] for result in results] == [
+        package["name"] for package in packages
+    ]
+    assert [result["error_type"] for result in results] == [
+        None,
+        None,
+        "JSONDecodeError",
+        None,
+        None,
+    ]
+
+
+def test_record_conversion_cache(tmp_path, monkeypatch, example_ckan_dict):
+    """Test converted records are reused until metadata_modified changes."""
+    calls = []
+
+    def fake_convert_bibtex(record):
+        calls.append(record["metadata_modified"])
+        return f"bibtex {record['metadata_modified']}"
+
+    monkeypatch.setitem(converters._converters, "bibtex", fake_convert_bibtex)
+    enable_conversion_cache(tmp_path)
+    try:
+        first = Record(example_ckan_dict, convert="bibtex").content
+        second = Record(example_ckan_dict, convert="bibtex").content
+        assert first == second
+        assert len(calls) == 1
+
+        modified = dict(example_ckan_dict, metadata_modified="2030-01-01T00:00:00")
+        assert Record(modified, convert="bibtex").content == (
+            "bibtex 2030-01-01T00:00:00"
+        )
+        assert len(calls) == 2
+    finally:
+        disable_conversion_cache()
+
+    Record(example_ckan_dict, convert="bibtex")
+    assert len(calls) == 3
+
+
+def test_record_conversion_cache_compact(tmp_path, monkeypatch, example_ckan_dict):
+    """Test compact and full records are cached separately."""
+
+    def fake_convert_xml(record):
+        return f"xml {len(record['resources'][0])}"
+
+    monkeypatch.setitem(converters._converters, "xml", fake_convert_xml)
+    enable_conversion_cache(tmp_path)
+    try:
+        full = Record(example_ckan_dict, convert="xml").content
+        compact = Record(example_ckan_dict, convert="xml", compact=True).content
+        assert compact != full
+        assert Record(example_ckan_dict, convert="xml").content == full
+        assert Record(example_ckan_dict, convert="xml", compact=True).content == (
+            compact
+        )
+    finally:
+        disable_conversion_cache()
+
+
+def test_validate_records(example_ckan_dict):
+    """Test batch validation reports structural errors per record."""
+    broken_resource = dict(example_ckan_dict["resources"][0], created="")
+    records = [
+        example_ckan_dict,
+        dict(example_ckan_dict, name="bad-author", author="not json"),
+        dict(example_ckan_dict, name="bad-maintainer", maintainer='{"name": "A"}'),
+        dict(example_ckan_dict, name="bad-resource", resources=[broken_resource]),
+        {"name": "missing-fields"},
+    ]
+
+    report = validate_records(records)
+
+    assert [entry["valid"] for entry in report] == [True, False, False, False, False]
+    assert report[1]["errors"][0].startswith("Field 'author' is not valid JSON")
+    assert report[2]["errors"] == ["Maintainer has no email"]
+    assert report[3]["errors"] == ["Resource 0 has no created date"]
+    assert report[4]["errors"][0].startswith("Missing fields:")
+
+    record = Record(records[1])
+    with pytest.raises(ValueError, match="Content is not a valid metadata entry"):
+        record.validate(deep=True)
+
+
+def test_record_compact(example_ckan_dict):
+    """Test compact records convert the same, sharing repeated strings."""
+    formats = ("iso", "bibtex", "dif", "ris", "dcat-ap")
+    record = Record(example_ckan_dict)
+    compact = Record(dict(example_ckan_dict), compact=True)
+    other = Record(json.dumps(example_ckan_dict), compact=True)
+
+    assert compact.render(formats) == record.render(formats)
+    # Parsed values are not kept in compact mode
+    assert not compact.content._parsed and not compact.content._derived
+    assert record.content._parsed
+    assert set(compact.content["organization"]) == {"id", "name", "title"}
+    assert "cache_url" not in compact.content["resources"][0]
+    assert (
+        compact.content["resources"][0]["restricted"]
+        is other.content["resources"][0]["restricted"]
+    )
+
+
+def test_record_attributes(example_ckan_dict):
+    """Test attributes can be set on default and compact records."""
+    for compact in (False, True):
+        record = Record(example_ckan_dict, compact=compact)
+        record.source_name = "snapshot"
+        assert record.source_name == "snapshot"
+        assert record.compact is compact
+
+
+def test_register_converter(monkeypatch, example_ckan_dict):
+    """Test registered converters render by format name."""
+    monkeypatch.setattr(converters, "_converters", dict(converters._converters))
+    register_converter("title", lambda record: record["title"].upper())
+
+    record = Record(example_ckan_dict)
+
+    assert record.render(["title"]) == {"title": example_ckan_dict["title"].upper()}
+    assert Record(example_ckan_dict, convert="title").content == (
+        example_ckan_dict["title"].upper()
+    )
+    with pytest.raises(ValueError, match="Cannot render unknown formats"):
+        record.render(["unknown"])
+    with pytest.raises(ValueError, match="must be '<module>:<function>'"):
+        register_converter("path", "envidat.converters.bibtex_converter")
+
+
+def test_converters_imported_on_first_use():
+    """Test importing envidat.metadata does not import the converters."""
+    code = (
+        "import sys; import envidat.metadata; "
+        "print(any(name.endswith('_converter') for name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,68 @@
+"""Tests for the shared HTTP session."""
+
+import pytest
+
+from envidat import session as http_session
+from envidat.session import (
+    DEFAULT_TIMEOUT,
+    close_session,
+    configure_session,
+    get_session,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    """Restore the default session config after each test."""
+    yield
+    configure_session()
+
+
+def test_get_session_is_shared():
+    """Test the same session is reused between calls."""
+    assert get_session() is get_session()
+
+
+def test_configure_session_rebuilds():
+    """Test reconfiguring creates a new session with the new adapter config."""
+    old_session = get_session()
+
+    configure_session(pool_maxsize=5, max_retries=7, backoff_factor=2)
+    new_session = get_session()
+    assert new_session is not old_session
+
+    adapter = new_session.get_adapter("https://www.envidat.ch")
+    assert adapter._pool_maxsize == 5
+    assert adapter.max_retries.total == 7
+    assert adapter.max_retries.backoff_factor == 2
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_close_session():
+    """Test closing the session discards it."""
+    old_session = get_session()
+    close_session()
+
+    assert http_session._session is None
+    assert get_session() is not old_session
+
+
+def test_host_timeouts(monkeypatch):
+    """Test per-host timeouts are applied when no timeout is passed."""
+    configure_session(host_timeouts={"slow.example.com": 300})
+    session = get_session()
+
+    sent = {}
+
+    def fake_send(request, **kwargs):
+        sent[request.url] = kwargs.get("timeout")
+
+    monkeypatch.setattr(session, "send", fake_send)
+
+    session.get("https://slow.example.com/api")
+    session.get("https://www.envidat.ch/api")
+    session.get("https://www.envidat.ch/other", timeout=1)
+
+    assert sent["https://slow.example.com/api"] == 300
+    assert sent["https://www.envidat.ch/api"] == DEFAULT_TIMEOUT
+    assert sent["https://www.envidat.ch/other"] == 1
@@ -0,0 +1,49 @@
+"""Tests for settings from environment variables."""
+
+from envidat import settings as envidat_settings
+from envidat.api.v1 import get_protocol_and_domain
+from envidat.settings import Settings, get_settings, reload_settings
+
+
+def test_settings_from_environ():
+    """Test values are read and the API host is split once."""
+    settings = Settings({"API_HOST": "http://localhost:5000", "DOI_PREFIX": "10.16904"})
+
+    assert settings.api_protocol == "http"
+    assert settings.api_domain == "localhost:5000"
+    assert settings.doi_prefix == "10.16904"
+    assert settings.datacite_password is None
+    assert settings.aws_region == ""
+
+
+def test_get_settings_is_cached(monkeypatch):
+    """Test settings are read once, until reloaded."""
+    monkeypatch.setenv("API_HOST", "https://one.example.com")
+    settings = reload_settings()
+
+    monkeypatch.setenv("API_HOST", "https://two.example.com")
+    assert get_settings() is settings
+    assert get_protocol_and_domain() == ("https", "one.example.com")
+
+    monkeypatch.delenv("API_HOST")
+    reload_settings()
+    assert get_protocol_and_domain() == ("https", "www.envidat.ch")
+    assert envidat_settings._settings is get_settings()
+
+
+def test_bucket_config_from_settings(monkeypatch):
+    """Test Bucket reads credentials from settings, without reloading them."""
+    from envidat.s3.bucket import Bucket
+
+    monkeypatch.setattr(Bucket, "_AWS_ACCESS_KEY_ID", None)
+    monkeypatch.setattr(Bucket, "_AWS_SECRET_ACCESS_KEY", None)
+    monkeypatch.setattr(Bucket, "_AWS_ENDPOINT", None)
+    monkeypatch.setattr(Bucket, "_AWS_REGION", "")
+    settings = Settings({"AWS_ACCESS_KEY": "key", "AWS_SECRET_KEY": "secret"})
+    monkeypatch.setattr(envidat_settings, "_settings", settings)
+
+    bucket = Bucket("testing")
+
+    assert bucket.bucket_name == "testing"
+    assert Bucket._AWS_ACCESS_KEY_ID == "key"
+    assert get_settings() is settings
@@ -0,0 +1,118 @@
+"""Tests for the local catalogue snapshot."""
+
+import pytest
+
+from envidat.api.snapshot import CatalogueSnapshot, CatalogueSync
+from envidat.metadata import Record
+
+
+@pytest.fixture
+def snapshot_packages(example_ckan_dict):
+    """Packages with distinct names, ids and DOIs."""
+    packages = []
+    for i in range(5):
+        package = dict(example_ckan_dict)
+        package.update(name=f"package-{i}", id=f"id-{i}", doi=f"10.16904/EnviDat.{i}")
+        packages.append(package)
+    packages[2]["doi"] = ""
+    return packages
+
+
+def test_snapshot_lookup(tmp_path, snapshot_packages):
+    """Test lookup by name, id and case insensitive DOI from a reopened snapshot."""
+    path = tmp_path / "catalogue.jsonl"
+    CatalogueSnapshot.write(path, iter(snapshot_packages))
+
+    snapshot = CatalogueSnapshot(path)
+    assert len(snapshot) == 5
+    assert snapshot["package-3"] == snapshot_packages[3]
+    assert snapshot["id-4"]["name"] == "package-4"
+    assert snapshot["10.16904/envidat.1"]["name"] == "package-1"
+    assert snapshot.get("package-1", field="id") is None
+    assert "package-9" not in snapshot
+    with pytest.raises(KeyError):
+        snapshot["package-9"]
+
+    assert [package["name"] for package in snapshot] == snapshot.names()
+
+
+def test_snapshot_index_mismatch(tmp_path, snapshot_packages):
+    """Test a data file changed after indexing is detected."""
+    path = tmp_path / "catalogue.jsonl"
+    CatalogueSnapshot.write(path, snapshot_packages)
+    with open(path, "a") as f:
+        f.write("{}\n")
+
+    with pytest.raises(ValueError, match="does not match"):
+        CatalogueSnapshot(path).get("package-0")
+
+
+def test_record_from_snapshot(tmp_path, snapshot_packages):
+    """Test a Record is created from a snapshot without the API."""
+    path = tmp_path / "catalogue.jsonl"
+    CatalogueSnapshot.write(path, snapshot_packages)
+
+    record = Record.from_snapshot(path, "id-0")
+
+    assert record.content == snapshot_packages[0]
+
+
+def test_catalogue_sync(monkeypatch, tmp_path):
+    """Test full then incremental sync, including updates and deletions."""
+    catalogue = {
+        "a": {"id": "1", "name": "a", "metadata_modified": "2023-01-01T10:00:00.1"},
+        "b": {"id": "2", "name": "b", "metadata_modified": "2023-01-02T10:00:00.1"},
+    }
+    searches = []
+
+    def fake_iter_metadata_with_resources(**kwargs):
+        yield from list(catalogue.values())
+
+    def fake_iter_package_search(fq="", **kwargs):
+        searches.append(fq)
+        since = fq.partition("[")[2].partition(" TO")[0].rstrip("Z")
+        for package in catalogue.values():
+            if package["metadata_modified"][:19] >= since:
+                yield package
+
+    monkeypatch.setattr(
+        "envidat.api.snapshot.iter_metadata_with_resources",
+        fake_iter_metadata_with_resources,
+    )
+    monkeypatch.setattr(
+        "envidat.api.snapshot.iter_package_search", fake_iter_package_search
+    )
+
+    def fake_get_metadata_list(use_cache=True, **kwargs):
+        # A cached package list may be out of date
+        assert not use_cache
+        return list(catalogue)
+
+    monkeypatch.setattr(
+        "envidat.api.snapshot.get_metadata_list", fake_get_metadata_list
+    )
+
+    snapshot_path = tmp_path / "catalogue.jsonl"
+    sync = CatalogueSync(snapshot_path)
+    changes = sync.sync()
+
+    assert changes == {"updated": ["a", "b"], "deleted": []}
+    assert sync.high_water_mark == "2023-01-02T10:00:00.1"
+    assert not searches
+
+    # Modify one package and delete another
+    catalogue["a"] = dict(catalogue["a"], metadata_modified="2023-01-03T10:00:00.1")
+    catalogue.pop("b")
+
+    sync = CatalogueSync(snapshot_path)
+    changes = sync.sync()
+
+    assert searches == ["metadata_modified:[2023-01-02T10:00:00Z TO *]"]
+    assert changes == {"updated": ["a"], "deleted": ["b"]}
+    assert list(sync.packages) == ["a"]
+    sync = CatalogueSync(snapshot_path)
+    assert sync.high_water_mark == "2023-01-03T10:00:00.1"
+
+    # The synced catalogue is a snapshot
+    assert sync.snapshot["1"]["name"] == "a"
+    assert CatalogueSnapshot(snapshot_path).names() == ["a"]
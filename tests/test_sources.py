@@ -0,0 +1,64 @@
+"""Tests for package sources of Records."""
+
+import pytest
+
+from envidat.api import sources
+from envidat.api.snapshot import CatalogueSnapshot
+from envidat.api.sources import (
+    DictSource,
+    RecordSource,
+    SnapshotSource,
+    get_record_source,
+    set_record_source,
+)
+from envidat.metadata import Record
+
+
+@pytest.fixture
+def packages(example_ckan_dict):
+    """Packages with distinct names and ids."""
+    return [
+        dict(example_ckan_dict, name=f"package-{i}", id=f"id-{i}") for i in range(3)
+    ]
+
+
+def test_record_from_dict_source(packages):
+    """Test Records are created by name or id without API calls."""
+    source = DictSource(packages)
+
+    assert Record("package-1", source=source).content["id"] == "id-1"
+    assert Record("id-2", source=source).content["name"] == "package-2"
+    with pytest.raises(KeyError, match="Package not found in record source"):
+        Record("missing", source=source)
+
+
+def test_snapshot_source_warm_up(tmp_path, monkeypatch, packages):
+    """Test warm up reads the snapshot once, then looks up in memory."""
+    snapshot = CatalogueSnapshot.write(tmp_path / "catalogue.jsonl", packages)
+    source = SnapshotSource(snapshot)
+    assert source.get("id-0")["name"] == "package-0"
+
+    assert source.warm_up() == 3
+
+    monkeypatch.setattr(snapshot, "get", pytest.fail)
+    assert Record("package-2", source=source).content["id"] == "id-2"
+
+
+def test_default_record_source(monkeypatch, packages):
+    """Test the default source is used for Records created by name."""
+    monkeypatch.setattr(sources, "_record_source", None)
+    assert isinstance(get_record_source(), sources.APISource)
+
+    set_record_source(DictSource({"package-0": packages[0]}))
+    assert Record("package-0").content["id"] == "id-0"
+
+
+def test_record_source_incomplete_subclass():
+    """Test a source without _iter_all cannot be created."""
+
+    class NameSource(RecordSource):
+        def _load(self, key):
+            return {"name": key}
+
+    with pytest.raises(TypeError):
+        NameSource()